@@ -2,843 +2,79 @@
 """
 全30日分のJSONに日本語訳を追加するスクリプト
 
+translations/dayN.json の訳（手書きの訳と translate.py が生成した訳）を content/dayN.json にマージします。
+訳のファイルは対象の日の分だけを読むので、--days 5 なら Day 5 のファイルしか開きません。
+
+訳がないフィールド（足りない会話のセリフなど）は、すべての文が翻訳メモリ
+（translations/memory.jsonl）にあれば、そこから埋めます。メモリを開くのは訳が足りない日があるときだけで、
+その日の訳の文はメモリに追加します（訳がそろっている日だけなら memory.jsonl は読みも書きもしません）。
+
+マージした結果がディスク上のファイルと1バイトも違わない日は書き込みません（更新日時が変わらないので、
+build_html.py などの差分ビルドがその日を作り直さずに済みます）。書き込むときは一時ファイル経由です。
+
 使い方:
   python add_translations.py
+  python add_translations.py --days 5
 """
 
+import argparse
 import json
 import os
 
-TRANSLATIONS = {
-    1: {
-        "intro_ja": "餃子は小さな日本の包み料理です。中にお肉と野菜が入っています。",
-        "steps_ja": [
-            "キャベツをとても小さく切ります。",
-            "豚肉、キャベツ、にんにく、しょうが、しょうゆ、ごま油、塩、こしょうを大きなボウルで混ぜます。",
-            "それぞれの餃子の皮に少しのお肉をのせます。",
-            "皮を半分に折って、ふちを押し合わせます。",
-            "フライパンに油を熱し、餃子をフライパンに入れます。",
-            "少し水を加え、ふたをして5分間焼きます。できあがり！",
-        ],
-        "review_ja": "先週の日曜日にOcean Breeze Dumpling Cafeに行きました。マンリービーチの近くにありました。テラスに座って美しい海を見ました。風は暖かくて気持ちよかったです。餃子を食べたらとてもおいしかったです。皮はパリパリで、お肉はジューシーでした。テーブルにはピンクと黄色の花がありました。とても居心地のいい幸せな場所でした。",
-        "conv_ja": [
-            "こんにちは、エマ！今夜、餃子を作るよ。手伝ってくれる？",
-            "もちろん！餃子大好き。何が必要？",
-            "豚肉、キャベツ、にんにく、餃子の皮が必要だよ。",
-            "わかった。キャベツを切れるよ。どのくらい小さく？",
-            "とても小さく、お願い。こんな感じで。",
-            "了解！次は何をするの？",
-            "豚肉と野菜を一緒に混ぜるよ。",
-            "ひとつ折ってみてもいい？",
-            "もちろん！ここに少しお肉をのせて。それからこうやって折るの。",
-            "あ、簡単じゃないね！でも楽しい。",
-            "上手だよ！じゃあフライパンで焼くね。",
-            "わぁ、すごくいい匂い！今ひとつ食べていい？",
-        ],
-    },
-    2: {
-        "intro_ja": "シュウマイは小さな中華風の蒸し餃子です。中に豚肉と玉ねぎが入っています。",
-        "steps_ja": [
-            "豚肉と玉ねぎをとても小さく切ります。",
-            "豚肉、玉ねぎ、しょうゆ、ごま油、塩、こしょうをボウルで混ぜます。",
-            "それぞれのシュウマイの皮に少しのお肉をのせます。",
-            "皮をお肉のまわりに巻きます。上を開けておきます。",
-            "蒸し器に水を入れて沸かします。",
-            "シュウマイを蒸し器に入れて10分間蒸します。できあがり！",
-        ],
-        "review_ja": "先週の金曜日にFern Valley Dumpling Houseに行きました。ブリスベンのSouth Bankの静かな通りにありました。中にシダ植物がたくさんありました。とても緑が多くて涼しかったです。シュウマイとお茶を注文しました。シュウマイはやわらかくて温かかったです。お肉はジューシーで、皮は薄かったです。テーブルの上に小さな黄色い花がありました。とても素敵なお店でした。",
-        "conv_ja": [
-            "こんにちは！何を作っているの？",
-            "シュウマイを作っているよ！日本の蒸し餃子だよ。",
-            "おいしそう！中には何が入っているの？",
-            "豚肉と玉ねぎ。それから少しのしょうゆとごま油。",
-            "どうやって作るの？",
-            "まず、お肉をこの皮にのせるの。それからまわりに巻くよ。",
-            "やってみてもいい？",
-            "もちろん！こうやってね。上は開けたままにしてね。",
-            "こんな感じ？",
-            "うん、上手！次は蒸すよ。",
-            "いい匂い！待ちきれないよ。",
-            "ほら、できたよ！食べてみて。",
-        ],
-    },
-    3: {
-        "intro_ja": "唐揚げは日本のフライドチキンです。外はカリカリで中はジューシーです。",
-        "steps_ja": [
-            "鶏もも肉を小さく切ります。",
-            "しょうゆ、にんにく、しょうが、酒をボウルで混ぜます。",
-            "鶏肉をたれに入れて20分間つけます。",
-            "鶏肉に片栗粉をまぶします。",
-            "油を深い鍋で180度に熱します。",
-            "鶏肉をきつね色になるまで4〜5分揚げます。できあがり！",
-        ],
-        "review_ja": "土曜日にBotanical Garden Kitchenに行きました。シドニーの植物園の近くにありました。テーブルのまわりには緑の植物がたくさんありました。唐揚げとサラダを注文しました。チキンはとてもカリカリで、中はジューシーでした。レモンを絞ったらさらにおいしくなりました。窓の近くにピンクの花がありました。とても素敵なランチでした。",
-        "conv_ja": [
-            "いい匂い！何を料理しているの？",
-            "唐揚げを作っているよ。日本のフライドチキンだよ。",
-            "普通のフライドチキンと何が違うの？",
-            "しょうゆとしょうがを使うの。それから片栗粉もね。",
-            "片栗粉って何？",
-            "日本のでんぷんの粉だよ。鶏肉がカリカリになるの。",
-            "わぁ、おいしそう。手伝ってもいい？",
-            "うん！鶏肉に粉をまぶしてくれる？",
-            "いいよ。こんな感じ？",
-            "完璧！次は揚げるよ。気をつけてね、油が熱いよ。",
-            "きつね色になってきた！おいしそう！",
-            "できたよ！レモンを絞って食べてね。",
-        ],
-    },
-    4: {
-        "intro_ja": "チキン南蛮は宮崎の有名な料理です。揚げた鶏肉に甘酢だれとタルタルソースがかかっています。",
-        "steps_ja": [
-            "鶏もも肉に塩とこしょうをふります。",
-            "鶏肉に小麦粉、そして溶き卵をつけます。",
-            "油を鍋で170度に熱し、鶏肉を4分間揚げます。",
-            "しょうゆ、酢、砂糖を小さい鍋で混ぜて甘酢だれを作ります。",
-            "揚げた鶏肉を甘酢だれにつけます。",
-            "タルタルソースをかけてキャベツと一緒に盛り付けます。できあがり！",
-        ],
-        "review_ja": "先週の日曜日にGolden Wattle Cafeに行きました。パースのFremantle Marketの近くにありました。カフェの前にはゴールデンワトルの花がありました。チキン南蛮を注文しました。鶏肉はカリカリで、甘酢だれはすごくおいしかったです。タルタルソースはクリーミーでした。白い壁にカラフルな絵が飾ってありました。とても幸せなランチでした。",
-        "conv_ja": [
-            "今夜、特別な料理を作るよ。チキン南蛮！",
-            "チキン南蛮？それは何？",
-            "揚げた鶏肉に甘酢だれとタルタルソースをかけた料理だよ。",
-            "おいしそう！手伝えることある？",
-            "うん！タルタルソースを作ってくれる？",
-            "わかった。何が必要？",
-            "マヨネーズ、ゆで卵、玉ねぎ、レモン汁だよ。",
-            "卵はどうすればいい？",
-            "小さく切ってね。玉ねぎもとても小さく切って。",
-            "できた！こんな感じでいい？",
-            "完璧！じゃあ鶏肉を揚げるね。",
-            "わぁ、いい匂い！もう食べたい！",
-        ],
-    },
-    5: {
-        "intro_ja": "油淋鶏は中華風の揚げ鶏です。甘酸っぱいネギだれがかかっています。",
-        "steps_ja": [
-            "鶏もも肉に塩とこしょうをふります。",
-            "鶏肉に片栗粉をまぶします。",
-            "油を鍋で170度に熱し、鶏肉をきつね色になるまで揚げます。",
-            "長ネギ、しょうゆ、酢、砂糖、ごま油を小さいボウルで混ぜてたれを作ります。",
-            "揚げた鶏肉を切って皿に盛ります。",
-            "ネギだれをたっぷりかけます。できあがり！",
-        ],
-        "review_ja": "木曜日の夜にStarlight Terrace Kitchenに行きました。ダーリングハーバーにありました。テラスからきれいな夜景が見えました。油淋鶏を注文しました。鶏肉はカリカリで、ネギだれはさっぱりしていてとてもおいしかったです。テーブルにジャスミンの花がありました。星がきれいな素敵な夜でした。",
-        "conv_ja": [
-            "今夜は油淋鶏を作るよ！",
-            "ユーリンチー？何それ？",
-            "揚げた鶏肉にネギの甘酸っぱいたれをかけた料理だよ。",
-            "おいしそう！難しくないの？",
-            "ぜんぜん！鶏肉を揚げてたれをかけるだけ。",
-            "たれは何で作るの？",
-            "長ネギ、しょうゆ、お酢、砂糖、ごま油だよ。",
-            "わたしがたれを作ろうか？",
-            "ありがとう！ネギを細かく切ってくれる？",
-            "いいよ。あ、目が痛い！",
-            "大丈夫？水で洗ってね。",
-            "大丈夫！おいしいもののためなら頑張れるよ！",
-        ],
-    },
-    6: {
-        "intro_ja": "角煮は日本の豚の角煮です。豚バラ肉を甘辛いたれでゆっくり煮込んだ料理です。",
-        "steps_ja": [
-            "豚バラ肉を大きめに切ります。",
-            "鍋で水を沸かし、豚肉を10分間ゆでます。取り出して水で洗います。",
-            "鍋に豚肉、水、しょうゆ、砂糖、酒、しょうがを入れます。",
-            "沸騰したら弱火にしてふたをします。",
-            "1時間半、お肉がやわらかくなるまで煮ます。",
-            "からしをつけてお皿に盛ります。できあがり！",
-        ],
-        "review_ja": "先週の日曜日にRiver Blossom Kitchenに行きました。メルボルンのYarraリバー沿いにありました。窓から川と桜のような花が見えました。角煮を注文しました。お肉はとてもやわらかくて口の中でとろけました。たれは甘くて濃厚でした。あたたかくて居心地のいい場所でした。",
-        "conv_ja": [
-            "何を料理しているの？すごくいい匂い！",
-            "角煮を作っているよ。日本の豚の煮込みだよ。",
-            "いい匂い！長くかかる？",
-            "うん、1時間半くらいかかるよ。でもほとんど待つだけ。",
-            "どうやって作るの？",
-            "まず豚肉をゆでて、それからしょうゆと砂糖で煮るんだ。",
-            "簡単そうだね。",
-            "そうだよ。ゆっくり煮るとお肉がとてもやわらかくなるの。",
-            "楽しみ！もう少しで出来上がり？",
-            "あと30分だよ。ちょっと味見してみる？",
-            "うん、お願い！…わぁ、おいしい！お肉がやわらかい！",
-            "うれしい！もう少し待ってね。",
-        ],
-    },
-    7: {
-        "intro_ja": "チャーハンは日本風の炒飯です。ご飯を野菜や卵と一緒に炒めた料理です。",
-        "steps_ja": [
-            "卵を割ってボウルで混ぜます。",
-            "ハム、長ネギ、にんじんを小さく切ります。",
-            "フライパンに油を熱して卵を炒めます。",
-            "ご飯を入れて強火で炒めます。",
-            "ハム、長ネギ、にんじんを加えて一緒に炒めます。",
-            "しょうゆ、塩、こしょうで味付けします。できあがり！",
-        ],
-        "review_ja": "金曜日のランチにSakura Wok Kitchenに行きました。シドニーのChippendale にありました。お店の中は明るくてモダンでした。チャーハンを注文しました。ご飯はパラパラで卵はふわふわでした。テーブルに小さなピンクの花がありました。また来たいと思いました。",
-        "conv_ja": [
-            "チャーハンを作ってみたいの。教えてくれる？",
-            "もちろん！まず冷やご飯が必要だよ。",
-            "冷やご飯？温かいのじゃだめ？",
-            "冷やご飯の方がパラパラに炒められるの。",
-            "なるほど！他に何が必要？",
-            "卵、ハム、長ネギ、にんじんだよ。",
-            "わかった。まず何をする？",
-            "まず卵を炒めて、それからご飯を入れるよ。",
-            "強火で炒めるの？",
-            "そう！強火で手早く炒めるのがコツだよ。",
-            "いい匂い！おいしそう！",
-            "しょうゆで味付けして完成！食べてみて！",
-        ],
-    },
-    8: {
-        "intro_ja": "ラーメンは日本で人気の麺料理です。スープの中に麺とトッピングが入っています。",
-        "steps_ja": [
-            "鶏がらスープ、しょうゆ、みりんを鍋で混ぜてスープを作ります。",
-            "大きな鍋でお湯を沸かし、ラーメンの麺をゆでます。",
-            "ゆで卵を半分に切ります。",
-            "長ネギを小さく切ります。",
-            "麺を丼に入れ、温かいスープを注ぎます。",
-            "チャーシュー、卵、長ネギ、のりをのせます。できあがり！",
-        ],
-        "review_ja": "土曜日の夜にMidnight Noodle Barに行きました。メルボルンのCBDの小さな路地にありました。お店は小さくて居心地がよかったです。豚骨ラーメンを注文しました。スープは濃厚でクリーミーでした。麺はちょうどいい硬さでした。カウンターに座って料理人がラーメンを作るのを見ました。とてもおいしかったです。",
-        "conv_ja": [
-            "お腹すいた！どこか食べに行かない？",
-            "ラーメン屋さんに行こうよ！",
-            "いいね！ラーメンって何？",
-            "日本の麺料理だよ。スープの中に麺が入っているの。",
-            "どんな種類があるの？",
-            "しょうゆ、みそ、豚骨があるよ。豚骨がおすすめ！",
-            "豚骨って何？",
-            "豚の骨から作ったスープだよ。濃厚でクリーミーなの。",
-            "おいしそう！トッピングは何がある？",
-            "チャーシュー、卵、ネギ、のりがあるよ。",
-            "全部のせてもいい？",
-            "もちろん！たくさんのせた方がおいしいよ！",
-        ],
-    },
-    9: {
-        "intro_ja": "おにぎりは日本のライスボールです。ご飯を三角形に握って、のりで巻きます。",
-        "steps_ja": [
-            "ご飯を炊いて少し冷まします。",
-            "手を水でぬらして塩をつけます。",
-            "ご飯を手にのせて真ん中に具をのせます。",
-            "三角形に握ります。",
-            "のりを三角形のまわりに巻きます。",
-            "お弁当箱やお皿に並べます。できあがり！",
-        ],
-        "review_ja": "日曜日にBeachside Rice Cafeに行きました。ボンダイビーチの近くにありました。テラスに座って海を見ました。おにぎりセットを注文しました。ご飯はあたたかくてふわふわでした。鮭の具がとてもおいしかったです。のりの香りも良かったです。海の風が気持ちよくて素敵な朝でした。",
-        "conv_ja": [
-            "明日ピクニックに行こうよ！",
-            "いいね！何を持っていく？",
-            "おにぎりを作るよ！日本のライスボールだよ。",
-            "どうやって作るの？",
-            "ご飯を三角形に握るの。中に具を入れるよ。",
-            "どんな具を入れるの？",
-            "鮭、ツナ、梅干しが人気だよ。",
-            "わたしはツナがいいな！",
-            "いいね！ツナマヨおにぎりを作ろう。",
-            "ありがとう！のりも巻くの？",
-            "うん！のりを巻くとおいしいよ。",
-            "楽しみ！明日が待ちきれないね。",
-        ],
-    },
-    10: {
-        "intro_ja": "味噌汁は日本の伝統的なスープです。味噌、豆腐、わかめで作ります。",
-        "steps_ja": [
-            "豆腐を小さな四角に切ります。",
-            "わかめを水でもどします。",
-            "鍋に水とだしの素を入れて沸かします。",
-            "豆腐とわかめを入れて2分煮ます。",
-            "火を弱めて味噌を溶かし入れます。沸騰させないでください。",
-            "お椀に盛り、ネギをのせます。できあがり！",
-        ],
-        "review_ja": "先週の日曜日にOcean Mist Tea Houseに行きました。マンリービーチの近くにありました。海に沈む夕日が見えました。空がピンクとラベンダー色になりました。とてもきれいでした。味噌汁付きのご飯セットを注文しました。スープはあたたかくて、ほっとする味でした。木のテーブルとやさしい音楽があるカフェでした。ドアの近くにジャスミンの花が咲いていました。オーストラリアで一番好きな夕べでした。",
-        "conv_ja": [
-            "おはよう！何を作っているの？",
-            "おはよう！味噌汁を作っているよ。",
-            "味噌汁？朝ごはんに？",
-            "うん！日本では毎朝味噌汁を飲むんだよ。",
-            "面白いね。中には何が入っているの？",
-            "豆腐、わかめ、味噌だよ。",
-            "作るのは難しい？",
-            "ぜんぜん。とても簡単で、10分しかかからないよ。",
-            "本当に？少し飲んでみてもいい？",
-            "もちろん！はい、飲んでみて。",
-            "あ、あたたかくていいね。気に入った！",
-            "よかった！体にもいいんだよ。",
-        ],
-    },
-    11: {
-        "intro_ja": "卵焼きは甘い日本の巻き卵です。お弁当の定番おかずです。",
-        "steps_ja": [
-            "卵を4つボウルに割り入れます。",
-            "砂糖、しょうゆ、みりん、少しの塩を卵に加えます。",
-            "箸でよく混ぜます。",
-            "卵焼き器に少しの油を熱します。",
-            "薄く卵液を流し入れ、端に巻いていきます。",
-            "また卵液を流して巻く、を3〜4回繰り返します。できあがり！",
-        ],
-        "review_ja": "先週の土曜日にMimosa Garden Kitchenに行きました。パディントンの静かな通りにありました。庭にはたくさんの黄色いミモザの花がありました。木の下の小さなテーブルに座りました。卵焼きとサラダを食べました。卵はやわらかくて甘かったです。庭は居心地がよくてとてもきれいでした。幸せでリラックスした気分になりました。",
-        "conv_ja": [
-            "リアム、わたしのお弁当見て！",
-            "わぁ、きれいだね！黄色いのは何？",
-            "卵焼きだよ。日本の巻き卵なの。",
-            "巻き卵？どうやって作るの？",
-            "卵に砂糖としょうゆを混ぜて、フライパンで焼くの。",
-            "甘いの？しょっぱいの？",
-            "ちょっと甘くてちょっとしょっぱいよ。",
-            "面白そうだね。ひとつ食べてみてもいい？",
-            "もちろん！はい、どうぞ。",
-            "うーん！やわらかくておいしい。好き！",
-            "ありがとう！毎朝お弁当用に作っているの。",
-            "カフェで売ったらいいよ！みんな好きになると思う。",
-        ],
-    },
-    12: {
-        "intro_ja": "照り焼きチキンは日本で人気の料理です。鶏肉に甘くてつやのあるたれがかかっています。",
-        "steps_ja": [
-            "鶏もも肉を大きめに切ります。",
-            "フライパンに油を熱します。",
-            "鶏肉を皮面を下にしてフライパンに入れ、5分間焼きます。",
-            "鶏肉をひっくり返してさらに3分焼きます。",
-            "しょうゆ、みりん、砂糖をフライパンに加えます。",
-            "たれにとろみがつくまで煮詰めます。できあがり！",
-        ],
-        "review_ja": "先週の金曜日の夜にThe Rooftop Jasmineに行きました。カンガルーポイントのビルの屋上にありました。屋上から街の明かりと川が見えました。あちこちにジャスミンの花があって、いい香りでした。照り焼きチキンとご飯を注文しました。たれは甘くて、鶏肉はとてもやわらかかったです。夜は暖かくて、ピンクの照明がロマンチックな雰囲気でした。",
-        "conv_ja": [
-            "ソフィー、今日のお昼は何を持ってきたの？",
-            "サンドイッチだけ。あなたは？",
-            "照り焼きチキンとご飯を作ったよ。",
-            "あ、照り焼き大好き！たれも自分で作ったの？",
-            "うん！しょうゆ、みりん、砂糖を使ったよ。",
-            "すごくいい匂い。作るの難しい？",
-            "ぜんぜん。鶏肉を焼いてたれを加えるだけだよ。",
-            "どのくらい時間かかるの？",
-            "15分くらいだよ。",
-            "早いね！今度教えて！",
-            "もちろん！今週末一緒に料理しよう！",
-            "やった！わたしが鶏肉を買うね。たれはお願い。",
-        ],
-    },
-    13: {
-        "intro_ja": "日本のカレーはとろっとしたあたたかい料理です。日本人の多くがカレーライスを大好きです。",
-        "steps_ja": [
-            "お肉、じゃがいも、にんじん、玉ねぎを小さく切ります。",
-            "大きな鍋に油を熱します。",
-            "玉ねぎがやわらかくなるまで炒めます。",
-            "お肉、じゃがいも、にんじんを加えて3分炒めます。",
-            "鍋に水を入れて20分煮ます。",
-            "カレールーを加えてとろみがつくまで混ぜます。できあがり！",
-        ],
-        "review_ja": "晴れた日曜日にLavender Hill Cafeに行きました。クージービーチの近くにありました。壁がやさしいラベンダー色に塗られていました。窓際に座って波を見ました。カレーライスを食べました。とろっとしていてとてもあたたかかったです。小さくて居心地のいいカフェでした。やさしい音楽が流れていました。一日中そこにいたかったです。",
-        "conv_ja": [
-            "ミア、今夜カレーを作りたいの。材料探すの手伝って！",
-            "いいよ！何が必要？",
-            "じゃがいも、にんじん、玉ねぎ、牛肉が必要だよ。",
-            "わかった、野菜はあっちだね。じゃがいもはいくつ？",
-            "大きいの2つお願い。にんじんは3本。",
-            "了解。牛肉はどこ？",
-            "お店の奥の方だよ。角切りの牛肉が必要。",
-            "カレーのソースは？",
-            "カレールーが必要だよ。アジア食品コーナーにあるの。",
-            "見つけた！これ？",
-            "そう、それそれ。ありがとう！",
-            "カレーっていい匂いだよね。夕ごはんが楽しみ！",
-        ],
-    },
-    14: {
-        "intro_ja": "お好み焼きは日本のお好み焼きです。キャベツ、お肉、おいしいソースがのっています。",
-        "steps_ja": [
-            "小麦粉、卵、水をボウルで混ぜて生地を作ります。",
-            "キャベツを細切りにして生地に加えます。",
-            "フライパンに油を熱します。",
-            "生地をフライパンに流して丸い形にします。",
-            "豚肉を上にのせて4分焼きます。それからひっくり返します。",
-            "さらに4分焼いて、ソース、マヨネーズ、かつお節をのせます。できあがり！",
-        ],
-        "review_ja": "先週末にPink Blossom Terraceに行きました。バルモラルビーチ近くの小さなレストランでした。テラスにはピンクの花と白い椅子がありました。テーブルから穏やかな青い海が見えました。お好み焼きと緑茶を注文しました。あつあつでカリカリでした。ソースとマヨネーズの組み合わせが最高でした。きれいで静かな場所でした。たくさん写真を撮りました。",
-        "conv_ja": [
-            "ジャック、今夜お好み焼きを作るよ。日本のパンケーキだよ。",
-            "パンケーキ？甘いの？",
-            "ううん、甘くないよ。塩味なの。中にキャベツと豚肉が入っているよ。",
-            "面白い！最初に何をするの？",
-            "まずキャベツを細く切ってね。",
-            "こんな感じ？これで十分薄い？",
-            "うん、いい感じ！じゃあ生地と混ぜて。",
-            "わかった。フライパンで焼いてもいい？",
-            "もちろん！丸い形にして。豚肉を上にのせてね。",
-            "いつひっくり返すの？",
-            "4分後だよ。重いから気をつけて。",
-            "できた！きれいにできた！",
-            "じゃあソースとマヨネーズをかけてね。",
-            "すごく楽しい。めっちゃいい匂い！",
-        ],
-    },
-    15: {
-        "intro_ja": "たこ焼きは大阪の小さな丸いボールです。中にタコが入っていて、外はカリカリです。",
-        "steps_ja": [
-            "小麦粉、卵、水、だしの素をボウルで混ぜて生地を作ります。",
-            "タコ、ネギ、紅しょうがを小さく切ります。",
-            "たこ焼き器に油を熱し、それぞれの穴に生地を流します。",
-            "タコとネギをそれぞれの穴に入れます。",
-            "底が焼けたら竹串でひとつずつ返します。",
-            "丸くきつね色になるまで焼きます。ソース、マヨネーズ、かつお節をのせます。できあがり！",
-        ],
-        "review_ja": "木曜日にSunset Bay Kitchenに行きました。ウーロンガバーにある楽しい小さなレストランでした。中はあたたかくてカラフルでした。壁に黄色やピンクのライトがありました。たこ焼きと冷たい飲み物を注文しました。たこ焼きは外がカリカリで中がアツアツでした。中のタコはやわらかかったです。スタッフはとてもフレンドリーでした。心地よいソファに座って食事を楽しみました。素敵な夕べでした。",
-        "conv_ja": [
-            "オリビア、たこ焼き食べたことある？",
-            "ないよ。何それ？",
-            "中にタコが入った小さな丸いボールだよ。大阪のなの。",
-            "タコ？楽しそう！どうやって作るの？",
-            "この特別な鉄板に生地を流すの。小さな穴が見える？",
-            "うん！かわいいね。何を入れるの？",
-            "タコをひとつとネギをそれぞれの穴に入れてね。",
-            "できた。次はどうするの？",
-            "待って。底が焼けたらこの竹串で返すの。",
-            "あ、返すの難しい！でもやってみる。",
-            "できた！見て、きれいな丸だよ！",
-            "わぁ、すごい！もう食べていい？",
-            "うん！でも気をつけてね。中がすごくアツいから。",
-            "うーん！カリカリでおいしい。たこ焼き大好き！",
-        ],
-    },
-    16: {
-        "intro_ja": "肉じゃがは日本のお肉とじゃがいもの煮物です。甘くてあたたかい、寒い日にぴったりの料理です。",
-        "steps_ja": [
-            "じゃがいもとにんじんを大きめに切ります。",
-            "玉ねぎを薄く切ります。",
-            "大きな鍋に油を熱し、牛肉を炒めます。",
-            "玉ねぎ、じゃがいも、にんじんを鍋に加えます。",
-            "水、しょうゆ、砂糖、みりんを鍋に入れます。",
-            "弱火で20分、やわらかくなるまで煮ます。できあがり！",
-        ],
-        "review_ja": "先週の日曜日にJasmine River Kitchenに行きました。サウスバンクの川沿いにありました。窓からの水の景色がとてもきれいでした。窓際のテーブルに座りました。肉じゃがはとてもあたたかくて甘かったです。じゃがいもがとてもやわらかくて、お母さんの料理みたいでした。小さくて居心地のいいレストランでした。テーブルにピンクの花がありました。また行きたいです。",
-        "conv_ja": [
-            "こんにちは！何を料理しているの？いい匂い！",
-            "こんにちは！肉じゃがを作っているよ。日本の煮物だよ。",
-            "肉じゃが？中には何が入っているの？",
-            "お肉、じゃがいも、玉ねぎ、にんじんだよ。",
-            "あたたかそうでいいね。",
-            "うん！甘くてしょっぱいの。食べる？",
-            "本当に？食べてみてもいい？",
-            "もちろん！あと10分待ってね。もうすぐできるよ。",
-            "ありがとう！新しい料理を試すの大好き。",
-            "うれしい。これ、お母さんのレシピなんだ。",
-            "それは素敵だね。お母さん、料理上手なんだね！",
-            "ありがとう！座ってて。持っていくね。",
-        ],
-    },
-    17: {
-        "intro_ja": "牛丼は日本の牛肉丼です。薄切りの牛肉と玉ねぎを甘いたれで煮てご飯にのせます。",
-        "steps_ja": [
-            "炊飯器でご飯を炊きます。",
-            "玉ねぎを薄く切ります。",
-            "しょうゆ、砂糖、みりん、水をフライパンで混ぜます。",
-            "玉ねぎとしょうがを加えて3分煮ます。",
-            "牛肉を入れて5分煮ます。",
-            "ご飯を盛った丼に牛肉とたれをのせます。できあがり！",
-        ],
-        "review_ja": "土曜日の夕方にSunset Bowl Cafeに行きました。シドニーのオペラハウスの近くにありました。ハーバー越しの夕日が見えました。空がオレンジとピンクになりました。とてもきれいでした。牛丼を注文しました。牛肉はやわらかくてたれは甘かったです。ご飯はあつあつでふっくらしていました。カフェは小さくて静かでした。とてもリラックスしました。素敵な夕べでした。",
-        "conv_ja": [
-            "昨日の夜ごはん何食べた？",
-            "家で牛丼を作ったよ。牛肉丼だよ。",
-            "牛肉丼？どうやって作るの？",
-            "牛肉と玉ねぎを甘いたれで煮て、ご飯にのせるの。",
-            "簡単そうでおいしそう！",
-            "うん、すごく簡単だよ。15分しかかからないの。",
-            "えー！習いたいな。教えてくれる？",
-            "もちろん！今週末うちにおいでよ。",
-            "やった！何を買えばいい？",
-            "牛肉だけ持ってきて。ご飯としょうゆはあるから。",
-            "わかった！スーパーで牛肉買うね。",
-            "完璧。土曜日に一緒に作ろう！",
-        ],
-    },
-    18: {
-        "intro_ja": "とんかつは日本のトンカツです。外はカリカリで中はジューシーな豚カツレツです。",
-        "steps_ja": [
-            "豚肉を手で軽くたたいて平らにします。",
-            "豚肉の両面に塩とこしょうをふります。",
-            "小麦粉、卵、パン粉の順につけます。",
-            "油を深い鍋で170度に熱します。",
-            "豚肉を片面4分ずつ、きつね色になるまで揚げます。",
-            "とんかつを切り分けてキャベツと一緒に盛ります。できあがり！",
-        ],
-        "review_ja": "ニュータウンの静かな通りでMimosa Garden Diningを見つけました。素敵なガーデンパティオに黄色いミモザの花がありました。大きな木の下で外に座りました。空気はさわやかで気持ちよかったです。とんかつ定食を注文しました。豚肉はとてもカリカリであつあつでした。キャベツは新鮮で緑が鮮やかでした。ソースは甘くて濃厚でした。スタッフはフレンドリーで親切でした。このお店がとても気に入りました。",
-        "conv_ja": [
-            "いらっしゃいませ！メニューをどうぞ。",
-            "ありがとう。おすすめは何ですか？",
-            "今日はとんかつがとても人気ですよ。",
-            "あ、とんかつ大好き！何がついてくるの？",
-            "ご飯、キャベツ、味噌汁がついてきます。",
-            "いいですね。とんかつ定食をお願いします。",
-            "かしこまりました。お飲み物はいかがですか？",
-            "はい、緑茶をお願いします。",
-            "温かいのと冷たいの、どちらがいいですか？",
-            "温かいのをお願いします。",
-            "わかりました。10分ほどでお料理をお持ちします。",
-            "ありがとうございます！",
-        ],
-    },
-    19: {
-        "intro_ja": "焼き鳥は日本のグリルチキンの串焼きです。たれは甘くてしょっぱいです。",
-        "steps_ja": [
-            "鶏肉を小さく切ります。",
-            "長ネギを短く切ります。",
-            "鶏肉とネギを竹串に刺します。",
-            "しょうゆ、砂糖、みりん、酒を小さい鍋で混ぜて沸かします。",
-            "串をアツいフライパンで片面3分ずつ焼きます。",
-            "たれをはけで塗ってもう1分焼きます。できあがり！",
-        ],
-        "review_ja": "金曜日の夜に友達とHilltop Lanternに行きました。サリーヒルズの小さな丘の上にありました。テラスから街の明かりが見えました。夜は涼しくて気持ちよかったです。焼き鳥をたくさん注文しました。鶏肉はジューシーでたれは最高でした。冷たい飲み物も飲みました。テラスのランタンがとてもきれいでした。あたたかい黄色い光でした。夜中ずっとおしゃべりして笑いました。とても楽しい時間でした。",
-        "conv_ja": [
-            "その串は何？面白そう！",
-            "焼き鳥だよ。日本のグリルチキンなの。",
-            "いいね！たれも自分で作ったの？",
-            "うん！しょうゆ、砂糖、みりんを混ぜたの。",
-            "すごくいい匂い。ひとつ食べてもいい？",
-            "どうぞ！気をつけてね、すごくアツいよ。",
-            "うーん！おいしい！たれが甘いね。",
-            "ありがとう！日本では小さなお店で焼き鳥を食べるんだよ。",
-            "へぇ、いつか日本に行きたいな。",
-            "行くべきだよ！日本にはおいしいお店がたくさんあるよ。",
-            "もっと焼き鳥作れる？みんな欲しがってるよ！",
-            "もちろん！みんなが気に入ってくれてうれしい。",
-        ],
-    },
-    20: {
-        "intro_ja": "枝豆はゆでた若い大豆です。シンプルでヘルシーな日本のおつまみです。",
-        "steps_ja": [
-            "枝豆を冷たい水で洗います。",
-            "枝豆に塩をふって手でもみます。",
-            "大きな鍋で塩を入れたお湯を沸かします。",
-            "枝豆を沸騰したお湯に入れます。",
-            "4分ゆでたら取り出します。",
-            "もう少し塩をふって、さやから出して食べます。できあがり！",
-        ],
-        "review_ja": "先週、Ocean Breeze Cafeに行きました。ウェストエンドの川沿いにありました。中にはきれいなオーシャンブルーの壁がありました。窓際のソファに座りました。外からのそよ風が涼しくて気持ちよかったです。枝豆と冷たい飲み物を注文しました。枝豆の塩加減がちょうどよかったです。飲み物との相性ばっちりでした。テーブルの小さな花瓶にジャスミンの花がありました。とてもリラックスできるカフェでした。2時間も本を読んで過ごしました。",
-        "conv_ja": [
-            "おつまみ買おうよ。何がいい？",
-            "枝豆はどう？ここにある？",
-            "うん、見て！メニューにあるよ。いいアイデア！",
-            "やった。枝豆と冷たい飲み物の組み合わせが大好き。",
-            "わたしも！すみません、枝豆ひとつお願いします！",
-            "あとレモネード2つお願いします。",
-            "日本で枝豆よく食べるの？",
-            "うん、夏に食べるよ。人気のおつまみなの。",
-            "どうやって食べるの？初めてなんだ。",
-            "指でさやから豆を押し出すんだよ。",
-            "こう？あ、簡単で楽しいね！",
-            "でしょ！さやは食べないでね。中の豆だけだよ。",
-        ],
-    },
-    21: {
-        "intro_ja": "茶碗蒸しは日本の卵の蒸し物です。やわらかくてあたたかくて、とてもやさしい味です。",
-        "steps_ja": [
-            "卵2つ、だし汁、少しのしょうゆと塩をボウルで混ぜます。",
-            "卵液をザルでこしてなめらかにします。",
-            "小さな鶏肉、えび、きのこをカップに入れます。",
-            "卵液をカップにゆっくり注ぎます。",
-            "カップにアルミホイルをかぶせ、弱火で15分蒸します。",
-            "三つ葉やパセリをのせて出来上がり。できあがり！",
-        ],
-        "review_ja": "先週の土曜日にワトソンズベイのHarbour Blossom Kitchenに行きました。海の近くの丘の上にありました。外に座って美しいハーバーが見えました。夕焼けの空がピンクとオレンジでした。茶碗蒸しを食べましたが、とてもやわらかくてあたたかかったです。テーブルに小さなジャスミンの花がありました。静かで居心地のいい場所でした。とても幸せでした。",
-        "conv_ja": [
-            "すみません、茶碗蒸しって何ですか？",
-            "日本の卵の蒸し物ですよ。あたたかくてやわらかいの。",
-            "プリンみたいなもの？",
-            "ちょっと似てるけど、甘くないの。中にだしが入っているの。",
-            "だしって何？",
-            "日本のスープのもとだよ。魚から作るの。",
-            "面白いね。中には何が入っているの？",
-            "鶏肉、えび、きのこが入っているよ。",
-            "作るの難しい？",
-            "ううん、難しくないよ。でもゆっくり蒸すのがポイントなの。",
-            "作ってみたい！教えてくれる？",
-            "もちろん！簡単だよ。今週末見せてあげるね。",
-        ],
-    },
-    22: {
-        "intro_ja": "天ぷらは日本の揚げ物です。えびと野菜に薄い衣をつけて揚げます。",
-        "steps_ja": [
-            "えびの殻をむいて、野菜を切ります。",
-            "小麦粉、卵1つ、とても冷たい水をボウルで混ぜて衣を作ります。",
-            "深い鍋にたっぷりの油を180度に熱します。",
-            "えびと野菜を衣につけます。",
-            "油で2〜3分、きつね色になるまで揚げます。",
-            "紙の上にのせて余分な油を切り、天つゆと一緒に出します。できあがり！",
-        ],
-        "review_ja": "先週末にクレモーンポイントのCliff Garden Diningに行きました。レストランは水辺の崖の上にありました。席からシドニーハーバーブリッジが見えました。庭にはラベンダーと黄色い花がありました。天ぷらを注文したら、とてもカリカリで軽かったです。えびは大きくて新鮮でした。とてもリラックスできる場所でした。また行きたいです。",
-        "conv_ja": [
-            "こんにちは！何を売っているんですか？",
-            "こんにちは！天ぷらを売っています。日本の揚げ物ですよ。",
-            "どんな天ぷらがありますか？",
-            "えび、さつまいも、なすがあります。",
-            "えびの天ぷらはいくらですか？",
-            "3つで5ドルです。",
-            "いいですね。えびをお願いします。",
-            "はい！今日はとても新鮮ですよ。",
-            "たれはありますか？",
-            "はい、天つゆです。大根おろしもどうぞ。",
-            "ありがとう！わぁ、すごくカリカリ！",
-            "気に入ってもらえてうれしいです！またどうぞ。",
-        ],
-    },
-    23: {
-        "intro_ja": "そばはそば粉で作った細い日本の麺です。温かくても冷たくても食べられます。",
-        "steps_ja": [
-            "大きな鍋でたっぷりのお湯を沸かします。",
-            "そばを4〜5分ゆでます。",
-            "麺をザルにあけて冷たい水で洗います。",
-            "しょうゆ、みりん、だし汁を小さい鍋で混ぜて温めます。",
-            "冷たいそばをお皿に盛り、ネギをのせます。",
-            "つけ汁、わさび、のりを添えます。できあがり！",
-        ],
-        "review_ja": "金曜日の夕方にTeneriffe Sunset Terraceに行きました。ブリスベン川のほとりにありました。テラスはとても広くて、川と夕日が見えました。空がピンクと紫に変わりました。冷たいそばをつけ汁で注文しました。麺はなめらかでつゆはおいしかったです。テーブルに小さな黄色い花がありました。音楽はやさしくて居心地がよかったです。とても気に入りました。",
-        "conv_ja": [
-            "そばの作り方を教えてくれる？",
-            "いいよ！まず、たっぷりのお湯を沸かすよ。",
-            "わかった。麺はどのくらいゆでるの？",
-            "だいたい4〜5分だよ。",
-            "その次は？",
-            "ザルにあけて冷たい水で洗うよ。",
-            "なんで冷たい水で？",
-            "麺がなめらかでしっかりするの。",
-            "なるほど。つゆはどうするの？",
-            "しょうゆ、みりん、だしを混ぜるよ。",
-            "温かくするの？冷たいまま？",
-            "今日は冷たいまま出すよ。暑い日にぴったりだよ。",
-            "いいね！今から作ってみるね。",
-            "がんばって！困ったら呼んでね。",
-        ],
-    },
-    24: {
-        "intro_ja": "うどんは太い日本の麺です。あたたかいスープの中でやわらかくてもちもちです。",
-        "steps_ja": [
-            "大きな鍋でお湯を沸かし、うどんをゆでます。",
-            "別の鍋でだし汁、しょうゆ、みりん、塩を混ぜてスープを作ります。",
-            "スープを中火で温めます。",
-            "うどんをザルにあけて丼に入れます。",
-            "温かいスープを麺にかけます。",
-            "ネギ、かまぼこ、卵をのせます。できあがり！",
-        ],
-        "review_ja": "雨の日にグリーブのBotanical Bowlに行きました。大きな公園の近くのレストランでした。中はあたたかくて居心地がよかったです。椅子にピンクのクッションがありました。卵とかまぼこのせ温かいうどんを注文しました。麺は太くてもちもちでした。スープはあたたかくてほっとしました。やさしいジャズが流れていました。雨の日のランチにぴったりでした。",
-        "conv_ja": [
-            "大丈夫？具合悪そうだよ。",
-            "風邪ひいちゃった。のどが痛いの。",
-            "それは大変。うどんを作ってあげるね。",
-            "うどんって何？",
-            "日本の太い麺で、温かいスープに入っているの。",
-            "よさそうだね。食べやすい？",
-            "うん！麺はやわらかくてスープはあたたかいよ。",
-            "ちょうど必要なものだ。",
-            "卵も入れるね。卵は体にいいよ。",
-            "本当にありがとう。やさしいね。",
-            "はい、どうぞ！あたたかいうちに食べてね。",
-            "わぁ、おいしい。もう元気になった気がする！",
-        ],
-    },
-    25: {
-        "intro_ja": "親子丼は鶏肉と卵の丼です。「親子」という名前は親と子どもを意味します。",
-        "steps_ja": [
-            "鶏もも肉と玉ねぎを小さく切ります。",
-            "しょうゆ、みりん、砂糖、だし汁を小さいフライパンで混ぜます。",
-            "玉ねぎと鶏肉をたれの中で中火で煮ます。",
-            "卵を2〜3個ボウルで溶きます。",
-            "鶏肉の上に卵をまわしかけ、1分煮ます。",
-            "あつあつのご飯の上にのせます。できあがり！",
-        ],
-        "review_ja": "水曜日にブリンバのRiverbank Jasmine Cafeに行きました。ブリスベン川のすぐそばにありました。木のデッキに座って川のボートを見ました。ジャスミンの花の香りがしました。親子丼と緑茶を注文しました。鶏肉はやわらかくて卵はクリーミーでした。ご飯はあつあつでふっくらしていました。シンプルだけど素敵な食事でした。まるで日本にいるような気分でした。",
-        "conv_ja": [
-            "いらっしゃいませ！ご注文はお決まりですか？",
-            "まだです。おすすめは何ですか？",
-            "今日は親子丼がおすすめです。",
-            "親子丼って何ですか？",
-            "鶏肉と卵をご飯にのせた丼です。",
-            "なんで「親子丼」って言うんですか？",
-            "「親子」は親と子どもという意味です。鶏が親で卵が子どもなの。",
-            "面白い！おいしい？",
-            "はい、日本でとても人気がありますよ。卵がやわらかくてクリーミーなの。",
-            "じゃあそれにします！あと緑茶もお願いします。",
-            "いい選択ですね！10分ほどでできますよ。",
-            "ありがとうございます！",
-        ],
-    },
-    26: {
-        "intro_ja": "カツ丼はとんかつと卵の丼です。日本でとても人気のある、ほっとする料理です。",
-        "steps_ja": [
-            "ご飯を炊いて丼に盛ります。",
-            "玉ねぎを薄く切ります。",
-            "しょうゆ、みりん、砂糖、だし汁を小さいフライパンで混ぜます。",
-            "玉ねぎを加えて2分煮ます。",
-            "とんかつを玉ねぎの上にのせ、溶き卵をかけます。",
-            "ふたをして1分煮たら、全部をご飯の上にのせます。できあがり！",
-        ],
-        "review_ja": "先週の土曜日にHarbour View Donburi Houseに行きました。バランガルーの水辺にありました。席からハーバーブリッジが見えました。小さくて居心地のいいレストランでした。カツ丼を注文したらとてもおいしかったです。豚肉はカリカリで卵はやわらかかったです。テーブルにきれいな黄色い花がありました。あたたかくて幸せな気持ちになりました。",
-        "conv_ja": [
-            "すみません、カツ丼って何ですか？",
-            "トンカツと卵をご飯にのせた丼ですよ。",
-            "おいしそう！大きいですか？",
-            "はい、かなり大きいです。ほとんどの人がお腹いっぱいになりますよ。",
-            "豚肉はカリカリですか？",
-            "はい、とてもカリカリです。毎回揚げたてで作っています。",
-            "いいですね！カツ丼をひとつお願いします。",
-            "かしこまりました。お飲み物もいかがですか？",
-            "はい、緑茶をお願いします。",
-            "カツ丼1つと緑茶1つですね。",
-            "どのくらいかかりますか？",
-            "10分ほどです。こちらでお待ちください。",
-        ],
-    },
-    27: {
-        "intro_ja": "お茶漬けはシンプルな日本の料理です。ご飯にアツい緑茶やだしをかけます。あたたかくて簡単に作れます。",
-        "steps_ja": [
-            "ご飯を炊いてお茶碗に盛ります。",
-            "焼き鮭をご飯の上にのせます。",
-            "小さくちぎったのりとネギをのせます。",
-            "アツい緑茶またはだし汁を用意します。",
-            "アツいお茶をゆっくりご飯にかけます。",
-            "わさびとごまをのせます。できあがり！",
-        ],
-        "review_ja": "先週、サウスバンク近くのParkside Tea Gardenに行きました。大きな木のある美しい公園の隣にありました。外に座って涼しくてさわやかな空気を楽しみました。鮭のお茶漬けを注文しました。お茶はあたたかくて鮭がとてもおいしかったです。静かで居心地のいいレストランでした。テーブルの近くにジャスミンの花がありました。とてもリラックスした時間でした。",
-        "conv_ja": [
-            "リリー、大丈夫？疲れてるみたい。",
-            "風邪ひいちゃった。あんまり食欲ないの。",
-            "何かあっさりしたもの作ってあげるね。ご飯は好き？",
-            "うん、ご飯好きだよ。何を作ってくれるの？",
-            "お茶漬けだよ。ご飯にアツい緑茶をかけたものなの。食べやすいよ。",
-            "よさそうだね。あたたかい？",
-            "うん、すごくあたたかいよ。具合悪いときにぴったりなの。",
-            "ありがとう。やさしいね。",
-            "はい、どうぞ。鮭とのりをのせたよ。",
-            "いい匂い。もう食べていい？",
-            "うん、ゆっくり食べてね。アツいから。",
-            "おいしい！体があたたまった。ありがとう！",
-        ],
-    },
-    28: {
-        "intro_ja": "たこわさはタコの刺身とわさびの日本のおつまみです。居酒屋で人気のサイドメニューです。",
-        "steps_ja": [
-            "生のタコを小さなひと口サイズに切ります。",
-            "タコをボウルに入れます。",
-            "わさび、しょうゆ、少しのみりんを小さなカップで混ぜます。",
-            "わさびだれをタコにかけます。",
-            "箸でやさしく混ぜます。",
-            "大葉とごまをのせてお皿に盛ります。できあがり！",
-        ],
-        "review_ja": "金曜日にパームビーチのSunset Wharf Kitchenに行きました。水のすぐそばにありました。海に沈む夕日が見えました。空がオレンジとピンクになりました。たこわさを注文したらとても新鮮でした。わさびはちょっとピリッとしたけどとてもおいしかったです。木のデッキがあるレストランでとてもリラックスできました。このお店が大好きでした。",
-        "conv_ja": [
-            "わぁ、この魚市場すごく大きいね！",
-            "うん！いろんな種類の魚や海鮮があるよ。",
-            "タコを買いたいの。たこわさを作るんだ。",
-            "たこわさって何？",
-            "生のタコにわさびをあえた日本のおつまみだよ。",
-            "面白そう！辛いの？",
-            "ちょっとね。でも冷たいビールとすごく合うよ。",
-            "食べてみたい。タコはどのくらい必要？",
-            "200グラムくらいで2人分だよ。",
-            "わかった。店員さんに聞いてみるね。すみません、このタコはお刺身用ですか？",
-            "大丈夫だって。よし！買おう。",
-            "今夜のたこわさが楽しみ！",
-        ],
-    },
-    29: {
-        "intro_ja": "漬物は日本の漬け野菜です。浅漬けはさっと漬けた軽い漬物です。とても簡単で30分でできます。",
-        "steps_ja": [
-            "きゅうり、キャベツ、にんじんを薄く切ります。",
-            "野菜を全部大きなボウルに入れます。",
-            "塩、小さく切った昆布、少しのしょうがを加えます。",
-            "手でよく混ぜます。",
-            "お皿をのせて上に重しをのせます。",
-            "30分待ってから野菜を取り出してお皿に盛ります。できあがり！",
-        ],
-        "review_ja": "ブリスベンのハミルトンでRooftop Garden Cafeを見つけました。小さなビルの最上階にありました。たくさんの植物や花がありました。ラベンダーやミモザの花に囲まれていました。浅漬けつきの和定食を注文しました。漬物はパリパリで新鮮でした。川の景色がきれいでした。今月一番のお気に入りランチでした。",
-        "conv_ja": [
-            "ねえ、今夜何作るの？",
-            "日本の漬物を作るよ。つけものって言うの。",
-            "漬物？瓶に入ったやつみたいなの？",
-            "ううん、これは違うの。生野菜と塩を使うの。",
-            "どんな野菜が必要？",
-            "きゅうり、キャベツ、にんじん。全部ここにあるよ。",
-            "簡単そうだね。どうやって作るの？",
-            "切って、塩をふって、30分待つだけ。",
-            "30分だけ？すごく早いね！",
-            "うん！だから浅漬けって言うの。「浅い漬物」っていう意味。",
-            "できたら食べてみてもいい？",
-            "もちろん！2人分作るよ。",
-        ],
-    },
-    30: {
-        "intro_ja": "抹茶プリンは甘くてクリーミーな日本のデザートです。きれいな緑色でやさしいお茶の味がします。",
-        "steps_ja": [
-            "抹茶パウダーと少しのお湯をカップでなめらかになるまで混ぜます。",
-            "鍋で牛乳と砂糖を温めます。沸騰させないでください。",
-            "ゼラチンパウダーを温かい牛乳に加えてよく混ぜます。",
-            "抹茶を鍋に入れてまた混ぜます。",
-            "小さなカップやグラスに注ぎます。",
-            "冷蔵庫で3時間冷やして、クリームをのせます。できあがり！",
-        ],
-        "review_ja": "30日間クッキングチャレンジの最終日を祝うためにモスマンのJasmine & Mimosa Dessert Cafeに行きました。丘の上にあるカフェでハーバーと青い海が見えました。壁はやさしいピンクとラベンダーに塗られていました。窓辺にジャスミンとミモザの花がありました。抹茶プリンを注文したら今まで食べた中で一番おいしいデザートでした。なめらかで甘かったです。とても幸せで、自分を誇りに思いました。30日間の旅の完璧な締めくくりでした。",
-        "conv_ja": [
-            "今日で30日間クッキングチャレンジの最終日だよ！",
-            "おめでとう！すごいね。今日は何を作るの？",
-            "抹茶プリン！日本の緑茶デザートだよ。",
-            "抹茶大好き！作るところ見てもいい？",
-            "もちろん！まず抹茶とお湯を混ぜるよ。",
-            "色がきれいだね。鮮やかな緑！",
-            "ありがとう。次は温かい牛乳に加えるよ。",
-            "いつ食べられるの？",
-            "3時間待たないと。冷蔵庫に入れるの。",
-            "わかった！待つよ。30日間でたくさんのレシピ覚えたんだね。",
-            "うん！新しい英単語も覚えたよ。自信がついた。",
-            "誇りに思っていいよ。英語がすごく上手になったよ！",
-            "ありがとう、すごくうれしい。一緒にプリン食べよう！",
-            "30日間に乾杯！よく頑張ったね！",
-        ],
-    },
-}
+from recipes import parse_days
+from storage import content_days, json_text, write_text_atomic
+from translation_memory import complete_translations
+from translation_store import apply_translations, load_translation, translation_days
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="日本語訳を content/dayN.json にマージする")
+    parser.add_argument("--days", type=parse_days, help="対象の日を指定する（例: 5 / 1,3,5 / 1-10）")
+    return parser.parse_args()
 
 
 def main():
+    args = parse_args()
     content_dir = "content"
-    updated = 0
+    written = unchanged = skipped = 0
+    # Only opened for a day with missing translations, so a run over fully
+    # translated days never reads (or appends to) memory.jsonl
+    memory = None
+    days = sorted(set(translation_days()) | {day for day, _ in content_days()})
+    if args.days is not None:
+        days = [day for day in days if day in args.days]
 
-    for day, trans in TRANSLATIONS.items():
+    for day in days:
         json_path = os.path.join(content_dir, f"day{day}.json")
         if not os.path.exists(json_path):
             print(f"⏭️  Day {day}: JSONファイルがありません - スキップ")
+            skipped += 1
             continue
 
         with open(json_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+            original = f.read()
+        data = json.loads(original)
 
-        # Add recipe translations
-        if "intro_ja" in trans:
-            data["recipe"]["intro_ja"] = trans["intro_ja"]
-        if "steps_ja" in trans:
-            data["recipe"]["steps_ja"] = trans["steps_ja"]
-
-        # Add review translation
-        if "review_ja" in trans:
-            data["review"]["content_ja"] = trans["review_ja"]
-
-        # Add conversation line translations
-        if "conv_ja" in trans:
-            lines = data.get("conversation", {}).get("lines", [])
-            conv_translations = trans["conv_ja"]
-            for i, line in enumerate(lines):
-                if i < len(conv_translations):
-                    line["translation"] = conv_translations[i]
+        trans, filled, memory = complete_translations(data, load_translation(day), memory)
+        if not trans:
+            skipped += 1
+            continue
 
-        with open(json_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        text = json_text(apply_translations(data, trans))
+        if text == original:
+            unchanged += 1
+            continue
+        write_text_atomic(json_path, text)
 
-        print(f"✅ Day {day}: 翻訳追加完了")
-        updated += 1
+        if filled:
+            print(f"✅ Day {day}: 翻訳追加完了（メモリから: {', '.join(filled)}）")
+        else:
+            print(f"✅ Day {day}: 翻訳追加完了")
+        written += 1
 
-    print(f"\n✅ {updated}/30 日分の翻訳を追加しました")
+    print(f"\n✅ {len(days)} 日中 書き込み {written} / 変更なし {unchanged} / スキップ {skipped}")
+    if memory is not None:
+        print(memory.summary())
 
 
 if __name__ == "__main__":
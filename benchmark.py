@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+30日間クッキング英語 - 生成スループットのベンチマーク
+
+mock_server.py をバックグラウンドで起動し、generate_content.py の生成ループを
+同時実行数ごとに走らせて、days/minute・レイテンシ（p50/p95/p99）・リトライ数を
+表にします。APIは呼ばないので無料です。
+
+使い方:
+  python benchmark.py --concurrency 1,4,8,16 --days 60 --latency 2 --jitter 0.5 --error-rate 0.05
+
+遅い応答が混ざる場合のヘッジ（--hedge）の効果:
+  python benchmark.py --concurrency 4 --days 60 --tail-rate 0.05 --tail-factor 4 --hedge 90
+
+"{" のプリフィルと見積もった max_tokens（--prefill）の効果（TPM制限下で比べる）:
+  python benchmark.py --concurrency 8 --days 60 --tpm 80000
+  python benchmark.py --concurrency 8 --days 60 --tpm 80000 --prefill
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import tempfile
+import time
+
+import anthropic
+
+import generate_content
+from hedging import HedgePolicy
+from mock_server import add_server_arguments, start_server
+from output_budget import OutputBudget
+from rate_limiter import RateLimiter
+from recipes import load_recipes
+from telemetry import new_record, percentile
+
+
+def course_recipes(days):
+    """`days` recipes, cycling through the manifest for longer courses"""
+    recipes = load_recipes()
+    return [{**recipes[i % len(recipes)], "day": i + 1} for i in range(days)]
+
+
+def run_once(options, concurrency, recipes):
+    """Generate `recipes` against a fresh mock server and measure the run"""
+    server = start_server(options)
+    client = anthropic.Anthropic(api_key="mock", base_url=server.base_url, max_retries=0)
+    # Start unthrottled; the mock's rate-limit headers (if any) pull it down
+    limiter = RateLimiter(options.client_rpm, options.client_tpm)
+    policy = HedgePolicy(options.hedge) if options.hedge is not None else None
+    generate_content.hedge_policy = policy
+    budget = OutputBudget(generate_content.MAX_TOKENS) if options.prefill else None
+    generate_content.use_prefill = options.prefill
+    generate_content.output_budget = budget
+    latencies = []
+    records = []
+
+    def task(recipe):
+        started = time.perf_counter()
+        record = new_record(recipe)
+        content = generate_content.generate_day(client, recipe, limiter, stream=options.stream, record=record)
+        latencies.append(time.perf_counter() - started)
+        records.append(record)
+        return content
+
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        results = list(generate_content.run_concurrent(task, recipes, concurrency))
+    wall = time.perf_counter() - started
+    server.shutdown()
+    server.server_close()
+
+    failed = sum(1 for _, result in results if isinstance(result, Exception))
+    return {
+        "concurrency": concurrency,
+        "days": len(recipes) - failed,
+        "failed": failed,
+        "wall_seconds": wall,
+        "days_per_minute": (len(recipes) - failed) / wall * 60.0,
+        "p50": percentile(latencies, 50),
+        "p95": percentile(latencies, 95),
+        "p99": percentile(latencies, 99),
+        # Every 429/5xx the mock sent was answered with a retry (or a failure)
+        "retries": server.stats["429"] + server.stats["5xx"],
+        "requests": server.stats["requests"],
+        "hedged": policy.hedged if policy else 0,
+        "hedge_saved_seconds": policy.saved_seconds if policy else 0.0,
+        "hedge_extra_usd": policy.extra_cost() if policy else 0.0,
+        "output_tokens_per_day": sum(r["output_tokens"] for r in records) / len(records) if records else 0.0,
+        "mean_max_tokens": budget.reserved / budget.requests if budget and budget.requests
+        else generate_content.MAX_TOKENS,
+        "truncated": budget.truncated if budget else 0,
+    }
+
+
+def print_table(rows, hedge=False):
+    header = (
+        f"{'並列':>4} {'日数':>5} {'失敗':>4} {'days/min':>9} {'p50':>7} {'p95':>7} {'p99':>7} {'リトライ':>8}"
+        f" {'出力/日':>8} {'max_tokens':>10}"
+    )
+    if hedge:
+        header += f" {'ヘッジ':>6} {'追加$':>7}"
+    print(header)
+    for row in rows:
+        line = (
+            f"{row['concurrency']:>4} {row['days']:>5} {row['failed']:>4} {row['days_per_minute']:>9.1f} "
+            f"{row['p50']:>6.2f}s {row['p95']:>6.2f}s {row['p99']:>6.2f}s {row['retries']:>8}"
+            f" {row['output_tokens_per_day']:>8.0f} {row['mean_max_tokens']:>10.0f}"
+        )
+        if hedge:
+            line += f" {row['hedged']:>6} {row['hedge_extra_usd']:>7.3f}"
+        print(line)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="生成スループットのベンチマーク（モックサーバー使用）")
+    parser.add_argument("--concurrency", default="1,2,4,8", help="試す同時実行数（カンマ区切り）")
+    parser.add_argument("--days", type=int, default=30, help="1回の実行で生成する日数")
+    parser.add_argument("--stream", action="store_true", help="--stream モードで生成する")
+    parser.add_argument("--client-rpm", type=int, default=100000, help="クライアント側のRPM初期値")
+    parser.add_argument("--client-tpm", type=int, default=10 ** 9, help="クライアント側のTPM初期値")
+    parser.add_argument("--hedge", type=float, metavar="P", help="ヘッジするパーセンタイル（例: 95）")
+    parser.add_argument("--prefill", action="store_true", help="--prefill モードで生成する")
+    parser.add_argument("--json", help="結果をJSONで保存するパス")
+    add_server_arguments(parser)
+    return parser.parse_args()
+
+
+def main():
+    options = parse_args()
+    levels = [int(level) for level in options.concurrency.split(",")]
+    recipes = course_recipes(options.days)
+    output = os.path.abspath(options.json) if options.json else None
+
+    print("📊 生成スループット ベンチマーク（モックサーバー）")
+    print(f"   {options.days} 日分 / 応答 {options.latency}±{options.jitter}s / "
+          f"エラー率 {options.error_rate} / 429率 {options.rate_limit_rate}")
+    print("=" * 64)
+
+    rows = []
+    cwd = os.getcwd()
+    for concurrency in levels:
+        # Write into a scratch content/ so the real course is never touched
+        with tempfile.TemporaryDirectory() as scratch:
+            os.chdir(scratch)
+            os.makedirs("content")
+            try:
+                rows.append(run_once(options, concurrency, recipes))
+            finally:
+                os.chdir(cwd)
+        print(f"✅ 並列 {concurrency}: {rows[-1]['wall_seconds']:.1f}秒")
+
+    print("=" * 64)
+    print_table(rows, hedge=options.hedge is not None)
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump(rows, f, ensure_ascii=False, indent=2)
+        print(f"📁 {output} に保存しました")
+
+
+if __name__ == "__main__":
+    main()
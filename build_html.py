@@ -4,14 +4,26 @@
 
 使い方:
   python build_html.py
+  python build_html.py --recipes my_course.csv   # 別のレシピ一覧を使う
+  python build_html.py --overlay                 # translations/ の訳をその場でマージする
 
 content/ フォルダのJSONファイルから、docs/ フォルダにHTMLファイルを生成します。
+
+--overlay では、translations/dayN.json の訳（足りない分は add_translations.py と同じく翻訳メモリで補う）を
+読み込んだ content にメモリ上で重ねてからHTMLにします。add_translations.py で content/ を書き直してから読み直す必要がないので、
+訳を直したあとはこのコマンド1つでページに反映されます（content/ は変更しません）。
 """
 
+import argparse
 import json
 import os
 import re
 
+from compiled_template import CompiledTemplate
+from recipes import RECIPES_FILE, load_recipes
+from translation_memory import complete_translations
+from translation_store import apply_translations, load_translation
+
 HTML_TEMPLATE = '''<!DOCTYPE html>
 <html lang="ja">
 <head>
@@ -885,6 +897,9 @@ ${{diaryText}}
 </body>
 </html>'''
 
+# Parsed once; rendering only fills in the slots
+PAGE_TEMPLATE = CompiledTemplate(HTML_TEMPLATE)
+
 
 def generate_vocab_html(vocab_list):
     """Generate HTML for vocabulary items"""
@@ -988,8 +1003,12 @@ def generate_stars(count):
     return "⭐" * count
 
 
-def build_html(day, content):
-    """Build HTML file from JSON content"""
+def page_fields(day, content, prev_day=None, next_day=None):
+    """Values of the HTML_TEMPLATE slots for a day
+
+    prev_day/next_day are the neighbouring days in the recipe manifest
+    (None at either end of the course).
+    """
     meta = content.get("meta", {})
     recipe = content.get("recipe", {})
     review = content.get("review", {})
@@ -997,15 +1016,15 @@ def build_html(day, content):
     australia_tips = content.get("australia_tips", {})
     
     # Navigation
-    if day == 1:
+    if prev_day is None:
         nav_prev = '<button class="btn btn-secondary" disabled>← 前の日</button>'
     else:
-        nav_prev = f'<a href="day{day-1}.html" class="nav-link"><button class="btn btn-secondary">← Day {day-1}</button></a>'
+        nav_prev = f'<a href="day{prev_day}.html" class="nav-link"><button class="btn btn-secondary">← Day {prev_day}</button></a>'
     
-    if day == 30:
+    if next_day is None:
         nav_next = '<button class="btn btn-primary" disabled>完了！ 🎉</button>'
     else:
-        nav_next = f'<a href="day{day+1}.html" class="nav-link"><button class="btn btn-primary">Day {day+1} →</button></a>'
+        nav_next = f'<a href="day{next_day}.html" class="nav-link"><button class="btn btn-primary">Day {next_day} →</button></a>'
     
     # Format Australia tips content
     tips_content = australia_tips.get("content", "")
@@ -1014,7 +1033,7 @@ def build_html(day, content):
         if para.strip():
             tips_content_html += f"<p>{para.strip()}</p>\n        "
     
-    html = HTML_TEMPLATE.format(
+    return dict(
         day=day,
         recipe_en=meta.get("en", ""),
         recipe_ja=meta.get("ja", ""),
@@ -1049,8 +1068,11 @@ def build_html(day, content):
         nav_prev=nav_prev,
         nav_next=nav_next,
     )
-    
-    return html
+
+
+def build_html(day, content, prev_day=None, next_day=None):
+    """Build HTML file from JSON content"""
+    return PAGE_TEMPLATE.render(**page_fields(day, content, prev_day, next_day))
 
 
 def build_index_html(recipes):
@@ -1136,7 +1158,22 @@ def build_index_html(recipes):
     return html
 
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="30日間クッキング英語 - HTML生成")
+    parser.add_argument(
+        "--recipes", default=RECIPES_FILE,
+        help=f"料理の一覧（JSONまたはCSV、デフォルト: {RECIPES_FILE}）",
+    )
+    parser.add_argument(
+        "--overlay", action="store_true",
+        help="translations/ の訳を content/ に書き戻さず、HTML生成時にメモリ上でマージする",
+    )
+    return parser.parse_args()
+
+
 def main():
+    args = parse_args()
+    
     # Check if content directory exists
     if not os.path.exists("content"):
         print("❌ content/ フォルダが見つかりません")
@@ -1146,46 +1183,25 @@ def main():
     # Create output directory
     os.makedirs("docs", exist_ok=True)
     
-    recipes = [
-        {"day": 1, "en": "Gyoza", "ja": "餃子", "emoji": "🥟"},
-        {"day": 2, "en": "Shumai", "ja": "シュウマイ", "emoji": "🟡"},
-        {"day": 3, "en": "Karaage", "ja": "唐揚げ", "emoji": "🍗"},
-        {"day": 4, "en": "Chicken Nanban", "ja": "チキン南蛮", "emoji": "🍗"},
-        {"day": 5, "en": "Yurinjii", "ja": "油淋鶏", "emoji": "🐔"},
-        {"day": 6, "en": "Kakuni", "ja": "角煮", "emoji": "🍖"},
-        {"day": 7, "en": "Fried Rice", "ja": "チャーハン", "emoji": "🍳"},
-        {"day": 8, "en": "Ramen", "ja": "ラーメン", "emoji": "🍜"},
-        {"day": 9, "en": "Onigiri", "ja": "おにぎり", "emoji": "🍙"},
-        {"day": 10, "en": "Miso Soup", "ja": "味噌汁", "emoji": "🥣"},
-        {"day": 11, "en": "Tamagoyaki", "ja": "卵焼き", "emoji": "🥚"},
-        {"day": 12, "en": "Teriyaki Chicken", "ja": "照り焼きチキン", "emoji": "🍗"},
-        {"day": 13, "en": "Japanese Curry", "ja": "カレー", "emoji": "🍛"},
-        {"day": 14, "en": "Okonomiyaki", "ja": "お好み焼き", "emoji": "🥞"},
-        {"day": 15, "en": "Takoyaki", "ja": "たこ焼き", "emoji": "🐙"},
-        {"day": 16, "en": "Nikujaga", "ja": "肉じゃが", "emoji": "🥔"},
-        {"day": 17, "en": "Gyudon", "ja": "牛丼", "emoji": "🥩"},
-        {"day": 18, "en": "Tonkatsu", "ja": "とんかつ", "emoji": "🐷"},
-        {"day": 19, "en": "Yakitori", "ja": "焼き鳥", "emoji": "🍢"},
-        {"day": 20, "en": "Edamame", "ja": "枝豆", "emoji": "🫛"},
-        {"day": 21, "en": "Chawanmushi", "ja": "茶碗蒸し", "emoji": "🍮"},
-        {"day": 22, "en": "Tempura", "ja": "天ぷら", "emoji": "🍤"},
-        {"day": 23, "en": "Soba", "ja": "そば", "emoji": "🍝"},
-        {"day": 24, "en": "Udon", "ja": "うどん", "emoji": "🍜"},
-        {"day": 25, "en": "Oyakodon", "ja": "親子丼", "emoji": "🐔"},
-        {"day": 26, "en": "Katsudon", "ja": "カツ丼", "emoji": "🍱"},
-        {"day": 27, "en": "Ochazuke", "ja": "お茶漬け", "emoji": "🍵"},
-        {"day": 28, "en": "Takowasa", "ja": "たこわさ", "emoji": "🐙"},
-        {"day": 29, "en": "Tsukemono", "ja": "浅漬け", "emoji": "🥒"},
-        {"day": 30, "en": "Matcha Pudding", "ja": "抹茶プリン", "emoji": "🍵"},
-    ]
+    try:
+        recipes = load_recipes(args.recipes)
+    except (OSError, ValueError) as e:
+        print(f"❌ レシピ一覧を読み込めません: {e}")
+        return
     
     print("🔨 30日間クッキング英語 - HTML生成開始")
+    if args.overlay:
+        print("🌐 translations/ の訳を重ねて生成します")
     print("=" * 50)
     
     success_count = 0
+    memory = None
+    days = [recipe["day"] for recipe in recipes]
     
-    for recipe in recipes:
+    for i, recipe in enumerate(recipes):
         day = recipe["day"]
+        prev_day = days[i - 1] if i > 0 else None
+        next_day = days[i + 1] if i + 1 < len(days) else None
         json_path = f"content/day{day}.json"
         
         if not os.path.exists(json_path):
@@ -1196,11 +1212,15 @@ def main():
             with open(json_path, "r", encoding="utf-8") as f:
                 content = json.load(f)
             
+            if args.overlay:
+                trans, _, memory = complete_translations(content, load_translation(day), memory)
+                apply_translations(content, trans)
+            
             # Add meta if missing
             if "meta" not in content:
                 content["meta"] = recipe
             
-            html = build_html(day, content)
+            html = build_html(day, content, prev_day, next_day)
             
             with open(f"docs/day{day}.html", "w", encoding="utf-8") as f:
                 f.write(html)
@@ -1218,7 +1238,9 @@ def main():
     print(f"✅ index.html 生成完了")
     
     print("=" * 50)
-    print(f"✅ 生成完了: {success_count}/30 日分")
+    print(f"✅ 生成完了: {success_count}/{len(recipes)} 日分")
+    if memory is not None:
+        print(memory.summary())
     print("📁 docs/ フォルダにHTMLファイルが保存されました")
     print("")
     print("ローカルで確認:")
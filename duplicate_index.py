@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+30日間クッキング英語 - 重複チェック（MinHash + LSH）
+
+レビューの店名・場所・本文と会話文が、他の日とほとんど同じになっていないかを調べます。
+各フィールドを shingle（店名・場所は3文字ずつ、本文・会話は3単語ずつ）に分けて
+MinHash の署名にし、LSH のバケットで候補の日だけを比べるので、
+日数が増えても1日あたりのチェックはほぼ一定の時間で終わります。
+
+generate_content.py は1日生成するたびにチェックし、重複したセクションだけを作り直します。
+既存の content/ をまとめて調べる場合:
+  python duplicate_index.py
+"""
+
+import glob
+import json
+import os
+import random
+import re
+import sys
+import threading
+import zlib
+
+from storage import write_text_atomic
+
+INDEX_FILE = os.path.join("content", ".duplicates.jsonl")
+
+# Field -> estimated Jaccard similarity above which it counts as a repeat.
+# Names and places are compared by characters, texts by words.
+THRESHOLDS = {
+    "review.restaurant": 0.6,
+    "review.location": 0.7,
+    "review.content": 0.5,
+    "conversation.lines": 0.5,
+}
+CHAR_FIELDS = {"review.restaurant", "review.location"}
+SHINGLE_SIZE = 3
+
+# 20 bands x 3 rows: pairs above ~0.37 similarity share a bucket with high
+# probability, comfortably below every threshold above
+BANDS = 20
+ROWS = 3
+NUM_PERM = BANDS * ROWS
+
+_PRIME = (1 << 61) - 1
+_MASK = (1 << 32) - 1
+_rng = random.Random(1)
+_PERMUTATIONS = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_PERM)]
+
+
+def field_text(content, field):
+    """Text of a checked field ("section.key") of a day, or ""."""
+    section, key = field.split(".")
+    value = (content.get(section) or {}).get(key)
+    if key == "lines":
+        return "\n".join(line.get("text", "") for line in value or [])
+    return value if isinstance(value, str) else ""
+
+
+def shingles(text, field):
+    """Set of overlapping character or word n-grams of normalized text"""
+    words = re.findall(r"[a-z0-9']+", text.lower())
+    if field in CHAR_FIELDS:
+        text = " ".join(words)
+        return {text[i:i + SHINGLE_SIZE] for i in range(max(len(text) - SHINGLE_SIZE + 1, 1))} if text else set()
+    return {" ".join(words[i:i + SHINGLE_SIZE]) for i in range(max(len(words) - SHINGLE_SIZE + 1, 1))} if words else set()
+
+
+def minhash(items):
+    """MinHash signature (NUM_PERM 32-bit values) of a set of shingles"""
+    hashes = [zlib.crc32(item.encode("utf-8")) for item in items]
+    return tuple(min(((a * h + b) % _PRIME) & _MASK for h in hashes) for a, b in _PERMUTATIONS)
+
+
+def similarity(sig_a, sig_b):
+    """Estimated Jaccard similarity of the sets behind two signatures"""
+    return sum(1 for x, y in zip(sig_a, sig_b) if x == y) / NUM_PERM
+
+
+def signatures(content):
+    """{field: signature} for every checked field that has text"""
+    result = {}
+    for field in THRESHOLDS:
+        items = shingles(field_text(content, field), field)
+        if items:
+            result[field] = minhash(items)
+    return result
+
+
+class DuplicateIndex:
+    """LSH index of the MinHash signatures of every generated day
+
+    Signatures are appended to `path` (one line per day, last line wins) so
+    later runs do not have to re-read every day. Other index files given in
+    `read_paths` (e.g. other shards') are loaded too but never written.
+    path=None keeps the index in memory only.
+    """
+
+    def __init__(self, path=INDEX_FILE, read_paths=()):
+        self.path = path
+        self.lock = threading.Lock()
+        self.signatures = {}
+        self.buckets = {field: {} for field in THRESHOLDS}
+        own = {}
+        for source in [p for p in read_paths if p != path] + [path]:
+            if source is None or not os.path.exists(source):
+                continue
+            with open(source, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    sigs = {field: tuple(sig) for field, sig in entry["signatures"].items()}
+                    self._insert(entry["day"], sigs)
+                    if source == path:
+                        own[entry["day"]] = line if line.endswith("\n") else line + "\n"
+        if path is not None and os.path.exists(path):
+            write_text_atomic(path, "".join(line for _, line in sorted(own.items())))
+
+    def __contains__(self, day):
+        return day in self.signatures
+
+    def _insert(self, day, sigs):
+        self._remove(day)
+        self.signatures[day] = sigs
+        for field, sig in sigs.items():
+            for band in range(BANDS):
+                key = (band, sig[band * ROWS:(band + 1) * ROWS])
+                self.buckets[field].setdefault(key, set()).add(day)
+
+    def _remove(self, day):
+        for field, sig in self.signatures.pop(day, {}).items():
+            for band in range(BANDS):
+                self.buckets[field].get((band, sig[band * ROWS:(band + 1) * ROWS]), set()).discard(day)
+
+    def check(self, day, content, sigs=None):
+        """Near-duplicates of `content` among the other indexed days
+
+        Returns [(field, other_day, similarity)], one entry per repeated
+        field (its most similar day).
+        """
+        if sigs is None:
+            sigs = signatures(content)
+        with self.lock:
+            return self._check(day, sigs)
+
+    def check_and_add(self, day, content):
+        """check(), and add() the day if nothing repeats, in one locked step
+
+        With several workers, a day is indexed before the next check runs,
+        so of two near-identical days generated at the same time the
+        second is always flagged.
+        """
+        sigs = signatures(content)
+        with self.lock:
+            found = self._check(day, sigs)
+            if not found:
+                self._add(day, sigs)
+        return found
+
+    def add(self, day, content, sigs=None):
+        """Index (or re-index) a day and append its signatures to the file"""
+        if sigs is None:
+            sigs = signatures(content)
+        with self.lock:
+            self._add(day, sigs)
+
+    def _check(self, day, sigs):
+        found = []
+        for field, sig in sigs.items():
+            candidates = set()
+            for band in range(BANDS):
+                candidates |= self.buckets[field].get((band, sig[band * ROWS:(band + 1) * ROWS]), set())
+            candidates.discard(day)
+            best = max(
+                ((similarity(sig, self.signatures[other][field]), other) for other in candidates),
+                default=None,
+            )
+            if best is not None and best[0] >= THRESHOLDS[field]:
+                found.append((field, best[1], best[0]))
+        return found
+
+    def _add(self, day, sigs):
+        if self.signatures.get(day) == sigs:
+            # Already indexed as it is (e.g. by check_and_add)
+            return
+        self._insert(day, sigs)
+        if self.path is None:
+            return
+        line = json.dumps({"day": day, "signatures": {field: list(sig) for field, sig in sigs.items()}}) + "\n"
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(line)
+
+
+def describe_duplicates(found):
+    return ", ".join(f"{field} が Day {other} と類似（{score:.0%}）" for field, other, score in found)
+
+
+def main():
+    """Check every content/dayN.json against the days before it"""
+    days = []
+    for path in glob.glob(os.path.join("content", "day*.json")):
+        match = re.fullmatch(r"day(\d+)\.json", os.path.basename(path))
+        if match:
+            days.append((int(match.group(1)), path))
+    if not days:
+        print("❌ content/ に dayN.json がありません")
+        sys.exit(1)
+
+    index = DuplicateIndex(None)
+    flagged = 0
+    for day, path in sorted(days):
+        with open(path, "r", encoding="utf-8") as f:
+            content = json.load(f)
+        sigs = signatures(content)
+        found = index.check(day, content, sigs)
+        if found:
+            flagged += 1
+            print(f"⚠️  Day {day}: {describe_duplicates(found)}")
+        index.add(day, content, sigs)
+
+    print("=" * 50)
+    print(f"🔍 {len(days)} 日分をチェック: 重複あり {flagged} 日")
+    if flagged:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -9,68 +9,92 @@
 2. スクリプト実行
    python generate_content.py
 
+   複数の日を並列で生成する場合（例: 4並列）
+   python generate_content.py --concurrency 4
+
+   既存の日の一部のセクションだけを作り直す場合
+   python generate_content.py --sections quiz2,conversation --days 5
+
+   Message Batches API でまとめて生成する場合（途中で止めても --batch で再開）
+   python generate_content.py --batch
+
+   ```json の囲みではなく、ツール入力（構造化出力）で受け取る場合
+   python generate_content.py --tools
+
+   答えの先頭を "{" で始めさせ、max_tokens をこれまでの出力から見積もる場合
+   python generate_content.py --prefill
+
+   料理の一覧は recipes.json から読み込む（--recipes で別のJSON/CSVを指定）
+   4台で分担する場合は各マシンで --shard 1/4 〜 --shard 4/4
+
 3. content/ フォルダにJSONファイルが生成される
 """
 
 import anthropic
+import argparse
+import glob
 import json
 import time
 import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-# 30 recipes list
-RECIPES = [
-    {"day": 1, "en": "Gyoza", "ja": "餃子", "emoji": "🥟"},
-    {"day": 2, "en": "Shumai", "ja": "シュウマイ", "emoji": "🟡"},
-    {"day": 3, "en": "Karaage", "ja": "唐揚げ", "emoji": "🍗"},
-    {"day": 4, "en": "Chicken Nanban", "ja": "チキン南蛮", "emoji": "🍗"},
-    {"day": 5, "en": "Yurinjii", "ja": "油淋鶏", "emoji": "🐔"},
-    {"day": 6, "en": "Kakuni", "ja": "角煮", "emoji": "🍖"},
-    {"day": 7, "en": "Fried Rice", "ja": "チャーハン", "emoji": "🍳"},
-    {"day": 8, "en": "Ramen", "ja": "ラーメン", "emoji": "🍜"},
-    {"day": 9, "en": "Onigiri", "ja": "おにぎり", "emoji": "🍙"},
-    {"day": 10, "en": "Miso Soup", "ja": "味噌汁", "emoji": "🥣"},
-    {"day": 11, "en": "Tamagoyaki", "ja": "卵焼き", "emoji": "🥚"},
-    {"day": 12, "en": "Teriyaki Chicken", "ja": "照り焼きチキン", "emoji": "🍗"},
-    {"day": 13, "en": "Japanese Curry", "ja": "カレー", "emoji": "🍛"},
-    {"day": 14, "en": "Okonomiyaki", "ja": "お好み焼き", "emoji": "🥞"},
-    {"day": 15, "en": "Takoyaki", "ja": "たこ焼き", "emoji": "🐙"},
-    {"day": 16, "en": "Nikujaga", "ja": "肉じゃが", "emoji": "🥔"},
-    {"day": 17, "en": "Gyudon", "ja": "牛丼", "emoji": "🥩"},
-    {"day": 18, "en": "Tonkatsu", "ja": "とんかつ", "emoji": "🐷"},
-    {"day": 19, "en": "Yakitori", "ja": "焼き鳥", "emoji": "🍢"},
-    {"day": 20, "en": "Edamame", "ja": "枝豆", "emoji": "🫛"},
-    {"day": 21, "en": "Chawanmushi", "ja": "茶碗蒸し", "emoji": "🍮"},
-    {"day": 22, "en": "Tempura", "ja": "天ぷら", "emoji": "🍤"},
-    {"day": 23, "en": "Soba", "ja": "そば", "emoji": "🍝"},
-    {"day": 24, "en": "Udon", "ja": "うどん", "emoji": "🍜"},
-    {"day": 25, "en": "Oyakodon", "ja": "親子丼", "emoji": "🐔"},
-    {"day": 26, "en": "Katsudon", "ja": "カツ丼", "emoji": "🍱"},
-    {"day": 27, "en": "Ochazuke", "ja": "お茶漬け", "emoji": "🍵"},
-    {"day": 28, "en": "Takowasa", "ja": "たこわさ", "emoji": "🐙"},
-    {"day": 29, "en": "Tsukemono", "ja": "浅漬け", "emoji": "🥒"},
-    {"day": 30, "en": "Matcha Pudding", "ja": "抹茶プリン", "emoji": "🍵"},
-]
-
-PROMPT_TEMPLATE = '''あなたは英語教材を作成する専門家です。英検5級レベル（中1程度）の英語で、日本料理のレシピと関連コンテンツを作成してください。
-
-# 作成する料理
-{recipe_en}（{recipe_ja}）
+from duplicate_index import DuplicateIndex, describe_duplicates, field_text
+from hedging import DEFAULT_PERCENTILE, HedgeCancelled, HedgePolicy, hedged_call
+from json_repair import RepairStats, repair_json
+from output_budget import OutputBudget
+from rate_limiter import DEFAULT_RPM, DEFAULT_TPM, RateLimiter
+from recipes import RECIPES_FILE, in_shard, load_recipes, parse_days, parse_shard, shard_suffix
+from response_cache import ResponseCache, cache_key
+from storage import ContentAggregate, RunJournal, remove_stale_temp_files, write_json_atomic, write_text_atomic
+from stream_validator import DAY_SCHEMA, DayStreamValidator, SchemaError
+from telemetry import RunReport, add_tokens, add_usage, new_record, usage_tokens
+from tool_schema import TOOL_NAME, build_tool
+from translation_store import drop_translations
+from vocab_level import LevelChecker, describe_off_level
+
+MODEL = "claude-sonnet-4-20250514"
+MAX_TOKENS = 4096
+
+# Message Batches: the in-progress batch ID is kept here so runs can resume
+BATCH_STATE_FILE = os.path.join("content", ".batch_id")
+BATCH_POLL_MIN = 5
+BATCH_POLL_MAX = 120
+
+# Retry rate limits, overload and transient server errors
+MAX_RETRIES = 5
+RETRYABLE_STATUS = {429, 500, 502, 503, 504, 529}
+
+# Full re-requests when an answer cannot be repaired locally
+PARSE_RETRIES = 1
+
+# Section re-requests when a day repeats another day (see duplicate_index.py)
+DUPLICATE_RETRIES = 2
+
+# Section re-requests when a day's English is above 英検5級 (see vocab_level.py)
+LEVEL_RETRIES = 1
+
+
+# Static parts of the prompt, identical for every recipe. The full system
+# prompt is sent as a cacheable block so repeated calls only pay for the user turn.
+PROMPT_HEADER = '''あなたは英語教材を作成する専門家です。英検5級レベル（中1程度）の英語で、日本料理のレシピと関連コンテンツを作成してください。
 
 # 学習者のプロフィール
 - 日本人女性、オーストラリアでワーキングホリデー予定
 - 景色の良いレストラン・カフェが好き（海沿い、山が見える、など）
 - カジュアルで落ち着いた雰囲気のお店が好き
 - 好きな花：ジャスミン、ミモザ
-- 好きな色：ピンク、黄色、ラベンダー
+- 好きな色：ピンク、黄色、ラベンダー'''
 
-# 出力形式
-以下のJSON形式で出力してください。すべての英文は英検5級レベル（中1程度）で書いてください。
+# Introduces the JSON block; --tools declares the format as a tool schema instead
+OUTPUT_FORMAT_HEADER = '''# 出力形式
+以下のJSON形式で出力してください。すべての英文は英検5級レベル（中1程度）で書いてください。'''
 
-```json
-{{
-  "recipe": {{
-    "title": "How to Make {recipe_en}",
+# JSON schema of each top-level section, in output order
+SECTION_SCHEMAS = {
+    "recipe": '''  "recipe": {
+    "title": "How to Make （料理の英語名）",
     "intro": "（料理の1-2文の説明。例：Gyoza is a Japanese dumpling. It is very popular in Japan.）",
     "ingredients": "（材料リスト。英語で。例：pork, cabbage, garlic, ginger, soy sauce, sesame oil, gyoza wrappers）",
     "steps": [
@@ -81,57 +105,56 @@ PROMPT_TEMPLATE = '''あなたは英語教材を作成する専門家です。
       "（ステップ5）",
       "（ステップ6。最後は **Enjoy!** で終わる）"
     ]
-  }},
-  "recipe_vocab": [
-    {{"word": "単語", "meaning": "日本語の意味"}},
+  }''',
+    "recipe_vocab": '''  "recipe_vocab": [
+    {"word": "単語", "meaning": "日本語の意味"},
     ...（8-12個程度）
-  ],
-  "quiz1": {{
+  ]''',
+    "quiz1": '''  "quiz1": {
     "question": "（レシピの内容に関する日本語の質問）",
     "options": ["選択肢1", "選択肢2", "選択肢3"],
     "correct": 0
-  }},
-  "review": {{
+  }''',
+    "review": '''  "review": {
     "restaurant": "（架空のオーストラリアのレストラン名。景色が良い、カジュアルで落ち着いた雰囲気のお店）",
     "location": "（ブリスベンまたはシドニーの地名。できれば海沿いや眺めの良い場所）",
     "stars": 5,
     "content": "（レビュー本文。5-7文程度。過去形を使う。景色の良さ、落ち着いた雰囲気、居心地の良さなども描写する。例：I went to ... last weekend. The view was beautiful. I could see the ocean from my table. The restaurant was quiet and cozy. I ordered ... It was delicious.）"
-  }},
-  "review_vocab": [
-    {{"word": "単語", "meaning": "日本語の意味"}},
+  }''',
+    "review_vocab": '''  "review_vocab": [
+    {"word": "単語", "meaning": "日本語の意味"},
     ...（8-12個程度）
-  ],
-  "quiz2": {{
+  ]''',
+    "quiz2": '''  "quiz2": {
     "question": "（レビューの内容に関する日本語の質問）",
     "options": ["選択肢1", "選択肢2", "選択肢3"],
     "correct": 0
-  }},
-  "australia_tips": {{
+  }''',
+    "australia_tips": '''  "australia_tips": {
     "title": "（日本語のタイトル。例：オーストラリアで餃子を作るなら）",
     "content": "（日本語で3-4段落。材料の買い方、現地での楽しみ方、ワーホリ中に役立つ情報など。時々、オーストラリアの美しい景色、カフェ文化、ジャスミンやミモザの花が見れる場所や季節などの情報も織り交ぜる）"
-  }},
-  "conversation": {{
+  }''',
+    "conversation": '''  "conversation": {
     "scene": "（日本語でシーン説明。例：シェアハウスのキッチンにて、海が見えるカフェにて、など）",
     "lines": [
-      {{"speaker": "A", "text": "（英語のセリフ）"}},
-      {{"speaker": "B", "text": "（英語のセリフ）"}},
+      {"speaker": "A", "text": "（英語のセリフ）"},
+      {"speaker": "B", "text": "（英語のセリフ）"},
       ...（10-14行程度。料理に関連した自然な会話）
     ]
-  }},
-  "conversation_vocab": [
-    {{"word": "単語", "meaning": "日本語の意味"}},
+  }''',
+    "conversation_vocab": '''  "conversation_vocab": [
+    {"word": "単語", "meaning": "日本語の意味"},
     ...（8-12個程度）
-  ],
-  "quiz3": {{
+  ]''',
+    "quiz3": '''  "quiz3": {
     "question": "（会話の内容に関する日本語の質問）",
     "options": ["選択肢1", "選択肢2", "選択肢3"],
     "correct": 0
-  }},
-  "try_it_hint": "（日本語で、今日の会話をマネして書ける例文のヒント。例：I'm making ... tonight.）"
-}}
-```
+  }''',
+    "try_it_hint": '''  "try_it_hint": "（日本語で、今日の会話をマネして書ける例文のヒント。例：I'm making ... tonight.）"''',
+}
 
-# 重要なルール
+PROMPT_RULES = '''# 重要なルール
 1. 英文は全て英検5級レベル（中学1年生が読める程度）
 2. 使う単語は基本的な日常語彙（600語レベル）
 3. 文は短く、シンプルに
@@ -141,40 +164,935 @@ PROMPT_TEMPLATE = '''あなたは英語教材を作成する専門家です。
 7. vocabリストには必ずその文章で使われている重要単語を含める
 8. クイズの正解は "correct" フィールドで0, 1, 2のいずれかで指定（0が最初の選択肢）
 9. レビューのレストランは景色が良く、カジュアルで落ち着いた雰囲気のお店にする
-10. 30日間でバリエーションを出す（海沿い、山が見える、川沿い、公園の近く、テラス席があるなど）
+10. 30日間でバリエーションを出す（海沿い、山が見える、川沿い、公園の近く、テラス席があるなど）'''
+
+
+def build_system_prompt(sections=None, tools=False):
+    """System prompt asking for `sections` (default: the whole day)
+
+    With tools=True the format is left to the save_day tool schema, so the
+    JSON block (the bulk of the prompt) is not sent and the prompt is the
+    same whatever the sections.
+    """
+    if tools:
+        return f"{PROMPT_HEADER}\n\n{PROMPT_RULES}\n\n指定された料理について、{TOOL_NAME} ツールで教材を提出してください。"
+    sections = sections or list(SECTION_SCHEMAS)
+    schema = ",\n".join(SECTION_SCHEMAS[key] for key in sections)
+    return (
+        f"{PROMPT_HEADER}\n\n{OUTPUT_FORMAT_HEADER}\n\n```json\n{{\n{schema}\n}}\n```\n\n{PROMPT_RULES}\n\n"
+        "指定された料理について、JSONのみを出力してください。"
+    )
+
+
+SYSTEM_PROMPT = build_system_prompt()
+TOOL_SYSTEM_PROMPT = build_system_prompt(tools=True)
+
+# --prefill: the assistant turn starts with the opening brace, and generation
+# stops at a closing fence (so neither the fences nor a remark after them are paid for)
+PREFILL = "{"
+STOP_SEQUENCES = ["```"]
+
+# Last line of a user turn: how the answer is to be given
+JSON_INSTRUCTION = "JSONのみを出力してください。"
+TOOL_INSTRUCTION = f"{TOOL_NAME} ツールで提出してください。"
+
+USER_PROMPT_TEMPLATE = '''# 作成する料理
+{recipe_en}（{recipe_ja}）
+
+recipe.title は "How to Make {recipe_en}" にしてください。
+{instruction}'''
+
+
+SECTION_PROMPT_TEMPLATE = '''# 作成する料理
+{recipe_en}（{recipe_ja}）
+
+既存の教材のうち、次のセクションだけを作り直してください: {sections}
+出力するJSONには、このセクションのキーだけを含めてください。
+
+# 参考: この日の既存の内容（変更しない）
+```json
+{context}
+```
+
+{instruction}'''
+
+# Appended to a section request when the old version was rejected by a check
+FEEDBACK_PROMPT_TEMPLATE = '''
+
+# 前回の出力の問題点（直してください）
+{notes}'''
+
+# Sections whose content a regenerated section has to stay consistent with
+SECTION_CONTEXT = {
+    "recipe_vocab": ["recipe"],
+    "quiz1": ["recipe"],
+    "review": ["recipe"],
+    "review_vocab": ["review"],
+    "quiz2": ["review"],
+    "australia_tips": ["recipe"],
+    "conversation": ["recipe"],
+    "conversation_vocab": ["conversation"],
+    "quiz3": ["conversation"],
+    "try_it_hint": ["conversation"],
+}
+
+
+def estimate_tokens(params):
+    """Rough token reservation for a request: prompt size plus max_tokens"""
+    prompt_chars = sum(len(m["content"]) for m in params["messages"])
+    prompt_chars += sum(len(block["text"]) for block in params.get("system", []))
+    prompt_chars += sum(len(json.dumps(tool, ensure_ascii=False)) for tool in params.get("tools", []))
+    # Japanese text is close to one token per character, English ~4 chars
+    return prompt_chars // 2 + params["max_tokens"]
+
+
+class PromptCacheStats:
+    """Counts prompt-cache hits/misses reported in message.usage"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.read_tokens = 0
+        self.write_tokens = 0
+
+    def record(self, usage):
+        read = getattr(usage, "cache_read_input_tokens", None) or 0
+        written = getattr(usage, "cache_creation_input_tokens", None) or 0
+        with self.lock:
+            if read:
+                self.hits += 1
+            else:
+                self.misses += 1
+            self.read_tokens += read
+            self.write_tokens += written
+
+
+prompt_cache_stats = PromptCacheStats()
+repair_stats = RepairStats()
+
+# HedgePolicy for --hedge (set by main); None sends every request once
+hedge_policy = None
+
+# --tools: answers come back as save_day tool arguments instead of text (set by main)
+use_tools = False
+
+# --prefill: answers start with PREFILL (set by main), and max_tokens comes from
+# this OutputBudget instead of MAX_TOKENS
+use_prefill = False
+output_budget = None
 
-JSONのみを出力してください。'''
 
+def send_message(client, params):
+    """Plain request; returns (message, response headers)"""
+    raw = client.messages.with_raw_response.create(**params)
+    return raw.parse(), raw.headers
 
-def generate_content(client, recipe):
-    """Generate content for a single recipe using Claude API"""
-    prompt = PROMPT_TEMPLATE.format(
+
+def stream_message(client, params, schema=None, cancel=None):
+    """Streamed request whose top level is checked against `schema` as it arrives
+
+    Leaving the stream context on SchemaError closes the connection, so a
+    malformed answer stops producing (billed) output tokens right away.
+    Setting `cancel` (a threading.Event) closes it the same way at the next
+    chunk and raises HedgeCancelled.
+    """
+    validator = DayStreamValidator(schema) if schema is not None else None
+    if validator is not None:
+        # The prefilled "{" is part of the answer but is not streamed back
+        validator.feed(prefill_text(params))
+    received = 0
+    with client.messages.stream(**params) as stream:
+        for event in stream:
+            # Text answers arrive as text deltas, tool arguments (--tools) as partial JSON
+            if event.type == "text":
+                text = event.text
+            elif event.type == "input_json":
+                text = event.partial_json
+            else:
+                continue
+            received += len(text)
+            if validator is not None:
+                validator.feed(text)
+            if cancel is not None and cancel.is_set():
+                raise HedgeCancelled(partial_tokens(stream, params, received))
+        return stream.get_final_message(), stream.response.headers
+
+
+def partial_tokens(stream, params, received_chars):
+    """Tokens billed for a stream closed before it finished (output estimated)"""
+    try:
+        tokens = usage_tokens(stream.current_message_snapshot.usage)
+    except AssertionError:
+        # Closed before message_start: the prompt was still read
+        tokens = {"input_tokens": estimate_tokens(params) - params["max_tokens"]}
+    tokens["output_tokens"] = received_chars // 2
+    return tokens
+
+
+def create_message(client, limiter, stream_schema=None, record=None, **params):
+    """Call the Messages API paced by the rate limiter, retrying on 429/5xx
+
+    With stream_schema the response is streamed and validated on the fly.
+    Requests, retries and token usage are added to `record` (telemetry).
+    """
+    reserved = estimate_tokens(params)
+    for attempt in range(MAX_RETRIES + 1):
+        limiter.acquire(reserved)
+        if record is not None:
+            record["requests"] += 1
+            record["retries"] += attempt > 0
+        try:
+            if hedge_policy is not None:
+                message, headers = hedged_message(client, limiter, params, stream_schema, reserved, record)
+            elif stream_schema is None:
+                message, headers = send_message(client, params)
+            else:
+                message, headers = stream_message(client, params, stream_schema)
+        except anthropic.APIStatusError as e:
+            limiter.settle(reserved, 0)
+            if e.status_code not in RETRYABLE_STATUS or attempt == MAX_RETRIES:
+                raise
+            retry_after = limiter.update_from_headers(e.response.headers)
+            if e.status_code == 429 and retry_after is None:
+                limiter.pause(2 ** attempt)
+            elif retry_after is None:
+                time.sleep(2 ** attempt)
+            continue
+        except anthropic.APIConnectionError:
+            limiter.settle(reserved, 0)
+            if attempt == MAX_RETRIES:
+                raise
+            time.sleep(2 ** attempt)
+            continue
+        except SchemaError:
+            # Usage of an aborted stream is unknown: keep the whole reservation
+            limiter.settle(reserved, reserved)
+            raise
+
+        prompt_cache_stats.record(message.usage)
+        add_usage(record, message)
+        limiter.update_from_headers(headers)
+        limiter.settle(reserved, message.usage.input_tokens + message.usage.output_tokens)
+        return message
+
+
+def hedged_message(client, limiter, params, stream_schema, reserved, record=None):
+    """send_message() with a backup request once the first is slower than
+    hedge_policy's percentile (see hedging.py)
+
+    Both requests stream so the slower one can be closed. The backup is
+    paced by the limiter like any request; the tokens of the answer that
+    is not used are settled there and added to `record` and the policy.
+    """
+    def call(cancel, backup):
+        if backup:
+            limiter.acquire(reserved)
+            if record is not None:
+                record["requests"] += 1
+                record["hedges"] += 1
+        return stream_message(client, params, stream_schema, cancel)
+
+    def on_loser(future):
+        error = future.exception()
+        if error is None:
+            tokens = usage_tokens(future.result()[0].usage)
+        elif isinstance(error, HedgeCancelled):
+            tokens = error.tokens
+        else:
+            if isinstance(error, anthropic.APIStatusError):
+                limiter.update_from_headers(error.response.headers)
+            tokens = {}
+        limiter.settle(reserved, tokens.get("input_tokens", 0) + tokens.get("output_tokens", 0))
+        add_tokens(record, tokens)
+        hedge_policy.add_extra(tokens)
+
+    return hedged_call(hedge_policy, call, on_loser)
+
+
+def build_params(recipe):
+    """Request parameters for one recipe (shared by sync and batch modes)"""
+    prompt = USER_PROMPT_TEMPLATE.format(
         recipe_en=recipe["en"],
-        recipe_ja=recipe["ja"]
+        recipe_ja=recipe["ja"],
+        instruction=TOOL_INSTRUCTION if use_tools else JSON_INSTRUCTION,
     )
-    
-    message = client.messages.create(
-        model="claude-sonnet-4-20250514",
-        max_tokens=4096,
-        messages=[
+    params = {
+        "model": MODEL,
+        "max_tokens": MAX_TOKENS,
+        "system": [
+            {"type": "text", "text": TOOL_SYSTEM_PROMPT if use_tools else SYSTEM_PROMPT,
+             "cache_control": {"type": "ephemeral"}}
+        ],
+        "messages": [
             {"role": "user", "content": prompt}
+        ],
+    }
+    if use_tools:
+        add_tool(params)
+    if use_prefill:
+        add_prefill(params)
+    return params
+
+
+def add_tool(params, sections=None):
+    """Make the request answer through the save_day tool (--tools)
+
+    Tools come before the system prompt in the cached prefix, so the
+    cache_control on the system block covers the schema as well.
+    """
+    params["tools"] = [build_tool(sections)]
+    params["tool_choice"] = {"type": "tool", "name": TOOL_NAME}
+
+
+def add_prefill(params):
+    """Start the answer with PREFILL and stop at STOP_SEQUENCES (--prefill)"""
+    params["messages"].append({"role": "assistant", "content": PREFILL})
+    params["stop_sequences"] = list(STOP_SEQUENCES)
+
+
+def prefill_text(params):
+    """Text the assistant turn was prefilled with ("" if none)"""
+    last = params["messages"][-1]
+    return last["content"] if last["role"] == "assistant" else ""
+
+
+def message_text(message):
+    """Answer of a message as text: the save_day arguments as JSON (--tools), else the text block"""
+    for block in message.content:
+        if block.type == "tool_use":
+            return json.dumps(block.input, ensure_ascii=False)
+    return message.content[0].text
+
+
+def parse_response(response_text):
+    """Extract the day JSON from the model's response text
+
+    Goes through the json_repair stages before giving up, and records which
+    stage succeeded. Raises json.JSONDecodeError if the text is beyond repair.
+    Tool arguments (--tools) are already plain JSON and are read directly.
+    """
+    if use_tools:
+        content = json.loads(response_text)
+        repair_stats.record("direct")
+        return content, "direct"
+    try:
+        content, stage = repair_json(response_text)
+    except json.JSONDecodeError:
+        repair_stats.record("failed")
+        raise
+    repair_stats.record(stage)
+    return content, stage
+
+
+def request_text(client, limiter, params, cache=None, refresh=False, stream_schema=None, label="",
+                 record=None):
+    """Response text for `params`, from the response cache or the API"""
+    key = cache_key(params)
+    response_text = None
+    if cache is not None and not refresh:
+        response_text = cache.get(key)
+    
+    if response_text is None:
+        # The cache key above keeps the fixed MAX_TOKENS, so the budget can change between runs
+        sent = params
+        if output_budget is not None:
+            # Requests asking for the same sections share a system prompt
+            kind = params["system"][0]["text"]
+            sent = {**params, "max_tokens": output_budget.max_tokens(kind)}
+        message = create_message(client, limiter, stream_schema, record, **sent)
+        # Cut off by a reduced budget: the next request gets a bigger one
+        truncated = message.stop_reason == "max_tokens" and sent["max_tokens"] < MAX_TOKENS
+        if output_budget is not None:
+            output_budget.observe(kind, message.usage.output_tokens, truncated)
+        response_text = prefill_text(params) + message_text(message)
+        if cache is not None and not truncated:
+            # A truncated answer would be replayed on every rerun instead of being asked again
+            cache.put(key, response_text, model=MODEL)
+    else:
+        print(f"💾 {label}: キャッシュから読み込み")
+        if record is not None:
+            record["response_cache_hits"] += 1
+    
+    return response_text
+
+
+def generate_content(client, recipe, limiter, cache=None, refresh=False, stream=False, record=None):
+    """Generate content for a single recipe using Claude API
+
+    With a cache, an identical earlier request is answered from disk.
+    refresh=True skips the lookup but still stores the new response.
+    stream=True validates the output while it streams and aborts early
+    (SchemaError) once it is clearly malformed.
+
+    Broken JSON is repaired locally first. Sections lost to a truncated
+    response are filled with a small section request; only output that
+    cannot be repaired at all is requested again in full.
+    """
+    params = build_params(recipe)
+    stream_schema = DAY_SCHEMA if stream else None
+    label = f"Day {recipe['day']}"
+    for attempt in range(PARSE_RETRIES + 1):
+        try:
+            if attempt > 0 and record is not None:
+                record["retries"] += 1
+            response_text = request_text(
+                client, limiter, params, cache, refresh or attempt > 0, stream_schema, label, record
+            )
+            content, stage = parse_response(response_text)
+            if stage == "completed" and not content:
+                # Cut off before the first section: nothing to build on
+                raise json.JSONDecodeError("セクションが1つもありません", response_text, 0)
+            break
+        except (json.JSONDecodeError, SchemaError) as e:
+            if attempt == PARSE_RETRIES:
+                raise
+            print(f"🔁 {label}: 出力を修復できません（{e}） - 再リクエストします")
+    
+    missing = [key for key in DAY_SCHEMA if key not in content]
+    if stage == "completed":
+        # The section the output was cut in is incomplete as well
+        last = list(content)[-1]
+        missing = [key for key in DAY_SCHEMA if key not in content or key == last]
+    if missing:
+        print(f"🩹 {label}: {', '.join(missing)} を追加生成します")
+        params = build_section_params(recipe, missing, content)
+        stream_schema = {key: DAY_SCHEMA[key] for key in missing} if stream else None
+        response_text = request_text(client, limiter, params, cache, refresh, stream_schema, label, record)
+        merge_sections(content, parse_response(response_text)[0], missing)
+    
+    return content
+
+
+def save_day(recipe, content):
+    """Attach meta and write content/dayN.json atomically"""
+    content["meta"] = recipe
+    write_json_atomic(f"content/day{recipe['day']}.json", content)
+    return content
+
+
+def is_valid_day(path):
+    """True if `path` holds a complete day (parses and has every section)"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            content = json.load(f)
+    except (OSError, ValueError):
+        return False
+    return isinstance(content, dict) and all(key in content for key in DAY_SCHEMA)
+
+
+def generate_day(client, recipe, limiter, cache=None, refresh=False, stream=False, record=None,
+                 duplicates=None, checker=None):
+    """Generate one day and save it to content/dayN.json
+
+    With a DuplicateIndex and/or LevelChecker, sections that repeat another
+    day or use words above the level are regenerated before saving.
+    """
+    day = recipe["day"]
+    print(f"🔄 Day {day}: {recipe['en']} を生成中...")
+
+    content = generate_content(client, recipe, limiter, cache, refresh, stream, record)
+    check_day(client, recipe, content, limiter, duplicates, checker, cache, refresh, stream, record)
+    return save_day(recipe, content)
+
+
+def check_day(client, recipe, content, limiter, duplicates=None, checker=None, cache=None, refresh=False,
+              stream=False, record=None, sections=None):
+    """Run the duplicate and level checks on a day, fixing what fails
+
+    Duplicates go first: their fix rewrites whole sections, which the level
+    check then sees. With `sections` (--sections mode) only problems inside
+    them are fixed, and only those sections are rewritten; the rest is just
+    reported. Returns the regenerated sections that lost their translations
+    (see merge_sections).
+    """
+    dropped = []
+    if duplicates is not None:
+        dropped += resolve_duplicates(
+            client, recipe, content, limiter, duplicates, cache, refresh, stream, record, sections
+        )
+    if checker is not None:
+        dropped += resolve_off_level(
+            client, recipe, content, limiter, checker, cache, refresh, stream, record, sections
+        )
+    if duplicates is not None:
+        # Days that kept a repeat, or whose text the level fix changed;
+        # a no-op for a day check_and_add already indexed as it is
+        duplicates.add(recipe["day"], content)
+    return dropped
+
+
+def dependent_sections(sections):
+    """`sections` plus the sections built on them (e.g. quiz2 on review)"""
+    return [
+        key for key in DAY_SCHEMA
+        if key in sections or any(section in sections for section in SECTION_CONTEXT.get(key, []))
+    ]
+
+
+def duplicate_hint(day, found):
+    """Warning for duplicates that are reported but not fixed, with the command that fixes them"""
+    sections = dependent_sections({field.split(".")[0] for field, _, _ in found})
+    return (f"⚠️  Day {day}: {describe_duplicates(found)}"
+            f"（--sections {','.join(sections)} --days {day} で作り直せます）")
+
+
+def resolve_duplicates(client, recipe, content, limiter, duplicates, cache=None, refresh=False,
+                       stream=False, record=None, allowed=None):
+    """Regenerate the sections of `content` that repeat another day
+
+    Only the section holding the repeated field (review or conversation) is
+    asked for again, together with the sections built on it. With `allowed`,
+    repeats outside those sections are only reported and nothing outside
+    them is rewritten. Gives up after DUPLICATE_RETRIES and keeps the last
+    version. Returns the regenerated sections that lost their translations
+    (see merge_sections).
+    """
+    day = recipe["day"]
+    label = f"Day {day}"
+    dropped = []
+    for attempt in range(DUPLICATE_RETRIES + 1):
+        # Indexes the day when it passes, so parallel workers see it at once
+        found = duplicates.check_and_add(day, content)
+        if allowed is not None:
+            outside = [entry for entry in found if entry[0].split(".")[0] not in allowed]
+            found = [entry for entry in found if entry[0].split(".")[0] in allowed]
+            if outside and attempt == 0:
+                print(duplicate_hint(day, outside))
+        if not found:
+            break
+        if attempt == DUPLICATE_RETRIES:
+            print(f"⚠️  {label}: 重複が残っています - {describe_duplicates(found)}")
+            break
+        sections = dependent_sections({field.split(".")[0] for field, _, _ in found})
+        if allowed is not None:
+            sections = [key for key in sections if key in allowed]
+        print(f"🔁 {label}: {describe_duplicates(found)} - {', '.join(sections)} を作り直します")
+        notes = [
+            f"{field}「{field_text(content, field)[:200]}」は他の日とほとんど同じです。違う内容にしてください"
+            for field, _, _ in found
         ]
+        params = build_section_params(recipe, sections, content, notes)
+        stream_schema = {key: DAY_SCHEMA[key] for key in sections} if stream else None
+        # A repeat of the same prompt must not get the rejected answer back from the cache
+        response_text = request_text(
+            client, limiter, params, cache, refresh or attempt > 0, stream_schema, label, record
+        )
+        dropped += merge_sections(content, parse_response(response_text)[0], sections)
+    return dropped
+
+
+def level_hint(day, result, fields):
+    """Warning for off-level fields that are reported but not fixed, with the command that fixes them"""
+    sections = dict.fromkeys(field.split(".")[0] for field in fields)
+    return (f"⚠️  Day {day}: 英検5級レベル外 {describe_off_level(result, fields)}"
+            f"（--sections {','.join(sections)} --days {day} で書き直せます）")
+
+
+def resolve_off_level(client, recipe, content, limiter, checker, cache=None, refresh=False, stream=False,
+                      record=None, allowed=None):
+    """Have sections whose English is above the level rewritten in easier words
+
+    Only the section of a failing field is requested again, with its old
+    version attached, so the meaning (and the vocab and quizzes built on it)
+    stays the same. With `allowed`, failing fields outside those sections
+    are only reported. Gives up after LEVEL_RETRIES and keeps the last version.
+    """
+    label = f"Day {recipe['day']}"
+    dropped = []
+    for attempt in range(LEVEL_RETRIES + 1):
+        result = checker.check(content)
+        if record is not None:
+            record["vocab_coverage"] = min(score["coverage"] for score in result.values())
+        fields = checker.failing(result)
+        if allowed is not None:
+            outside = [field for field in fields if field.split(".")[0] not in allowed]
+            fields = [field for field in fields if field.split(".")[0] in allowed]
+            if outside and attempt == 0:
+                print(level_hint(recipe["day"], result, outside))
+        if not fields:
+            break
+        if attempt == LEVEL_RETRIES:
+            print(f"⚠️  {label}: 英検5級レベル外の単語が残っています - {describe_off_level(result, fields)}")
+            break
+        sections = [key for key in DAY_SCHEMA if key in {field.split(".")[0] for field in fields}]
+        print(f"🔁 {label}: レベル外の単語 {describe_off_level(result, fields)} - {', '.join(sections)} を書き直します")
+        notes = [
+            f"{field} の次の単語は英検5級レベルより難しいので、やさしい単語に言いかえてください: "
+            f"{', '.join(result[field]['off_level'])}" for field in fields
+        ] + [
+            f"内容（意味・手順・登場するもの）は変えないでください。元の {section}:\n"
+            f"{json.dumps(strip_translations(content[section]), ensure_ascii=False)}" for section in sections
+        ]
+        params = build_section_params(recipe, sections, content, notes)
+        stream_schema = {key: DAY_SCHEMA[key] for key in sections} if stream else None
+        # Same as in resolve_duplicates: never replay the answer being rewritten
+        response_text = request_text(
+            client, limiter, params, cache, refresh or attempt > 0, stream_schema, label, record
+        )
+        dropped += merge_sections(content, parse_response(response_text)[0], sections)
+    return dropped
+
+
+def build_section_params(recipe, sections, existing, notes=None):
+    """Reduced request that only asks for `sections` of an existing day
+
+    Sections the requested ones refer to (e.g. review for quiz2) are sent
+    as read-only context so the new content stays consistent with them.
+    `notes` are problems of the previous version the new one has to fix.
+    """
+    context_keys = []
+    for section in sections:
+        for key in SECTION_CONTEXT.get(section, []):
+            if key not in sections and key not in context_keys and key in existing:
+                context_keys.append(key)
+    context = {key: strip_translations(existing[key]) for key in context_keys}
+    
+    prompt = SECTION_PROMPT_TEMPLATE.format(
+        recipe_en=recipe["en"],
+        recipe_ja=recipe["ja"],
+        sections=", ".join(sections),
+        context=json.dumps(context, ensure_ascii=False, indent=2) if context else "（なし）",
+        instruction=TOOL_INSTRUCTION if use_tools else JSON_INSTRUCTION,
     )
+    if notes:
+        prompt += FEEDBACK_PROMPT_TEMPLATE.format(notes="\n".join(f"- {note}" for note in notes))
+    params = {
+        "model": MODEL,
+        "max_tokens": MAX_TOKENS,
+        "system": [
+            {"type": "text", "text": build_system_prompt(sections, use_tools), "cache_control": {"type": "ephemeral"}}
+        ],
+        "messages": [
+            {"role": "user", "content": prompt}
+        ],
+    }
+    if use_tools:
+        add_tool(params, sections)
+    if use_prefill:
+        add_prefill(params)
+    return params
+
+
+def merge_sections(existing, new, sections):
+    """Replace `sections` of an existing day with freshly generated ones
+
+    Everything else - other sections, meta and their translations - is
+    left as is. Returns the regenerated sections that carried translations
+    from add_translations.py; those described the old English text and are
+    not copied over.
+    """
+    dropped = []
+    for section in sections:
+        if section not in new:
+            raise SchemaError(f"'{section}' が出力にありません")
+        if has_translations(existing.get(section)):
+            dropped.append(section)
+        existing[section] = strip_translations(new[section])
+    return dropped
+
+
+def strip_translations(value):
+    """Copy of a section without the Japanese translations (not needed as context)"""
+    if isinstance(value, dict):
+        return {
+            key: strip_translations(item) for key, item in value.items()
+            if not key.endswith("_ja") and key != "translation"
+        }
+    if isinstance(value, list):
+        return [strip_translations(item) for item in value]
+    return value
+
+
+def has_translations(section):
+    if not isinstance(section, dict):
+        return False
+    if any(key.endswith("_ja") for key in section):
+        return True
+    return any("translation" in line for line in section.get("lines", []))
+
+
+def regenerate_sections(client, recipe, sections, limiter, cache=None, refresh=False, stream=False,
+                        record=None, duplicates=None, checker=None):
+    """Regenerate only `sections` of content/dayN.json and merge them in"""
+    day = recipe["day"]
+    path = f"content/day{day}.json"
+    with open(path, "r", encoding="utf-8") as f:
+        existing = json.load(f)
     
-    response_text = message.content[0].text
+    print(f"🔄 Day {day}: {', '.join(sections)} を再生成中...")
+    params = build_section_params(recipe, sections, existing)
+    stream_schema = {key: DAY_SCHEMA[key] for key in sections} if stream else None
+    # Naming a section asks for a new version of it, so never answer from the
+    # cache; the new answer is still stored there
+    response_text = request_text(client, limiter, params, cache, True, stream_schema, f"Day {day}", record)
     
-    # Extract JSON from response
-    if "```json" in response_text:
-        json_str = response_text.split("```json")[1].split("```")[0]
-    elif "```" in response_text:
-        json_str = response_text.split("```")[1].split("```")[0]
+    dropped = merge_sections(existing, parse_response(response_text)[0], sections)
+    # Only the requested sections may change; problems elsewhere are reported
+    dropped += check_day(
+        client, recipe, existing, limiter, duplicates, checker, cache, refresh, stream, record, sections
+    )
+    # Saved translations of the old text would otherwise be merged back in
+    drop_translations(day, list(dict.fromkeys(sections + dropped)))
+    if dropped:
+        print(f"⚠️  Day {day}: {', '.join(dropped)} の日本語訳は古い英文用なので外しました"
+              "（translate.py と add_translations.py で付け直してください）")
+    return save_day(recipe, existing)
+
+
+def run_concurrent(task, recipes, concurrency):
+    """Run task(recipe) on a thread pool, yielding (recipe, content_or_exception)"""
+    recipes = list(recipes)
+    if concurrency > 1 and len(recipes) > 1:
+        # Run one request alone first so the system prompt is in the prompt
+        # cache before the other workers start; otherwise they all miss
+        first = recipes.pop(0)
+        try:
+            yield first, task(first)
+        except Exception as e:
+            yield first, e
+
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    futures = {executor.submit(task, recipe): recipe for recipe in recipes}
+    try:
+        for future in as_completed(futures):
+            try:
+                yield futures[future], future.result()
+            except Exception as e:
+                yield futures[future], e
+    except BaseException:
+        # Ctrl+C, or the caller stopped reading: let the requests in flight
+        # finish, but don't start (and pay for) the days still queued
+        executor.shutdown(wait=True, cancel_futures=True)
+        raise
+    executor.shutdown()
+
+
+def load_batch_id(path=BATCH_STATE_FILE):
+    """Batch ID saved by an earlier --batch run that did not finish"""
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read().strip() or None
+
+
+def wait_for_batch(client, batch_id):
+    """Poll a message batch with exponential backoff until it has ended"""
+    delay = BATCH_POLL_MIN
+    while True:
+        batch = client.messages.batches.retrieve(batch_id)
+        if batch.processing_status == "ended":
+            return batch
+        counts = batch.request_counts
+        print(f"⏳ バッチ処理中: 完了 {counts.succeeded + counts.errored} / "
+              f"残り {counts.processing}（{int(delay)}秒後に再確認）")
+        time.sleep(delay)
+        delay = min(delay * 2, BATCH_POLL_MAX)
+
+
+def report_batch_result(report, recipe, message=None, error=None):
+    """Telemetry line for a day handled in batch mode (no per-day latency)"""
+    if report is None:
+        return
+    record = new_record(recipe)
+    record["batch"] = True
+    if message is None and error is None:
+        record["response_cache_hits"] = 1
     else:
-        json_str = response_text
-    
-    return json.loads(json_str.strip())
+        record["requests"] = 1
+    if message is not None:
+        add_usage(record, message)
+    if error is not None:
+        record["status"] = "failed"
+        record["error"] = str(error)
+    report.add(record)
+
+
+def run_batch(client, recipes, cache=None, refresh=False, batch_id=None, report=None,
+              state_file=BATCH_STATE_FILE):
+    """Generate recipes through the Message Batches API
+
+    Days answered by the cache are saved directly; the rest are submitted
+    as one batch. Passing batch_id (or a saved .batch_id) resumes polling
+    an already submitted batch instead of creating a new one (state_file is
+    where the ID is saved; each --shard has its own); recipes that batch
+    does not contain are sent in a new batch once it is done. Yields
+    (recipe, content_or_exception) as each result is read back.
+    """
+    by_custom_id = {f"day{r['day']}": r for r in recipes}
+    resumed = batch_id is not None
+
+    if batch_id is None:
+        requests = []
+        for recipe in recipes:
+            params = build_params(recipe)
+            response_text = None
+            if cache is not None and not refresh:
+                response_text = cache.get(cache_key(params))
+            if response_text is not None:
+                try:
+                    content, _ = parse_response(response_text)
+                    if all(key in content for key in DAY_SCHEMA):
+                        report_batch_result(report, recipe)
+                        yield recipe, save_day(recipe, content)
+                        continue
+                except json.JSONDecodeError:
+                    pass
+            requests.append({"custom_id": f"day{recipe['day']}", "params": params})
+
+        if not requests:
+            return
+        batch = client.messages.batches.create(requests=requests)
+        batch_id = batch.id
+        write_text_atomic(state_file, batch_id)
+        print(f"📦 バッチ送信: {batch_id}（{len(requests)} 日分）")
+    else:
+        print(f"📦 バッチ再開: {batch_id}")
+
+    wait_for_batch(client, batch_id)
+
+    # Results are streamed as JSONL, so each day is written as soon as it is read
+    for entry in client.messages.batches.results(batch_id):
+        recipe = by_custom_id.pop(entry.custom_id, None)
+        if recipe is None:
+            continue
+        if entry.result.type != "succeeded":
+            error = RuntimeError(f"バッチ結果: {entry.result.type}")
+            report_batch_result(report, recipe, error=error)
+            yield recipe, error
+            continue
+        message = entry.result.message
+        prompt_cache_stats.record(message.usage)
+        response_text = prefill_text(build_params(recipe)) + message_text(message)
+        if cache is not None:
+            cache.put(cache_key(build_params(recipe)), response_text, model=MODEL)
+        try:
+            content, _ = parse_response(response_text)
+            missing = [key for key in DAY_SCHEMA if key not in content]
+            if missing:
+                # Sync mode would fill these in; here the day is simply retried later
+                raise SchemaError(f"キーが不足しています: {', '.join(missing)}")
+        except (json.JSONDecodeError, SchemaError) as e:
+            report_batch_result(report, recipe, message, error=e)
+            yield recipe, e
+            continue
+        report_batch_result(report, recipe, message)
+        yield recipe, save_day(recipe, content)
+
+    if os.path.exists(state_file):
+        os.remove(state_file)
+
+    if resumed and by_custom_id:
+        # Days that became pending after the resumed batch was submitted
+        leftover = list(by_custom_id.values())
+        print(f"📦 バッチ {batch_id} に含まれていない {len(leftover)} 日分"
+              f"（Day {', '.join(str(r['day']) for r in leftover)}）を新しいバッチで送ります")
+        yield from run_batch(client, leftover, cache, refresh, None, report, state_file)
+
+
+def parse_sections(value):
+    """Parse a --sections value into section keys in output order"""
+    sections = {part.strip() for part in value.split(",") if part.strip()}
+    unknown = sections - set(DAY_SCHEMA)
+    if unknown:
+        raise argparse.ArgumentTypeError(f"不明なセクション: {', '.join(sorted(unknown))}")
+    return [key for key in DAY_SCHEMA if key in sections]
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="30日間クッキング英語 - コンテンツ生成")
+    parser.add_argument(
+        "-j", "--concurrency", type=int, default=1,
+        help="同時に生成する日数（デフォルト: 1 = 順番に生成）",
+    )
+    parser.add_argument(
+        "--rpm", type=int, default=DEFAULT_RPM,
+        help=f"1分あたりの最大リクエスト数（デフォルト: {DEFAULT_RPM}、APIヘッダーで自動調整）",
+    )
+    parser.add_argument(
+        "--tpm", type=int, default=DEFAULT_TPM,
+        help=f"1分あたりの最大トークン数（デフォルト: {DEFAULT_TPM}、APIヘッダーで自動調整）",
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help="レスポンスキャッシュを使わない（読み込みも保存もしない）",
+    )
+    parser.add_argument(
+        "--refresh", action="store_true",
+        help="キャッシュを無視してAPIを呼び、結果でキャッシュを上書きする",
+    )
+    parser.add_argument(
+        "--stream", action="store_true",
+        help="ストリーミングで受信し、形式が崩れたら途中で打ち切る",
+    )
+    parser.add_argument(
+        "--tools", action="store_true",
+        help="教材をツール入力（JSON Schema）として受け取る。```json の切り出しや修復が不要になる",
+    )
+    parser.add_argument(
+        "--prefill", action="store_true",
+        help="答えを \"{\" から始めさせて閉じの ``` で止め、max_tokens をこれまでの出力サイズから決める",
+    )
+    parser.add_argument(
+        "--batch", action="store_true",
+        help="Message Batches API でまとめて生成する（料金半額、結果は非同期）",
+    )
+    parser.add_argument(
+        "--batch-id",
+        help="送信済みのバッチIDを指定して結果の取得を再開する（--batch を含む）",
+    )
+    parser.add_argument(
+        "--hedge", type=float, nargs="?", const=DEFAULT_PERCENTILE, metavar="P",
+        help=f"応答がこれまでのPパーセンタイル（デフォルト: {DEFAULT_PERCENTILE}）より遅いとき、"
+             "予備のリクエストを送って先に返った方を使う",
+    )
+    parser.add_argument(
+        "--report",
+        help="実行レポート（JSONL）の保存先（デフォルト: reports/run-日時.jsonl）",
+    )
+    parser.add_argument(
+        "--recipes", default=RECIPES_FILE,
+        help=f"料理の一覧（JSONまたはCSV、デフォルト: {RECIPES_FILE}）",
+    )
+    parser.add_argument(
+        "--shard", type=parse_shard,
+        help="i/N: N個のプロセスで分担するときの担当分（例: 2/4）。同じ content/ に同時に書けます",
+    )
+    parser.add_argument(
+        "--days", type=parse_days,
+        help="対象の日を指定する（例: 5 / 1,3,5 / 1-10）",
+    )
+    parser.add_argument(
+        "--no-dedup", action="store_true",
+        help="他の日との重複チェック（レビューの店名・場所・本文と会話）をしない",
+    )
+    parser.add_argument(
+        "--no-level-check", action="store_true",
+        help="英検5級レベルの語彙チェック（レシピ手順・レビュー・会話）をしない",
+    )
+    parser.add_argument(
+        "--sections", type=parse_sections,
+        help=f"既存の日のこのセクションだけを再生成する（例: quiz2,conversation）。"
+             f"指定可能: {', '.join(DAY_SCHEMA)}",
+    )
+    args = parser.parse_args()
+    if args.batch_id:
+        args.batch = True
+    if args.batch and args.sections:
+        parser.error("--sections は --batch と同時に使えません")
+    if args.concurrency < 1:
+        parser.error("--concurrency は1以上を指定してください")
+    if args.tools and args.prefill:
+        parser.error("--prefill は --tools と同時に使えません（ツールの入力はもともとJSONです）")
+    if args.hedge is not None and not 50 <= args.hedge < 100:
+        parser.error("--hedge は50以上100未満のパーセンタイルを指定してください")
+    return args
 
 
 def main():
+    global hedge_policy, use_tools, use_prefill, output_budget
+    args = parse_args()
+
     # Check for API key
     api_key = os.environ.get("ANTHROPIC_API_KEY")
     if not api_key:
@@ -186,58 +1104,185 @@ def main():
         print("APIキーは https://console.anthropic.com/ で取得できます")
         sys.exit(1)
     
-    client = anthropic.Anthropic(api_key=api_key)
+    try:
+        recipes = [r for r in load_recipes(args.recipes) if in_shard(r["day"], args.shard)]
+    except (OSError, ValueError) as e:
+        print(f"❌ レシピ一覧を読み込めません: {e}")
+        sys.exit(1)
+    
+    # Retries are handled in create_message() so the limiter sees every 429
+    client = anthropic.Anthropic(api_key=api_key, max_retries=0)
+    limiter = RateLimiter(args.rpm, args.tpm)
+    cache = None if args.no_cache else ResponseCache()
+    if args.hedge is not None:
+        hedge_policy = HedgePolicy(args.hedge)
+    use_tools = args.tools
+    use_prefill = args.prefill
+    if args.prefill and not args.batch:
+        # Batch requests are all built before any answer has been seen
+        output_budget = OutputBudget(MAX_TOKENS)
     
     os.makedirs("content", exist_ok=True)
     
-    all_content = {}
-    success_count = 0
-    
     print("🍳 30日間クッキング英語 - コンテンツ生成開始")
+    if args.batch:
+        print("⚙️  モード: Message Batches")
+    else:
+        print(f"⚙️  同時実行数: {args.concurrency}")
+        if args.hedge is not None:
+            print(f"⚙️  ヘッジ: 応答がp{args.hedge:g}より遅ければ予備リクエストを送信")
+    if args.tools:
+        print(f"⚙️  出力: {TOOL_NAME} ツールの入力（構造化出力）")
+    if args.prefill:
+        print(f"⚙️  出力: \"{PREFILL}\" から開始、``` で停止、max_tokens は出力サイズから見積もり")
+    if args.shard:
+        print("⚙️  シャード: {}/{}（{} 日分を担当）".format(*args.shard, len(recipes)))
     print("=" * 50)
     
-    for recipe in RECIPES:
+    # Every shard keeps its own journal, aggregate and batch ID so that
+    # processes sharing content/ never rewrite each other's files
+    suffix = shard_suffix(args.shard)
+    journal = RunJournal(os.path.join("content", f".journal{suffix}.jsonl"))
+    aggregate = ContentAggregate(os.path.join("content", f"all_content{suffix}.ndjson"))
+    batch_state_file = BATCH_STATE_FILE + suffix
+    duplicates = None
+    if not args.no_dedup:
+        # Other shards' signatures are read too, so repeats across shards are caught
+        duplicates = DuplicateIndex(
+            os.path.join("content", f".duplicates{suffix}.jsonl"),
+            glob.glob(os.path.join("content", ".duplicates*.jsonl")),
+        )
+    checker = None if args.no_level_check else LevelChecker()
+    if args.shard:
+        # Only this shard's leftovers: other shards may be writing right now
+        remove_stale_temp_files("content", [f"day{r['day']}.json" for r in recipes] + [
+            os.path.basename(journal.path), os.path.basename(aggregate.index_path),
+            f".duplicates{suffix}.jsonl",
+        ])
+    else:
+        remove_stale_temp_files("content")
+    if aggregate.dead_bytes() > aggregate.live_bytes():
+        # Mostly superseded versions of regenerated days: rewrite once
+        aggregate.compact()
+    # Days with a content file: on disk already, or written by this run
+    available = set()
+    
+    pending = []
+    for recipe in recipes:
         day = recipe["day"]
+        path = f"content/day{day}.json"
+        exists = os.path.exists(path)
+        if exists and journal.get(day) != "done":
+            # Not confirmed by the journal (in flight when a run was killed,
+            # or written before the journal existed): check it once
+            if is_valid_day(path):
+                journal.record(day, "done")
+            else:
+                print(f"⚠️  Day {day}: 壊れたJSONがあります - 作り直します")
+                exists = False
+        selected = args.days is None or day in args.days
         
-        # Skip if already generated
-        if os.path.exists(f"content/day{day}.json"):
+        if selected and args.sections:
+            # Section mode only works on days that already exist
+            if exists:
+                pending.append(recipe)
+            else:
+                print(f"⏭️  Day {day}: {recipe['en']} - スキップ（JSONがありません。先に生成してください）")
+        elif selected and not exists:
+            pending.append(recipe)
+        elif selected:
+            # Skip if already generated
             print(f"⏭️  Day {day}: {recipe['en']} - スキップ（既存）")
-            with open(f"content/day{day}.json", "r", encoding="utf-8") as f:
-                all_content[f"day{day}"] = json.load(f)
-            success_count += 1
-            continue
         
-        print(f"🔄 Day {day}: {recipe['en']} を生成中...")
-        
-        try:
-            content = generate_content(client, recipe)
-            content["meta"] = recipe
-            all_content[f"day{day}"] = content
-            
-            # Save individual file
-            with open(f"content/day{day}.json", "w", encoding="utf-8") as f:
-                json.dump(content, f, ensure_ascii=False, indent=2)
-            
-            print(f"✅ Day {day}: {recipe['en']} 完了")
-            success_count += 1
-            
-            # Rate limiting - wait between requests
-            if day < 30:
-                time.sleep(1)
-                
-        except json.JSONDecodeError as e:
-            print(f"❌ Day {day}: JSONパースエラー - {e}")
-            continue
-        except Exception as e:
-            print(f"❌ Day {day}: エラー - {e}")
-            continue
+        if exists:
+            available.add(day)
+            if day not in aggregate:
+                # Written before the aggregate existed (or lost in a crash)
+                with open(path, "r", encoding="utf-8") as f:
+                    aggregate.append(day, json.load(f))
+            if duplicates is not None and day not in duplicates:
+                duplicates.add(day, aggregate.read(day))
+    
+    report = RunReport(args.report, suffix)
+    if args.sections:
+        def task(recipe):
+            with report.track(recipe) as record:
+                return regenerate_sections(
+                    client, recipe, args.sections, limiter, cache, args.refresh, args.stream, record, duplicates, checker
+                )
+    else:
+        def task(recipe):
+            journal.record(recipe["day"], "started")
+            with report.track(recipe) as record:
+                return generate_day(
+                    client, recipe, limiter, cache, args.refresh, args.stream, record, duplicates, checker
+                )
     
-    # Save all content to single file
-    with open("content/all_content.json", "w", encoding="utf-8") as f:
-        json.dump(all_content, f, ensure_ascii=False, indent=2)
+    if not pending:
+        results = []
+    elif args.batch:
+        batch_id = args.batch_id or load_batch_id(batch_state_file)
+        for recipe in pending:
+            journal.record(recipe["day"], "started")
+        results = run_batch(client, pending, cache, args.refresh, batch_id, report, batch_state_file)
+    else:
+        results = run_concurrent(task, pending, args.concurrency)
     
+    # Results arrive out of order in both modes
+    failed_count = 0
+    try:
+        for finished, (recipe, result) in enumerate(results, 1):
+            day = recipe["day"]
+            progress = f"[{finished}/{len(pending)}]"
+            if isinstance(result, Exception):
+                failed_count += 1
+                if not args.sections:
+                    journal.record(day, "failed", error=str(result))
+            elif not args.sections:
+                journal.record(day, "done")
+            if isinstance(result, json.JSONDecodeError):
+                print(f"❌ {progress} Day {day}: JSONパースエラー - {result}")
+            elif isinstance(result, SchemaError):
+                print(f"❌ {progress} Day {day}: スキーマエラー - {result}")
+            elif isinstance(result, Exception):
+                print(f"❌ {progress} Day {day}: エラー - {result}")
+            else:
+                if args.batch and duplicates is not None:
+                    # Batch results cannot be re-requested section by section here
+                    found = duplicates.check(day, result)
+                    if found:
+                        print(duplicate_hint(day, found))
+                    duplicates.add(day, result)
+                if args.batch and checker is not None:
+                    level = checker.check(result)
+                    fields = checker.failing(level)
+                    if fields:
+                        print(level_hint(day, level, fields))
+                available.add(day)
+                aggregate.append(day, result)
+                print(f"✅ {progress} Day {day}: {recipe['en']} 完了")
+    finally:
+        # Closing run_concurrent's generator (e.g. on Ctrl+C) cancels the days it still has queued
+        if hasattr(results, "close"):
+            results.close()
+
     print("=" * 50)
-    print(f"✅ 生成完了: {success_count}/30 日分")
+    report.print_summary()
+    if hedge_policy is not None:
+        print(hedge_policy.summary())
+    if output_budget is not None:
+        print(output_budget.summary())
+    if cache is not None:
+        print(f"💾 キャッシュ: ヒット {cache.hits} / ミス {cache.misses}")
+    stats = prompt_cache_stats
+    if stats.hits or stats.misses:
+        print(f"🧠 プロンプトキャッシュ: ヒット {stats.hits} / ミス {stats.misses}"
+              f"（読込 {stats.read_tokens} / 書込 {stats.write_tokens} トークン）")
+    if any(repair_stats.counts[stage] for stage in ("balanced", "fixed", "completed", "failed")):
+        print(f"🩹 JSON修復: {repair_stats.summary()}")
+    print(f"✅ 生成完了: {len(available)}/{len(recipes)} 日分")
+    if failed_count:
+        print(f"❌ 失敗: {failed_count} 日分")
     print("📁 content/ フォルダにJSONファイルが保存されました")
     print("")
     print("次のステップ:")
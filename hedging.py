@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+30日間クッキング英語 - ヘッジリクエスト
+
+まれに中央値の3〜4倍かかる応答があり、それが全体の所要時間を決めてしまいます。
+--hedge 95 を付けると、これまでの応答時間の95パーセンタイルを過ぎても返ってこない
+リクエストについて、同じ内容の予備リクエストをもう1本送り、先に返ってきた方を使って
+もう片方はその場で打ち切ります（ストリーミングなので、打ち切った後の出力トークンは発生しません）。
+
+最後に、ヘッジした回数、予備が先着した回数、短縮できた時間（推定）と追加のトークン・費用を表示します。
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from telemetry import PRICES, TOKEN_FIELDS, percentile
+
+DEFAULT_PERCENTILE = 95
+# No hedging until this many responses have been timed
+MIN_SAMPLES = 10
+# Only the most recent latencies count, so the delay follows the API's current speed
+MAX_SAMPLES = 500
+
+
+class HedgeCancelled(Exception):
+    """The other request of a hedged pair answered first
+
+    `tokens` holds the usage billed before the stream was closed
+    ({field: count}, output estimated from the text received).
+    """
+
+    def __init__(self, tokens):
+        super().__init__("ヘッジの相手が先に応答しました")
+        self.tokens = tokens
+
+
+class HedgePolicy:
+    """When to send the backup request, and what hedging saved and cost"""
+
+    def __init__(self, p=DEFAULT_PERCENTILE, min_samples=MIN_SAMPLES):
+        self.percentile = p
+        self.min_samples = min_samples
+        self.lock = threading.Lock()
+        self.latencies = deque(maxlen=MAX_SAMPLES)
+        self.calls = 0
+        self.hedged = 0
+        self.backup_wins = 0
+        self.saved_seconds = 0.0
+        self.extra_tokens = {field: 0 for field in TOKEN_FIELDS}
+
+    def delay(self):
+        """Seconds to wait before the backup request, or None (not enough data yet)"""
+        with self.lock:
+            if len(self.latencies) < self.min_samples:
+                return None
+            return percentile(list(self.latencies), self.percentile)
+
+    def observe(self, seconds):
+        with self.lock:
+            self.latencies.append(seconds)
+
+    def expected_latency_beyond(self, elapsed):
+        """Mean of the observed latencies longer than `elapsed` (None if there are none)"""
+        with self.lock:
+            longer = [latency for latency in self.latencies if latency > elapsed]
+        return sum(longer) / len(longer) if longer else None
+
+    def record(self, hedged, backup_won, elapsed):
+        """Count one finished call; `elapsed` is measured from the first request"""
+        saved = 0.0
+        if backup_won:
+            # The primary had not answered after `elapsed`; compare with how
+            # long such slow responses took when they were left to finish
+            expected = self.expected_latency_beyond(elapsed)
+            saved = max(0.0, expected - elapsed) if expected is not None else 0.0
+        with self.lock:
+            self.calls += 1
+            self.hedged += hedged
+            self.backup_wins += backup_won
+            self.saved_seconds += saved
+
+    def add_extra(self, tokens):
+        """Tokens billed for a request whose answer was not used"""
+        with self.lock:
+            for field in TOKEN_FIELDS:
+                self.extra_tokens[field] += tokens.get(field, 0)
+
+    def extra_cost(self):
+        return sum(self.extra_tokens[field] * price for field, price in PRICES.items()) / 1_000_000
+
+    def summary(self):
+        delay = self.delay()
+        threshold = f"p{self.percentile:g} = {delay:.1f}秒" if delay is not None else f"p{self.percentile:g}"
+        extra_input = sum(self.extra_tokens[field] for field in TOKEN_FIELDS if field != "output_tokens")
+        return (
+            f"🪁 ヘッジ（{threshold}）: {self.hedged}/{self.calls} リクエスト / 予備が先着 {self.backup_wins} / "
+            f"短縮 推定 {self.saved_seconds:.1f}秒 / 追加 入力 {extra_input:,}・出力 "
+            f"{self.extra_tokens['output_tokens']:,} トークン（${self.extra_cost():.3f}）"
+        )
+
+
+def hedged_call(policy, call, on_loser):
+    """Run call(cancel, backup) and, if it is slow, a backup copy; first answer wins
+
+    call must return a result, or raise HedgeCancelled soon after its
+    `cancel` event is set. on_loser(future) is called once the request whose
+    answer was not used has finished, to account for what it cost. If both
+    fail, on_loser gets the backup and the first request's exception is raised.
+    """
+    started = time.monotonic()
+    delay = policy.delay()
+    executor = ThreadPoolExecutor(max_workers=2)
+    cancels = [threading.Event()]
+    futures = [executor.submit(call, cancels[0], False)]
+    if delay is not None:
+        done, _ = wait(futures, timeout=delay)
+        if not done:
+            cancels.append(threading.Event())
+            futures.append(executor.submit(call, cancels[1], True))
+    executor.shutdown(wait=False)
+
+    winner = None
+    pending = set(futures)
+    while pending and winner is None:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is None and winner is None:
+                winner = future
+    elapsed = time.monotonic() - started
+    if winner is None:
+        # The caller settles the first request; the backup is ours to account for
+        for future in futures[1:]:
+            on_loser(future)
+        raise futures[0].exception()
+
+    backup_won = winner is not futures[0]
+    policy.observe(elapsed - delay if backup_won else elapsed)
+    policy.record(len(futures) > 1, backup_won, elapsed)
+    for cancel, future in zip(cancels, futures):
+        if future is not winner:
+            cancel.set()
+            future.add_done_callback(on_loser)
+    return winner.result()
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+30日間クッキング英語 - JSON修復
+
+モデルの出力がそのままでは json.loads できないとき、再リクエストする前に
+次の順番で修復を試します。
+
+1. direct    - ```json フェンスの中身をそのままパース
+2. balanced  - 最初の { から対応する } までを切り出す（前後の余計な文章を除去）
+3. fixed     - 末尾カンマ、カンマ抜け、スマートクォート、文字列中の " や改行を修正
+4. completed - 途中で切れた出力を、最後に完結している値までで閉じる
+"""
+
+import json
+import threading
+
+STAGES = ("direct", "balanced", "fixed", "completed")
+
+# Opening smart quote -> the quote that closes it
+SMART_QUOTES = {"“": "”"}
+
+
+class RepairStats:
+    """How many responses each stage recovered (thread-safe)"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counts = {stage: 0 for stage in STAGES + ("failed",)}
+
+    def record(self, stage):
+        with self.lock:
+            self.counts[stage] += 1
+
+    def summary(self):
+        return " / ".join(f"{stage} {count}" for stage, count in self.counts.items())
+
+
+def extract_fenced(text):
+    """The part inside ```json fences (or the whole text if there are none)"""
+    if "```json" in text:
+        text = text.split("```json")[1].split("```")[0]
+    elif "```" in text:
+        text = text.split("```")[1].split("```")[0]
+    return text.strip()
+
+
+def extract_balanced(text):
+    """The first complete {...} object in `text`, ignoring braces in strings"""
+    start = text.find("{")
+    if start == -1:
+        return None
+    depth = 0
+    in_string = False
+    escape = False
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_string:
+            if escape:
+                escape = False
+            elif ch == "\\":
+                escape = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    return None
+
+
+def _next_significant(text, i):
+    """(index, char, crossed_newline) of the next non-whitespace char from i"""
+    newline = False
+    while i < len(text) and text[i].isspace():
+        newline = newline or text[i] == "\n"
+        i += 1
+    return i, (text[i] if i < len(text) else ""), newline
+
+
+def fix_common_errors(text):
+    """Fix the mistakes models typically make when writing JSON by hand
+
+    - trailing commas before } or ]
+    - missing commas between values on separate lines
+    - smart quotes used as string delimiters
+    - unescaped " inside strings, raw newlines and tabs inside strings
+    """
+    out = []
+    in_string = False
+    closer = '"'
+    i = 0
+    while i < len(text):
+        ch = text[i]
+        if in_string:
+            if ch == "\\":
+                out.append(text[i:i + 2])
+                i += 2
+                continue
+            if ch == closer or ch == '"':
+                _, following, newline = _next_significant(text, i + 1)
+                if following in (",", ":", "}", "]", "") or (following == '"' and newline):
+                    out.append('"')
+                    in_string = False
+                    if following == '"':
+                        out.append(",")
+                else:
+                    out.append('\\"')
+            elif ch == "\n":
+                out.append("\\n")
+            elif ch == "\t":
+                out.append("\\t")
+            else:
+                out.append(ch)
+        elif ch == '"' or ch in SMART_QUOTES:
+            in_string = True
+            closer = SMART_QUOTES.get(ch, '"')
+            out.append('"')
+        elif ch == ",":
+            _, following, _ = _next_significant(text, i + 1)
+            if following not in ("}", "]"):
+                out.append(ch)
+        elif ch in "}]":
+            out.append(ch)
+            _, following, newline = _next_significant(text, i + 1)
+            if newline and following in ('"', "{"):
+                out.append(",")
+        else:
+            out.append(ch)
+        i += 1
+    return "".join(out)
+
+
+def complete_truncated(text):
+    """Close a cut-off JSON document after its last complete value
+
+    Remembers every position where the document could be cut and still
+    be closed validly (after an opening bracket, after a finished value),
+    together with the open brackets at that point.
+    """
+    start = text.find("{")
+    if start == -1:
+        return None
+    stack = []
+    cut = None
+    in_string = False
+    escape = False
+    string_is_key = False
+    last = ""
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_string:
+            if escape:
+                escape = False
+            elif ch == "\\":
+                escape = True
+            elif ch == '"':
+                in_string = False
+                last = '"'
+                if not string_is_key:
+                    cut = (i + 1, "".join(stack))
+            continue
+        if ch.isspace():
+            continue
+        if ch == '"':
+            in_string = True
+            string_is_key = bool(stack) and stack[-1] == "}" and last in ("{", ",")
+        elif ch in "{[":
+            stack.append("}" if ch == "{" else "]")
+            cut = (i + 1, "".join(stack))
+        elif ch in "}]":
+            if not stack:
+                break
+            stack.pop()
+            cut = (i + 1, "".join(stack))
+            if not stack:
+                return text[start:i + 1]
+        elif ch == "," and last not in ("{", "[", ","):
+            cut = (i, "".join(stack))
+        last = ch
+    if cut is None:
+        return None
+    end, open_brackets = cut
+    return text[start:end] + open_brackets[::-1]
+
+
+def _loads_object(candidate):
+    if candidate is None:
+        raise json.JSONDecodeError("JSONが見つかりません", "", 0)
+    data = json.loads(candidate)
+    if not isinstance(data, dict):
+        raise json.JSONDecodeError("JSONオブジェクトではありません", candidate, 0)
+    return data
+
+
+def repair_json(text):
+    """Parse a model response, repairing it if needed
+
+    Returns (data, stage) with the first stage that produced a JSON object.
+    Raises json.JSONDecodeError if none did.
+    """
+    fenced = extract_fenced(text)
+    try:
+        return _loads_object(fenced), "direct"
+    except json.JSONDecodeError as e:
+        error = e
+
+    balanced = extract_balanced(text)
+    if balanced is not None and balanced != fenced:
+        try:
+            return _loads_object(balanced), "balanced"
+        except json.JSONDecodeError:
+            pass
+
+    source = balanced if balanced is not None else fenced
+    if "{" in source:
+        source = source[source.find("{"):]
+    fixed = fix_common_errors(source)
+    try:
+        return _loads_object(fixed), "fixed"
+    except json.JSONDecodeError:
+        pass
+
+    try:
+        return _loads_object(complete_truncated(fixed)), "completed"
+    except json.JSONDecodeError:
+        raise error
@@ -0,0 +1,495 @@
+#!/usr/bin/env python3
+"""
+30日間クッキング英語 - ローカル用のAnthropic APIモック
+
+content/dayN.json を「モデルの応答」として返す、お金もネットワークも使わない
+テスト・ベンチマーク用サーバーです。Messages API（ストリーミング含む）と
+Message Batches API の最低限の部分を実装しています。
+
+使い方:
+  python mock_server.py --port 8787 --latency 2 --jitter 0.5 --error-rate 0.05 --rate-limit-rate 0.05
+
+  # 別のターミナルで
+  ANTHROPIC_BASE_URL=http://localhost:8787 ANTHROPIC_API_KEY=mock python generate_content.py -j 8
+"""
+
+import argparse
+import glob
+import itertools
+import json
+import math
+import os
+import random
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+CONTENT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "content")
+
+# Rough chars-per-token used for the usage numbers in responses
+CHARS_PER_TOKEN = 2
+
+SECTION_REQUEST = re.compile(r"次のセクションだけを作り直してください: ([\w, ]+)")
+# translate.py: a JSON list of {"id", "kind", "text"} items to translate
+TRANSLATION_REQUEST = re.compile(r"# 訳す文\n```json\n(.*?)\n```", re.DOTALL)
+
+
+def strip_translations(value):
+    """Canned days carry translations a fresh model answer would not have"""
+    if isinstance(value, dict):
+        return {
+            key: strip_translations(item) for key, item in value.items()
+            if not key.endswith("_ja") and key not in ("translation", "meta")
+        }
+    if isinstance(value, list):
+        return [strip_translations(item) for item in value]
+    return value
+
+
+def load_canned_days(content_dir=CONTENT_DIR):
+    """Map "English（日本語）" recipe labels to the day JSON to replay"""
+    canned = {}
+    for path in sorted(glob.glob(os.path.join(content_dir, "day*.json"))):
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        meta = data.get("meta", {})
+        canned[f"{meta.get('en')}（{meta.get('ja')}）"] = strip_translations(data)
+    return canned
+
+
+def load_canned_translations(content_dir=CONTENT_DIR):
+    """Map the English texts of content/ to the Japanese translations they carry"""
+    known = {}
+    for path in sorted(glob.glob(os.path.join(content_dir, "day*.json"))):
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        recipe = data.get("recipe", {})
+        review = data.get("review", {})
+        pairs = [(recipe.get("intro"), recipe.get("intro_ja")), (review.get("content"), review.get("content_ja"))]
+        pairs += list(zip(recipe.get("steps", []), recipe.get("steps_ja", [])))
+        pairs += [(line.get("text"), line.get("translation")) for line in data.get("conversation", {}).get("lines", [])]
+        known.update((english, japanese) for english, japanese in pairs if english and japanese)
+    return known
+
+
+def iso_time(seconds_from_now=0.0):
+    moment = datetime.now(timezone.utc) + timedelta(seconds=seconds_from_now)
+    return moment.isoformat().replace("+00:00", "Z")
+
+
+def count_tokens(text):
+    return max(1, len(text) // CHARS_PER_TOKEN)
+
+
+def request_text(body):
+    """All prompt text of a request (system blocks and user messages)"""
+    system = body.get("system", "")
+    if isinstance(system, list):
+        system = "".join(block.get("text", "") for block in system)
+    parts = [system]
+    for message in body.get("messages", []):
+        content = message.get("content", "")
+        if isinstance(content, list):
+            content = "".join(block.get("text", "") for block in content)
+        parts.append(content)
+    return "\n".join(parts)
+
+
+def assistant_prefill(body):
+    """Text the request prefilled the assistant turn with ("" if none)"""
+    messages = body.get("messages") or [{}]
+    content = messages[-1].get("content", "") if messages[-1].get("role") == "assistant" else ""
+    return content if isinstance(content, str) else "".join(block.get("text", "") for block in content)
+
+
+def stop_sequence(body, stop_reason):
+    """The stop sequence that ended an answer (the first one requested)"""
+    if stop_reason != "stop_sequence":
+        return None
+    return (body.get("stop_sequences") or [None])[0]
+
+
+def tool_name(body):
+    """Name of the tool a request forces with tool_choice, or None"""
+    choice = body.get("tool_choice") or {}
+    return choice.get("name") if choice.get("type") == "tool" else None
+
+
+def content_block(body, text):
+    """The answer as a text block, or as a tool_use block when a tool is forced"""
+    name = tool_name(body)
+    if name is None:
+        return {"type": "text", "text": text}
+    try:
+        arguments = json.loads(text)
+    except ValueError:
+        # Cut off by max_tokens: the arguments received so far do not parse
+        arguments = {}
+    return {"type": "tool_use", "id": "toolu_mock", "name": name, "input": arguments}
+
+
+class MockAnthropicServer(ThreadingHTTPServer):
+    """Server state shared by all handler threads"""
+
+    daemon_threads = True
+
+    def __init__(self, address, options, canned=None):
+        super().__init__(address, MockAnthropicHandler)
+        self.options = options
+        self.canned = canned if canned is not None else load_canned_days()
+        self.fallback = next(iter(self.canned.values()), {})
+        self.translations = load_canned_translations()
+        self.lock = threading.Lock()
+        self.ids = itertools.count(1)
+        self.cached_prefixes = set()
+        self.batches = {}
+        self.stats = {"requests": 0, "ok": 0, "429": 0, "5xx": 0}
+        # Server-side RPM bucket (only enforced when options.rpm is set)
+        self.bucket = float(options.rpm or 0)
+        self.bucket_updated = time.monotonic()
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def take_request_slot(self):
+        """Apply the RPM limit; returns the retry-after seconds if exhausted"""
+        rpm = self.options.rpm
+        if not rpm:
+            return None
+        with self.lock:
+            now = time.monotonic()
+            self.bucket = min(rpm, self.bucket + (now - self.bucket_updated) * rpm / 60.0)
+            self.bucket_updated = now
+            if self.bucket < 1:
+                return math.ceil((1 - self.bucket) * 60.0 / rpm)
+            self.bucket -= 1
+            return None
+
+    def rate_limit_headers(self):
+        options = self.options
+        headers = {}
+        if options.rpm:
+            remaining = max(0, int(self.bucket))
+            headers.update({
+                "anthropic-ratelimit-requests-limit": str(options.rpm),
+                "anthropic-ratelimit-requests-remaining": str(remaining),
+                "anthropic-ratelimit-requests-reset": iso_time((options.rpm - remaining) * 60.0 / options.rpm),
+            })
+        if options.tpm:
+            headers.update({
+                "anthropic-ratelimit-tokens-limit": str(options.tpm),
+                "anthropic-ratelimit-tokens-remaining": str(options.tpm),
+                "anthropic-ratelimit-tokens-reset": iso_time(),
+            })
+        return headers
+
+    def count(self, key):
+        with self.lock:
+            self.stats[key] += 1
+
+    def latency(self):
+        """One sampled response time: latency ± jitter, sometimes a slow outlier"""
+        latency = max(0.0, random.gauss(self.options.latency, self.options.jitter))
+        if random.random() < self.options.tail_rate:
+            latency *= self.options.tail_factor
+        return latency
+
+    def answer(self, body):
+        """(text, stop_reason, usage) the fake model gives for a request"""
+        prompt = request_text(body)
+        translation = TRANSLATION_REQUEST.search(prompt)
+        if translation:
+            # Known texts get their translation from content/, others a marked copy
+            items = json.loads(translation.group(1))
+            day = {item["id"]: self.translations.get(item["text"], f"（訳）{item['text']}") for item in items}
+        else:
+            day = next((data for label, data in self.canned.items() if label in prompt), self.fallback)
+            match = SECTION_REQUEST.search(prompt)
+            if match:
+                keys = [key.strip() for key in match.group(1).split(",")]
+                day = {key: day[key] for key in keys if key in day}
+        if tool_name(body):
+            # Tool arguments are plain JSON, without the fence
+            text = json.dumps(day, ensure_ascii=False)
+        else:
+            text = "```json\n" + json.dumps(day, ensure_ascii=False, indent=2) + "\n```"
+
+        prefill = assistant_prefill(body)
+        if prefill and prefill in text:
+            # The model continues after the prefilled start of its answer
+            text = text[text.index(prefill) + len(prefill):]
+
+        stop_reason = "end_turn"
+        stops = [text.find(sequence) for sequence in body.get("stop_sequences") or [] if sequence in text]
+        if stops:
+            text = text[:min(stops)]
+            stop_reason = "stop_sequence"
+        max_chars = body.get("max_tokens", 4096) * CHARS_PER_TOKEN
+        if len(text) > max_chars:
+            text = text[:max_chars]
+            stop_reason = "max_tokens"
+
+        tools = json.dumps(body.get("tools", []), ensure_ascii=False) if body.get("tools") else ""
+        usage = {
+            "input_tokens": count_tokens(prompt + tools),
+            "output_tokens": count_tokens(text),
+            "cache_creation_input_tokens": 0,
+            "cache_read_input_tokens": 0,
+        }
+        system = body.get("system")
+        if isinstance(system, list) and any("cache_control" in block for block in system):
+            # Tools come first in the cached prefix
+            prefix = tools + "".join(block.get("text", "") for block in system)
+            prefix_tokens = count_tokens(prefix)
+            usage["input_tokens"] = max(1, usage["input_tokens"] - prefix_tokens)
+            with self.lock:
+                hit = prefix in self.cached_prefixes
+                self.cached_prefixes.add(prefix)
+            usage["cache_read_input_tokens" if hit else "cache_creation_input_tokens"] = prefix_tokens
+        return text, stop_reason, usage
+
+    def message(self, body, text, stop_reason, usage):
+        return {
+            "id": f"msg_mock_{next(self.ids)}",
+            "type": "message",
+            "role": "assistant",
+            "model": body.get("model", "mock"),
+            "content": [content_block(body, text)],
+            "stop_reason": "tool_use" if tool_name(body) and stop_reason == "end_turn" else stop_reason,
+            "stop_sequence": stop_sequence(body, stop_reason),
+            "usage": usage,
+        }
+
+
+class MockAnthropicHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_json(self, status, payload, headers=None):
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(data)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def send_error_json(self, status, error_type, message, headers=None):
+        payload = {"type": "error", "error": {"type": error_type, "message": message}}
+        self.send_json(status, payload, headers)
+
+    def read_body(self):
+        length = int(self.headers.get("content-length") or 0)
+        return json.loads(self.rfile.read(length) or b"{}")
+
+    def do_POST(self):
+        path = urlparse(self.path).path
+        body = self.read_body()
+        if path == "/v1/messages":
+            self.handle_message(body)
+        elif path == "/v1/messages/batches":
+            self.handle_batch_create(body)
+        else:
+            self.send_error_json(404, "not_found_error", f"Unknown path {path}")
+
+    def do_GET(self):
+        path = urlparse(self.path).path
+        match = re.fullmatch(r"/v1/messages/batches/([\w-]+)(/results)?", path)
+        if not match:
+            self.send_error_json(404, "not_found_error", f"Unknown path {path}")
+        elif match.group(2):
+            self.handle_batch_results(match.group(1))
+        else:
+            self.handle_batch_retrieve(match.group(1))
+
+    def handle_message(self, body):
+        server = self.server
+        options = server.options
+        server.count("requests")
+
+        retry_after = server.take_request_slot()
+        if retry_after is None and random.random() < options.rate_limit_rate:
+            retry_after = options.retry_after
+        if retry_after is not None:
+            server.count("429")
+            headers = {"retry-after": str(retry_after), **server.rate_limit_headers()}
+            self.send_error_json(429, "rate_limit_error", "Mock rate limit", headers)
+            return
+
+        latency = server.latency()
+        if random.random() < options.error_rate:
+            time.sleep(latency * random.random())
+            server.count("5xx")
+            status, error_type = random.choice([(500, "api_error"), (529, "overloaded_error")])
+            self.send_error_json(status, error_type, "Mock server error")
+            return
+
+        text, stop_reason, usage = server.answer(body)
+        if body.get("stream"):
+            self.stream_message(body, text, stop_reason, usage, latency)
+        else:
+            time.sleep(latency)
+            self.send_json(200, server.message(body, text, stop_reason, usage), server.rate_limit_headers())
+        server.count("ok")
+
+    def send_event(self, event, payload):
+        data = f"event: {event}\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n"
+        self.wfile.write(data.encode("utf-8"))
+        self.wfile.flush()
+
+    def stream_message(self, body, text, stop_reason, usage, latency):
+        """Server-sent events in the Messages streaming format"""
+        self.close_connection = True
+        self.send_response(200)
+        self.send_header("content-type", "text/event-stream")
+        self.send_header("connection", "close")
+        for key, value in self.server.rate_limit_headers().items():
+            self.send_header(key, value)
+        self.end_headers()
+
+        chunks = [text[i:i + 40] for i in range(0, len(text), 40)] or [""]
+        # A fifth of the latency before the first token, the rest spread over the text
+        time.sleep(latency * 0.2)
+        delay = latency * 0.8 / len(chunks)
+        message = self.server.message(body, "", None, {**usage, "output_tokens": 1})
+        message["content"] = []
+        try:
+            self.send_event("message_start", {"type": "message_start", "message": message})
+            block = content_block(body, "")
+            if block["type"] == "tool_use":
+                block["input"] = {}
+            self.send_event("content_block_start", {"type": "content_block_start", "index": 0, "content_block": block})
+            for chunk in chunks:
+                time.sleep(delay)
+                if block["type"] == "tool_use":
+                    delta = {"type": "input_json_delta", "partial_json": chunk}
+                else:
+                    delta = {"type": "text_delta", "text": chunk}
+                self.send_event("content_block_delta", {"type": "content_block_delta", "index": 0, "delta": delta})
+            self.send_event("content_block_stop", {"type": "content_block_stop", "index": 0})
+            if block["type"] == "tool_use" and stop_reason == "end_turn":
+                stop_reason = "tool_use"
+            self.send_event("message_delta", {
+                "type": "message_delta",
+                "delta": {"stop_reason": stop_reason, "stop_sequence": stop_sequence(body, stop_reason)},
+                "usage": {"output_tokens": usage["output_tokens"]},
+            })
+            self.send_event("message_stop", {"type": "message_stop"})
+        except (BrokenPipeError, ConnectionResetError):
+            # The client cancelled the stream (e.g. early schema abort)
+            pass
+
+    def batch_object(self, batch):
+        ended = time.time() >= batch["ends_at"]
+        succeeded = sum(1 for entry in batch["results"] if entry["result"]["type"] == "succeeded")
+        total = len(batch["results"])
+        return {
+            "id": batch["id"],
+            "type": "message_batch",
+            "processing_status": "ended" if ended else "in_progress",
+            "request_counts": {
+                "processing": 0 if ended else total,
+                "succeeded": succeeded if ended else 0,
+                "errored": total - succeeded if ended else 0,
+                "canceled": 0,
+                "expired": 0,
+            },
+            "created_at": batch["created_at"],
+            "ended_at": iso_time(batch["ends_at"] - time.time()) if ended else None,
+            "expires_at": iso_time(24 * 3600),
+            "archived_at": None,
+            "cancel_initiated_at": None,
+            "results_url": f"{self.server.base_url}/v1/messages/batches/{batch['id']}/results" if ended else None,
+        }
+
+    def handle_batch_create(self, body):
+        server = self.server
+        results = []
+        for request in body.get("requests", []):
+            if random.random() < server.options.error_rate:
+                result = {"type": "errored", "error": {"type": "error", "error": {
+                    "type": "api_error", "message": "Mock batch error"}}}
+            else:
+                params = request["params"]
+                text, stop_reason, usage = server.answer(params)
+                result = {"type": "succeeded", "message": server.message(params, text, stop_reason, usage)}
+            results.append({"custom_id": request["custom_id"], "result": result})
+        batch = {
+            "id": f"msgbatch_mock_{next(server.ids)}",
+            "created_at": iso_time(),
+            "ends_at": time.time() + server.options.batch_delay,
+            "results": results,
+        }
+        with server.lock:
+            server.batches[batch["id"]] = batch
+        self.send_json(200, self.batch_object(batch))
+
+    def handle_batch_retrieve(self, batch_id):
+        batch = self.server.batches.get(batch_id)
+        if batch is None:
+            self.send_error_json(404, "not_found_error", f"No batch {batch_id}")
+            return
+        self.send_json(200, self.batch_object(batch))
+
+    def handle_batch_results(self, batch_id):
+        batch = self.server.batches.get(batch_id)
+        if batch is None or time.time() < batch["ends_at"]:
+            self.send_error_json(404, "not_found_error", f"No results for {batch_id}")
+            return
+        data = "".join(json.dumps(entry, ensure_ascii=False) + "\n" for entry in batch["results"]).encode("utf-8")
+        self.send_response(200)
+        self.send_header("content-type", "application/binary")
+        self.send_header("content-length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def add_server_arguments(parser):
+    """Mock behaviour options, shared with benchmark.py"""
+    parser.add_argument("--latency", type=float, default=1.0, help="平均応答時間（秒）")
+    parser.add_argument("--jitter", type=float, default=0.3, help="応答時間のばらつき（標準偏差、秒）")
+    parser.add_argument("--tail-rate", type=float, default=0.0, help="極端に遅い応答の割合（0-1）")
+    parser.add_argument("--tail-factor", type=float, default=4.0, help="遅い応答が通常の何倍かかるか")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="500/529 エラーを返す割合（0-1）")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="ランダムに 429 を返す割合（0-1）")
+    parser.add_argument("--retry-after", type=int, default=1, help="ランダムな 429 の retry-after（秒）")
+    parser.add_argument("--rpm", type=int, default=0, help="サーバー側のRPM上限（0 = 無制限）")
+    parser.add_argument("--tpm", type=int, default=0, help="レスポンスヘッダーで返すTPM上限（0 = 返さない）")
+    parser.add_argument("--batch-delay", type=float, default=5.0, help="バッチが完了するまでの秒数")
+
+
+def start_server(options, host="127.0.0.1", port=0):
+    """Start a mock server on a background thread and return it"""
+    server = MockAnthropicServer((host, port), options)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ローカル用のAnthropic APIモック")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8787)
+    add_server_arguments(parser)
+    options = parser.parse_args()
+
+    server = MockAnthropicServer((options.host, options.port), options)
+    print(f"🧪 モックサーバー起動: {server.base_url}（{len(server.canned)} 日分の応答）")
+    print(f"   ANTHROPIC_BASE_URL={server.base_url} ANTHROPIC_API_KEY=mock python generate_content.py")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("")
+        print(f"📊 {server.stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+30日間クッキング英語 - 出力トークン上限（max_tokens）の見積もり
+
+すべてのリクエストが max_tokens=4096 を要求すると、1日分（約3千トークン）や
+数セクション分の答えにも4096トークンの枠がレート制限（TPM）で予約されます。
+generate_content.py --prefill では、同じ種類のリクエスト（1日分、または同じセクションの組み合わせ）の
+これまでの出力トークン数から max_tokens を決めます: 最近の最大値に15%の余裕を足した値で、上限は4096です。
+
+上限で切れた答えは2倍の長さとして記録するので、次のリクエストからは枠が広がります
+（切れた答え自体は、いつも通り修復と足りないセクションの追加生成で補います）。
+"""
+
+import math
+import threading
+from collections import deque
+
+# Headroom over the largest recent answer of the same kind
+MARGIN = 1.15
+# Requests of a kind that are sent with the full ceiling before estimating
+MIN_SAMPLES = 3
+# Only the most recent answers count, so the estimate follows the model
+WINDOW = 50
+# max_tokens is rounded up to a multiple of this
+ROUND_TO = 64
+
+
+class OutputBudget:
+    """max_tokens per request kind from the output sizes seen so far"""
+
+    def __init__(self, ceiling, margin=MARGIN, min_samples=MIN_SAMPLES):
+        self.ceiling = ceiling
+        self.margin = margin
+        self.min_samples = min_samples
+        self.lock = threading.Lock()
+        self.samples = {}
+        self.requests = 0
+        self.reserved = 0
+        self.truncated = 0
+
+    def max_tokens(self, kind):
+        """max_tokens for the next request of `kind` (any hashable)"""
+        with self.lock:
+            samples = self.samples.get(kind)
+            if samples is None or len(samples) < self.min_samples:
+                budget = self.ceiling
+            else:
+                budget = min(self.ceiling, math.ceil(max(samples) * self.margin / ROUND_TO) * ROUND_TO)
+            self.requests += 1
+            self.reserved += budget
+        return budget
+
+    def observe(self, kind, output_tokens, truncated=False):
+        """Record an answer; truncated=True if it was cut off by a reduced max_tokens"""
+        with self.lock:
+            if truncated:
+                # It needed more than it got: make sure the next budget grows
+                self.truncated += 1
+                output_tokens *= 2
+            self.samples.setdefault(kind, deque(maxlen=WINDOW)).append(output_tokens)
+
+    def summary(self):
+        mean = self.reserved / self.requests if self.requests else 0
+        return (
+            f"📏 max_tokens: 平均 {mean:,.0f}（固定なら {self.ceiling:,}）/ "
+            f"上限で切れた応答 {self.truncated}/{self.requests}"
+        )
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+30日間クッキング英語 - APIレート制限
+
+generate_content.py から使う、1分あたりのリクエスト数（RPM）と
+トークン数（TPM）のトークンバケットです。
+
+APIレスポンスの anthropic-ratelimit-* / retry-after ヘッダーを読み、
+実際の残り枠に合わせて送信ペースを自動調整します。
+"""
+
+import threading
+import time
+from datetime import datetime
+
+DEFAULT_RPM = 50
+DEFAULT_TPM = 30000
+
+
+def parse_reset(value):
+    """Convert an RFC 3339 reset timestamp into seconds from now"""
+    try:
+        reset_at = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (AttributeError, ValueError):
+        return None
+    return max(0.0, reset_at.timestamp() - time.time())
+
+
+def parse_int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_retry_after(value):
+    """Read a retry-after header (seconds) as a float"""
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+class Bucket:
+    """A single token bucket that refills evenly over one minute"""
+
+    def __init__(self, per_minute):
+        self.capacity = float(per_minute)
+        self.level = float(per_minute)
+
+    @property
+    def rate(self):
+        return self.capacity / 60.0
+
+    def refill(self, elapsed):
+        self.level = min(self.capacity, self.level + elapsed * self.rate)
+
+    def wait_time(self, amount):
+        """Seconds until `amount` is available (0 if it already is)"""
+        amount = min(amount, self.capacity)
+        if self.level >= amount:
+            return 0.0
+        return (amount - self.level) / self.rate
+
+    def adopt(self, limit, remaining, reset_in):
+        """Align the bucket with the limit/remaining values reported by the API"""
+        if limit:
+            if limit > self.capacity:
+                # The account allows more than we assumed: use the headroom now
+                self.level += limit - self.capacity
+            self.capacity = float(limit)
+            self.level = min(self.level, self.capacity)
+        if remaining is not None and remaining < self.level:
+            self.level = float(remaining)
+            # Nothing left: reset is when the bucket is full again, so
+            # refilling from here at the steady rate has to get there by then
+            if remaining <= 0 and reset_in:
+                self.level = min(0.0, self.capacity - reset_in * self.rate)
+
+
+class RateLimiter:
+    """Paces API calls so that both RPM and TPM stay within the account limits
+
+    Workers call acquire() before each request and settle() once the real
+    token usage is known. Response headers are fed back through
+    update_from_headers() so the buckets follow the server's view.
+    """
+
+    def __init__(self, requests_per_minute=DEFAULT_RPM, tokens_per_minute=DEFAULT_TPM):
+        self.requests = Bucket(requests_per_minute)
+        self.tokens = Bucket(tokens_per_minute)
+        self.blocked_until = 0.0
+        self.updated = time.monotonic()
+        self.cond = threading.Condition()
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self.updated
+        self.updated = now
+        self.requests.refill(elapsed)
+        self.tokens.refill(elapsed)
+        return now
+
+    def acquire(self, tokens):
+        """Block until one request and `tokens` tokens can be spent"""
+        with self.cond:
+            while True:
+                now = self._refill()
+                wait = max(
+                    self.blocked_until - now,
+                    self.requests.wait_time(1),
+                    self.tokens.wait_time(tokens),
+                )
+                if wait <= 0:
+                    self.requests.level -= 1
+                    self.tokens.level -= tokens
+                    return
+                self.cond.wait(wait)
+
+    def settle(self, reserved, used):
+        """Give back the part of a reservation that the request did not use"""
+        with self.cond:
+            self._refill()
+            self.tokens.level = min(self.tokens.capacity, self.tokens.level + reserved - used)
+            self.cond.notify_all()
+
+    def pause(self, seconds):
+        """Stop all dispatch for `seconds` (e.g. after a 429)"""
+        with self.cond:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+
+    def update_from_headers(self, headers):
+        """Adapt the buckets to anthropic-ratelimit-* and retry-after headers
+
+        Returns the retry-after delay in seconds, or None if there was none.
+        """
+        if headers is None:
+            return None
+        with self.cond:
+            self._refill()
+            self.requests.adopt(
+                parse_int(headers.get("anthropic-ratelimit-requests-limit")),
+                parse_int(headers.get("anthropic-ratelimit-requests-remaining")),
+                parse_reset(headers.get("anthropic-ratelimit-requests-reset")),
+            )
+            self.tokens.adopt(
+                parse_int(headers.get("anthropic-ratelimit-tokens-limit")),
+                parse_int(headers.get("anthropic-ratelimit-tokens-remaining")),
+                parse_reset(headers.get("anthropic-ratelimit-tokens-reset")),
+            )
+            retry_after = parse_retry_after(headers.get("retry-after"))
+            if retry_after is not None:
+                self.blocked_until = max(self.blocked_until, time.monotonic() + retry_after)
+            self.cond.notify_all()
+        return retry_after
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+30日間クッキング英語 - レシピ一覧（マニフェスト）
+
+作成する料理の一覧は recipes.json（または同じ列のCSV）から読み込みます。
+generate_content.py と build_html.py は同じマニフェストを使います。
+
+CSVの場合は1行目を見出し（day,en,ja,emoji）にしてください。
+
+--shard i/N を付けると、N個のプロセス（またはマシン）で日を分担します。
+各シャードは (day - 1) % N == i - 1 の日だけを担当し、
+ジャーナルや全日分のまとめもシャードごとの別ファイルに書くので、
+同じ content/ に同時に書いても互いに上書きしません。
+"""
+
+import argparse
+import csv
+import json
+import os
+
+RECIPES_FILE = "recipes.json"
+FIELDS = ("day", "en", "ja", "emoji")
+
+
+def _read_rows(path):
+    if os.path.splitext(path)[1].lower() == ".csv":
+        # utf-8-sig: spreadsheets often save a BOM in front of the header
+        with open(path, "r", encoding="utf-8-sig", newline="") as f:
+            return list(csv.DictReader(f))
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def load_recipes(path=RECIPES_FILE):
+    """Recipes from a JSON or CSV manifest, sorted by day
+
+    Raises ValueError if an entry is missing a field, has a non-numeric
+    day, or repeats a day.
+    """
+    recipes = []
+    seen = set()
+    for number, row in enumerate(_read_rows(path), 1):
+        missing = [field for field in FIELDS if not str(row.get(field) or "").strip()]
+        if missing:
+            raise ValueError(f"{path}: {number}件目に {', '.join(missing)} がありません")
+        try:
+            day = int(row["day"])
+        except ValueError:
+            raise ValueError(f"{path}: {number}件目の day が数字ではありません: {row['day']}")
+        if day in seen:
+            raise ValueError(f"{path}: Day {day} が重複しています")
+        seen.add(day)
+        recipes.append({"day": day, **{field: str(row[field]).strip() for field in FIELDS[1:]}})
+    return sorted(recipes, key=lambda recipe: recipe["day"])
+
+
+def parse_days(value):
+    """Parse a --days value such as "5", "1,3,5" or "1-10" into a set of days"""
+    days = set()
+    for part in value.split(","):
+        part = part.strip()
+        try:
+            if "-" in part:
+                start, end = part.split("-", 1)
+                days.update(range(int(start), int(end) + 1))
+            elif part:
+                days.add(int(part))
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"日の指定が不正です: {part}")
+    return days
+
+
+def parse_shard(value):
+    """Parse a --shard value such as "2/4" into (2, 4); shards count from 1"""
+    try:
+        index, count = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"--shard は i/N の形で指定してください: {value}")
+    if count < 1 or not 1 <= index <= count:
+        raise argparse.ArgumentTypeError(f"--shard の i は 1 から N の範囲で指定してください: {value}")
+    return index, count
+
+
+def in_shard(day, shard):
+    """Whether `day` belongs to `shard` ((i, N) or None for everything)
+
+    Days are dealt out round-robin so every shard gets a similar mix and the
+    assignment does not depend on the order of the manifest.
+    """
+    if shard is None:
+        return True
+    index, count = shard
+    return (day - 1) % count == index - 1
+
+
+def shard_suffix(shard):
+    """Tag for per-shard state files, e.g. ".2of4" (empty when not sharded)"""
+    if shard is None:
+        return ""
+    return ".{}of{}".format(*shard)
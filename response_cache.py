@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+30日間クッキング英語 - APIレスポンスキャッシュ
+
+generate_content.py のリクエスト内容（モデル、max_tokens、プロンプト）の
+ハッシュをキーにして、APIの応答テキストを .cache/responses/ に保存します。
+
+同じプロンプトで再実行したときはAPIを呼ばずにキャッシュから読み込みます。
+合計サイズが上限を超えると、最も長く使われていないものから削除します（LRU）。
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+
+CACHE_DIR = os.path.join(".cache", "responses")
+CACHE_MAX_BYTES = 100 * 1024 * 1024
+
+
+def cache_key(params):
+    """Content hash of the request parameters that determine the response"""
+    canonical = json.dumps(params, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """Size-bounded, least-recently-used cache of response texts on disk
+
+    Each entry is one file named after its key. A hit bumps the file's
+    mtime, so eviction simply removes the oldest files first.
+    """
+
+    def __init__(self, directory=CACHE_DIR, max_bytes=CACHE_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+        self.total_bytes = sum(size for _, _, size in self._entries())
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _entries(self):
+        """(mtime, path, size) of every cached response"""
+        entries = []
+        for entry in os.scandir(self.directory):
+            if not entry.name.endswith(".json"):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, entry.path, stat.st_size))
+        return entries
+
+    def get(self, key):
+        """Return the cached response text for `key`, or None"""
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                text = json.load(f)["text"]
+            os.utime(path)
+        except (FileNotFoundError, ValueError, KeyError):
+            with self.lock:
+                self.misses += 1
+            return None
+        with self.lock:
+            self.hits += 1
+        return text
+
+    def put(self, key, text, model=None):
+        """Store a response text and evict old entries if over the size limit"""
+        path = self._path(key)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"model": model, "text": text}, f, ensure_ascii=False)
+        size = os.path.getsize(tmp_path)
+        old_size = os.path.getsize(path) if os.path.exists(path) else 0
+        os.replace(tmp_path, path)
+
+        with self.lock:
+            self.total_bytes += size - old_size
+            if self.total_bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self):
+        entries = sorted(self._entries())
+        self.total_bytes = sum(size for _, _, size in entries)
+        for _, path, size in entries:
+            if self.total_bytes <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            self.total_bytes -= size
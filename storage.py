@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+30日間クッキング英語 - ファイル保存ユーティリティ
+
+- write_json_atomic: 一時ファイルに書いてから rename するので、
+  途中で止まっても壊れた（途中までの）JSONが残りません
+- RunJournal: どの日が生成中・完了・失敗かを content/.journal.jsonl に記録し、
+  再実行時に止まったところから続けられるようにします
+- ContentAggregate: 全日分のコンテンツを content/all_content.ndjson に1日1行で
+  追記し、オフセットの索引（all_content.idx）で1日分だけを読めるようにします
+"""
+
+import glob
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+import uuid
+
+JOURNAL_FILE = os.path.join("content", ".journal.jsonl")
+AGGREGATE_FILE = os.path.join("content", "all_content.ndjson")
+
+
+def write_text_atomic(path, text):
+    """Write `text` to `path` via a temp file and rename (all-or-nothing)"""
+    directory = os.path.dirname(path) or "."
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def json_text(data):
+    """`data` serialized the way the content files are formatted"""
+    return json.dumps(data, ensure_ascii=False, indent=2)
+
+
+def write_json_atomic(path, data):
+    """json.dump `data` to `path` atomically, formatted like the content files"""
+    write_text_atomic(path, json_text(data))
+
+
+def content_days(days=None, directory="content"):
+    """(day, path) of every dayN.json in `directory` (only `days` if given), in order"""
+    found = []
+    for path in glob.glob(os.path.join(directory, "day*.json")):
+        match = re.fullmatch(r"day(\d+)\.json", os.path.basename(path))
+        if match and (days is None or int(match.group(1)) in days):
+            found.append((int(match.group(1)), path))
+    return sorted(found)
+
+
+def remove_stale_temp_files(directory, names=None):
+    """Delete temp files left behind by a run that was killed mid-write
+
+    With `names`, only temp files of those target files are removed.
+    """
+    patterns = [".*.tmp"] if names is None else [f".{glob.escape(name)}.*.tmp" for name in names]
+    paths = [path for pattern in patterns for path in glob.glob(os.path.join(directory, pattern))]
+    for path in paths:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+class RunJournal:
+    """Append-only log of per-day generation status
+
+    Each line is {"day": N, "status": "started" | "done" | "failed", ...};
+    the last line for a day wins. A day left at "started" was in flight
+    when the previous run stopped and has to be generated again.
+    """
+
+    def __init__(self, path=JOURNAL_FILE):
+        self.path = path
+        self.lock = threading.Lock()
+        self.status = {}
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # A torn last line from a crash: ignore it
+                        continue
+                    self.status[entry["day"]] = entry
+        self.compact()
+
+    def compact(self):
+        """Rewrite the journal with only the latest entry per day"""
+        lines = "".join(
+            json.dumps(entry, ensure_ascii=False) + "\n"
+            for _, entry in sorted(self.status.items())
+        )
+        write_text_atomic(self.path, lines)
+
+    def get(self, day):
+        entry = self.status.get(day)
+        return entry["status"] if entry else None
+
+    def record(self, day, status, **extra):
+        entry = {"day": day, "status": status, "time": time.time(), **extra}
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        with self.lock:
+            self.status[day] = entry
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+
+
+class ContentAggregate:
+    """Append-only NDJSON file of all days plus a byte-offset index
+
+    Every finished day is appended as one compact JSON line, so nothing is
+    held in memory and nothing is rewritten. The index file (same name,
+    .idx) maps each day to the offset and length of its latest line; a
+    regenerated day is simply appended again and the index entry wins.
+
+    compact() writes the new file under a temp name, then the index for it
+    (headed by {"compaction": id}, the id being part of the temp name), and
+    only then renames the file into place. A run killed between the two
+    leaves the temp file behind, and the next load finishes the rename.
+    """
+
+    def __init__(self, path=AGGREGATE_FILE):
+        self.path = path
+        self.index_path = os.path.splitext(path)[0] + ".idx"
+        self.lock = threading.Lock()
+        self.index = {}
+        self.compaction = None
+        if os.path.exists(self.index_path):
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    if "compaction" in entry:
+                        self.compaction = entry["compaction"]
+                        continue
+                    self.index[entry["day"]] = (entry["offset"], entry["length"])
+        self._finish_compaction()
+        self._drop_torn_tail()
+
+    def _compaction_path(self, compaction):
+        directory, name = os.path.split(self.path)
+        return os.path.join(directory, f".{name}.{compaction}.tmp")
+
+    def _finish_compaction(self):
+        """Rename the compacted file into place if a killed run indexed it but did not get that far"""
+        if self.compaction is None:
+            return
+        tmp_path = self._compaction_path(self.compaction)
+        if os.path.exists(tmp_path):
+            os.replace(tmp_path, self.path)
+
+    def _drop_torn_tail(self):
+        """Cut off a line that a killed run wrote only partly (never indexed)"""
+        if not os.path.exists(self.path):
+            return
+        size = os.path.getsize(self.path)
+        valid = {day: span for day, span in self.index.items() if span[0] + span[1] <= size}
+        if len(valid) != len(self.index):
+            self.index = valid
+            self._write_index()
+        end = max((offset + length for offset, length in self.index.values()), default=0)
+        if size > end:
+            with open(self.path, "r+b") as f:
+                f.truncate(end)
+
+    def _write_index(self):
+        header = json.dumps({"compaction": self.compaction}) + "\n" if self.compaction else ""
+        write_text_atomic(self.index_path, header + "".join(
+            json.dumps({"day": day, "offset": offset, "length": length}) + "\n"
+            for day, (offset, length) in sorted(self.index.items())
+        ))
+
+    def __contains__(self, day):
+        return day in self.index
+
+    def days(self):
+        return sorted(self.index)
+
+    def append(self, day, content):
+        """Append the latest version of a day and index it"""
+        data = (json.dumps(content, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+        with self.lock:
+            with open(self.path, "ab") as f:
+                offset = f.tell()
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            # The index line goes last: a crash before it leaves a torn tail
+            with open(self.index_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps({"day": day, "offset": offset, "length": len(data)}) + "\n")
+            self.index[day] = (offset, len(data))
+
+    def read(self, day):
+        """One day's content, read with a single seek (no full-file parse)"""
+        offset, length = self.index[day]
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            return json.loads(f.read(length))
+
+    def live_bytes(self):
+        return sum(length for _, length in self.index.values())
+
+    def dead_bytes(self):
+        """Bytes taken by superseded versions of regenerated days"""
+        if not os.path.exists(self.path):
+            return 0
+        return os.path.getsize(self.path) - self.live_bytes()
+
+    def compact(self):
+        """Rewrite the file with only the latest line per day"""
+        with self.lock:
+            new_index = {}
+            compaction = uuid.uuid4().hex[:12]
+            tmp_path = self._compaction_path(compaction)
+            with open(self.path, "rb") as src, open(tmp_path, "wb") as dst:
+                for day, (offset, length) in sorted(self.index.items()):
+                    src.seek(offset)
+                    new_index[day] = (dst.tell(), length)
+                    dst.write(src.read(length))
+                dst.flush()
+                os.fsync(dst.fileno())
+            # Index first: from here on a new run completes the rename itself
+            self.index = new_index
+            self.compaction = compaction
+            self._write_index()
+            os.replace(tmp_path, self.path)
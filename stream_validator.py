@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+30日間クッキング英語 - ストリーミング出力のスキーマチェック
+
+generate_content.py --stream で使います。モデルの出力をトークンが届くたびに
+1文字ずつ読み、トップレベルのキー（recipe, quiz1, review, ...）と値の型を
+スキーマと照合します。明らかに形式が崩れた時点で SchemaError を投げるので、
+呼び出し側はリクエストを途中で打ち切れます。
+"""
+
+# Top-level keys of a day and the JSON type of each value
+DAY_SCHEMA = {
+    "recipe": "object",
+    "recipe_vocab": "array",
+    "quiz1": "object",
+    "review": "object",
+    "review_vocab": "array",
+    "quiz2": "object",
+    "australia_tips": "object",
+    "conversation": "object",
+    "conversation_vocab": "array",
+    "quiz3": "object",
+    "try_it_hint": "string",
+}
+
+# How much text (e.g. "```json" or a short preface) may precede the opening brace
+PREAMBLE_LIMIT = 200
+
+OPENING_CHARS = {"object": "{", "array": "[", "string": '"'}
+
+
+class SchemaError(ValueError):
+    """The streamed output no longer matches the day schema"""
+
+
+class DayStreamValidator:
+    """Incremental checker for the top level of a day JSON object
+
+    Only depth 1 is validated (key names, duplicates, value types and the
+    set of keys at the closing brace); nested values are just tracked for
+    brace/string balance so the scan stays a single cheap pass.
+    """
+
+    def __init__(self, schema=DAY_SCHEMA, preamble_limit=PREAMBLE_LIMIT):
+        self.schema = schema
+        self.preamble_limit = preamble_limit
+        self.preamble = 0
+        self.started = False
+        self.complete = False
+        self.depth = 0
+        self.in_string = False
+        self.escape = False
+        self.key_chars = None
+        self.key = None
+        self.seen = []
+        # What is allowed next at depth 1: "key", "colon", "value" or "comma"
+        self.expect = "key"
+
+    def feed(self, text):
+        for ch in text:
+            if self.complete:
+                return
+            self._step(ch)
+
+    def _step(self, ch):
+        if not self.started:
+            if ch == "{":
+                self.started = True
+                self.depth = 1
+                return
+            self.preamble += 1
+            if self.preamble > self.preamble_limit:
+                raise SchemaError("JSONオブジェクトが始まりません")
+            return
+
+        if self.in_string:
+            if self.escape:
+                self.escape = False
+            elif ch == "\\":
+                self.escape = True
+            elif ch == '"':
+                self.in_string = False
+                if self.key_chars is not None:
+                    self._key_done()
+                elif self.depth == 1:
+                    self.expect = "comma"
+                return
+            if self.key_chars is not None:
+                self.key_chars.append(ch)
+            return
+
+        if ch.isspace():
+            return
+
+        if self.depth > 1:
+            if ch == '"':
+                self.in_string = True
+            elif ch in "{[":
+                self.depth += 1
+            elif ch in "}]":
+                self.depth -= 1
+                if self.depth == 1:
+                    self.expect = "comma"
+            return
+
+        if self.expect == "key":
+            if ch == '"':
+                self.in_string = True
+                self.key_chars = []
+            elif ch == "}" and not self.seen:
+                self._close()
+            else:
+                raise SchemaError(f"キーの位置に不正な文字: {ch!r}")
+        elif self.expect == "colon":
+            if ch != ":":
+                raise SchemaError(f"'{self.key}' の後に ':' がありません")
+            self.expect = "value"
+        elif self.expect == "value":
+            expected = self.schema[self.key]
+            if ch != OPENING_CHARS[expected]:
+                raise SchemaError(f"'{self.key}' は {expected} のはずです")
+            if ch == '"':
+                self.in_string = True
+            else:
+                self.depth += 1
+        elif self.expect == "comma":
+            if ch == ",":
+                self.expect = "key"
+            elif ch == "}":
+                self._close()
+            else:
+                raise SchemaError(f"'{self.key}' の後に ',' がありません")
+
+    def _key_done(self):
+        key = "".join(self.key_chars)
+        self.key_chars = None
+        if key not in self.schema:
+            raise SchemaError(f"スキーマにないキー: '{key}'")
+        if key in self.seen:
+            raise SchemaError(f"キーが重複しています: '{key}'")
+        self.seen.append(key)
+        self.key = key
+        self.expect = "colon"
+
+    def _close(self):
+        self.depth = 0
+        self.complete = True
+        missing = [key for key in self.schema if key not in self.seen]
+        if missing:
+            raise SchemaError(f"キーが不足しています: {', '.join(missing)}")
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+30日間クッキング英語 - 生成のテレメトリ
+
+generate_content.py の実行ごとに、日ごとのトークン数（入力・出力・キャッシュ）、
+所要時間、リトライ数、stop_reason、推定コストを reports/run-*.jsonl に1行ずつ記録し、
+最後に合計とパーセンタイルの表を表示します。
+"""
+
+import contextlib
+import json
+import os
+import threading
+import time
+
+REPORT_DIR = "reports"
+
+# USD per million tokens (Claude Sonnet 4); batch requests are billed at half
+PRICES = {
+    "input_tokens": 3.00,
+    "output_tokens": 15.00,
+    "cache_creation_input_tokens": 3.75,
+    "cache_read_input_tokens": 0.30,
+}
+BATCH_DISCOUNT = 0.5
+
+TOKEN_FIELDS = tuple(PRICES)
+
+
+def percentile(values, p):
+    """p-th percentile (0-100) with linear interpolation"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * p / 100.0
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def new_record(recipe):
+    """Empty per-day record; filled in by create_message() and friends"""
+    return {
+        "day": recipe["day"],
+        "recipe": recipe["en"],
+        "status": "ok",
+        "requests": 0,
+        "retries": 0,
+        "hedges": 0,
+        "response_cache_hits": 0,
+        **{field: 0 for field in TOKEN_FIELDS},
+        "stop_reason": None,
+        "vocab_coverage": None,
+        "latency_s": None,
+        "cost_usd": 0.0,
+        "batch": False,
+    }
+
+
+def usage_tokens(usage):
+    """{field: count} of a message.usage object"""
+    return {field: getattr(usage, field, None) or 0 for field in TOKEN_FIELDS}
+
+
+def add_tokens(record, tokens):
+    """Add {field: count} token usage to a day record"""
+    if record is None:
+        return
+    for field in TOKEN_FIELDS:
+        record[field] += tokens.get(field, 0)
+
+
+def add_usage(record, message):
+    """Add one response's token usage and stop_reason to a day record"""
+    if record is None:
+        return
+    add_tokens(record, usage_tokens(message.usage))
+    record["stop_reason"] = message.stop_reason
+
+
+def estimate_cost(record):
+    cost = sum(record[field] * price for field, price in PRICES.items()) / 1_000_000
+    return cost * BATCH_DISCOUNT if record["batch"] else cost
+
+
+class RunReport:
+    """JSONL run report, one line per finished day"""
+
+    def __init__(self, path=None, suffix=""):
+        if path is None:
+            path = os.path.join(REPORT_DIR, time.strftime("run-%Y%m%d-%H%M%S") + f"{suffix}.jsonl")
+        else:
+            # Shards started with the same --report must not append to one file
+            root, ext = os.path.splitext(path)
+            path = root + suffix + ext
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path = path
+        self.lock = threading.Lock()
+        self.records = []
+
+    def add(self, record):
+        record["cost_usd"] = round(estimate_cost(record), 6)
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with self.lock:
+            self.records.append(record)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+
+    @contextlib.contextmanager
+    def track(self, recipe):
+        """Time one day's work and report it, failed or not"""
+        record = new_record(recipe)
+        started = time.perf_counter()
+        try:
+            yield record
+        except Exception as e:
+            record["status"] = "failed"
+            record["error"] = str(e)
+            raise
+        finally:
+            record["latency_s"] = round(time.perf_counter() - started, 3)
+            self.add(record)
+
+    def print_summary(self):
+        if not self.records:
+            return
+        rows = [
+            ("入力トークン", "input_tokens", "{:,.0f}"),
+            ("出力トークン", "output_tokens", "{:,.0f}"),
+            ("キャッシュ読込", "cache_read_input_tokens", "{:,.0f}"),
+            ("キャッシュ書込", "cache_creation_input_tokens", "{:,.0f}"),
+            ("リトライ", "retries", "{:,.0f}"),
+            ("時間(秒)", "latency_s", "{:,.1f}"),
+            ("コスト($)", "cost_usd", "{:,.3f}"),
+        ]
+        print(f"📊 実行レポート: {self.path}")
+        print(f"{'':<14}{'合計':>12}{'p50':>10}{'p95':>10}{'p99':>10}{'最大':>10}")
+        for label, field, fmt in rows:
+            values = [record[field] for record in self.records if record[field] is not None]
+            if not values:
+                continue
+            cells = [sum(values)] + [percentile(values, p) for p in (50, 95, 99)] + [max(values)]
+            total = "" if field == "latency_s" else fmt.format(cells[0])
+            print(f"{label:<14}{total:>12}" + "".join(f"{fmt.format(cell):>10}" for cell in cells[1:]))
+
+        stop_reasons = {}
+        for record in self.records:
+            stop_reasons[record["stop_reason"]] = stop_reasons.get(record["stop_reason"], 0) + 1
+        print("stop_reason: " + ", ".join(f"{reason} {count}" for reason, count in stop_reasons.items()))
+
+        slowest = sorted(
+            (r for r in self.records if r["latency_s"] is not None), key=lambda r: r["latency_s"], reverse=True
+        )[:3]
+        if slowest:
+            print("🐢 遅い日: " + ", ".join(f"Day {r['day']} {r['recipe']} {r['latency_s']:.1f}秒" for r in slowest))
+        priciest = sorted(self.records, key=lambda r: r["cost_usd"], reverse=True)[:3]
+        print("💸 高い日: " + ", ".join(f"Day {r['day']} {r['recipe']} ${r['cost_usd']:.3f}" for r in priciest))
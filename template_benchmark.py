@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+30日間クッキング英語 - HTMLテンプレート描画のベンチマーク
+
+content/ の各日から build_html.py と同じ差し込み値を作り、日数分のページを
+HTML_TEMPLATE.format(...) とコンパイル済みテンプレート（PAGE_TEMPLATE.render）で描画して、
+かかった時間を比べます。日数が content/ の日数より多いときは、同じ日をくり返し使います。
+差し込み値は先に作っておくので、測るのはテンプレートの描画だけです。
+描画結果が .format と同じことも確認します。
+
+使い方:
+  python template_benchmark.py
+  python template_benchmark.py --days 30,1000,10000 --repeat 5
+"""
+
+import argparse
+import json
+import sys
+import time
+
+from build_html import HTML_TEMPLATE, PAGE_TEMPLATE, page_fields
+from compiled_template import CompiledTemplate
+from storage import content_days
+
+
+def load_fields():
+    """Slot values of every content/dayN.json"""
+    fields = []
+    days = content_days()
+    for i, (day, path) in enumerate(days):
+        prev_day = days[i - 1][0] if i > 0 else None
+        next_day = days[i + 1][0] if i + 1 < len(days) else None
+        with open(path, "r", encoding="utf-8") as f:
+            fields.append(page_fields(day, json.load(f), prev_day, next_day))
+    return fields
+
+
+def best_time(render, fields, days, repeat):
+    """Fastest of `repeat` runs rendering `days` pages, in seconds"""
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for i in range(days):
+            render(**fields[i % len(fields)])
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="HTMLテンプレート描画のベンチマーク（.format とコンパイル済みの比較）")
+    parser.add_argument("--days", default="30,1000,10000", help="描画するページ数（カンマ区切り、デフォルト: 30,1000,10000）")
+    parser.add_argument("--repeat", type=int, default=3, help="くり返して最速を取る回数（デフォルト: 3）")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    fields = load_fields()
+    if not fields:
+        print("❌ content/ に dayN.json がありません")
+        sys.exit(1)
+
+    for values in fields:
+        if PAGE_TEMPLATE.render(**values) != HTML_TEMPLATE.format(**values):
+            print(f"❌ Day {values['day']}: コンパイル済みテンプレートの結果が .format と違います")
+            sys.exit(1)
+
+    started = time.perf_counter()
+    CompiledTemplate(HTML_TEMPLATE)
+    compile_ms = (time.perf_counter() - started) * 1000
+
+    print(f"🧩 テンプレート: {len(HTML_TEMPLATE):,} 文字 / 差し込み {len(PAGE_TEMPLATE.slots)} か所"
+          f"（{len(PAGE_TEMPLATE.parts)} 区間、コンパイル {compile_ms:.2f}ms）")
+    print("=" * 64)
+    print(f"{'日数':>6} {'.format':>10} {'compiled':>10} {'倍率':>6} {'µs/ページ':>16}")
+    for days in (int(value) for value in args.days.split(",")):
+        formatted = best_time(HTML_TEMPLATE.format, fields, days, args.repeat)
+        compiled = best_time(PAGE_TEMPLATE.render, fields, days, args.repeat)
+        print(f"{days:>6} {formatted:>9.3f}s {compiled:>9.3f}s {formatted / compiled:>5.1f}x "
+              f"{formatted / days * 1e6:>7.1f} → {compiled / days * 1e6:>5.1f}")
+
+
+if __name__ == "__main__":
+    main()
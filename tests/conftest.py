@@ -0,0 +1,51 @@
+import argparse
+import os
+import sys
+
+import anthropic
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mock_server import add_server_arguments, start_server  # noqa: E402
+
+
+def mock_options(**overrides):
+    """mock_server.py options: its defaults, without latency, plus `overrides`"""
+    parser = argparse.ArgumentParser()
+    add_server_arguments(parser)
+    options = parser.parse_args([])
+    options.latency = 0.0
+    options.jitter = 0.0
+    vars(options).update(overrides)
+    return options
+
+
+@pytest.fixture
+def mock_api():
+    """Start mock servers with mock_api(**options); all are stopped after the test"""
+    servers = []
+
+    def start(**overrides):
+        server = start_server(mock_options(**overrides))
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def client_for():
+    """client_for(server): API client for a mock server, without SDK retries"""
+    def client(server):
+        return anthropic.Anthropic(api_key="mock", base_url=server.base_url, max_retries=0)
+    return client
+
+
+@pytest.fixture
+def recipe():
+    """A day the mock server has a canned answer for"""
+    return {"day": 1, "en": "Gyoza", "ja": "餃子", "emoji": "🥟"}
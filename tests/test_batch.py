@@ -0,0 +1,74 @@
+import os
+
+import pytest
+
+import generate_content
+from generate_content import load_batch_id, run_batch
+from recipes import RECIPES_FILE, load_recipes
+
+RECIPES = load_recipes(os.path.join(os.path.dirname(os.path.abspath(generate_content.__file__)), RECIPES_FILE))
+
+
+class Interrupted(Exception):
+    """Stands in for Ctrl+C while the batch is being polled"""
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """Empty project directory with a content/ folder; batches are polled quickly"""
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("content")
+    monkeypatch.setattr(generate_content, "BATCH_POLL_MIN", 0.05)
+    return tmp_path
+
+
+def interrupt(*args):
+    raise Interrupted()
+
+
+def saved_days():
+    return sorted(int(name[3:-5]) for name in os.listdir("content") if name.startswith("day"))
+
+
+def test_resume_after_interrupt(mock_api, client_for, workdir, monkeypatch):
+    server = mock_api(batch_delay=0.2)
+    client = client_for(server)
+    recipes = RECIPES[:3]
+    state_file = os.path.join("content", ".batch_id")
+
+    # Submit, then stop while waiting for the results
+    with monkeypatch.context() as patch:
+        patch.setattr(generate_content, "wait_for_batch", interrupt)
+        with pytest.raises(Interrupted):
+            list(run_batch(client, recipes, state_file=state_file))
+    batch_id = load_batch_id(state_file)
+    assert batch_id in server.batches
+    assert saved_days() == []
+
+    # Resuming polls the same batch instead of submitting a new one
+    results = list(run_batch(client, recipes, batch_id=batch_id, state_file=state_file))
+
+    assert len(server.batches) == 1
+    assert [recipe["day"] for recipe, _ in results] == [1, 2, 3]
+    assert not any(isinstance(result, Exception) for _, result in results)
+    assert saved_days() == [1, 2, 3]
+    assert not os.path.exists(state_file)
+
+
+def test_resume_sends_days_missing_from_the_batch(mock_api, client_for, workdir, monkeypatch):
+    server = mock_api(batch_delay=0.2)
+    client = client_for(server)
+    state_file = os.path.join("content", ".batch_id")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(generate_content, "wait_for_batch", interrupt)
+        with pytest.raises(Interrupted):
+            list(run_batch(client, RECIPES[:2], state_file=state_file))
+
+    # Day 3 became pending after the batch was submitted
+    results = list(run_batch(client, RECIPES[:3], batch_id=load_batch_id(state_file), state_file=state_file))
+
+    assert len(server.batches) == 2
+    assert sorted(recipe["day"] for recipe, _ in results) == [1, 2, 3]
+    assert saved_days() == [1, 2, 3]
+    assert not os.path.exists(state_file)
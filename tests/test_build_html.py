@@ -0,0 +1,10 @@
+from build_html import page_fields
+
+
+def test_navigation_follows_the_manifest():
+    # Day 30 of a 40-day course links on; the last day shows the done banner
+    assert 'href="day31.html"' in page_fields(30, {}, 29, 31)["nav_next"]
+    assert "完了" in page_fields(40, {}, 39, None)["nav_next"]
+    # Days missing from the manifest are skipped, not linked
+    assert 'href="day3.html"' in page_fields(5, {}, 3, 8)["nav_prev"]
+    assert 'href="day8.html"' in page_fields(5, {}, 3, 8)["nav_next"]
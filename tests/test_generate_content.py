@@ -0,0 +1,23 @@
+import json
+
+import generate_content
+from generate_content import DAY_SCHEMA, generate_content as generate_day
+from mock_server import load_canned_days
+
+
+def test_answer_cut_off_before_any_section_is_requested_again(recipe, monkeypatch):
+    day = load_canned_days()[f"{recipe['en']}（{recipe['ja']}）"]
+    answers = ['{"reci', json.dumps(day)]
+    refreshes = []
+
+    def request_text(client, limiter, params, cache, refresh, *args):
+        refreshes.append(refresh)
+        return answers.pop(0)
+
+    monkeypatch.setattr(generate_content, "request_text", request_text)
+
+    content = generate_day(None, recipe, None)
+
+    assert set(DAY_SCHEMA) <= set(content)
+    # The second answer is a full retry, not a cached copy of the first
+    assert refreshes == [False, True]
@@ -0,0 +1,21 @@
+import time
+
+import pytest
+
+from hedging import HedgePolicy, hedged_call
+
+
+def test_backup_is_accounted_for_when_both_fail():
+    policy = HedgePolicy(min_samples=1)
+    policy.observe(0.01)
+    losers = []
+
+    def call(cancel, backup):
+        time.sleep(0.05)
+        raise RuntimeError("backup" if backup else "primary")
+
+    with pytest.raises(RuntimeError, match="primary"):
+        hedged_call(policy, call, losers.append)
+
+    # The backup's limiter reservation is settled through on_loser
+    assert [str(future.exception()) for future in losers] == ["backup"]
@@ -0,0 +1,31 @@
+import generate_content
+from generate_content import MAX_TOKENS, build_params, request_text
+from output_budget import OutputBudget
+from rate_limiter import RateLimiter
+from response_cache import ResponseCache, cache_key
+
+
+def test_truncated_answer_is_not_cached(mock_api, client_for, recipe, tmp_path, monkeypatch):
+    client = client_for(mock_api())
+    params = build_params(recipe)
+    budget = OutputBudget(MAX_TOKENS, min_samples=1)
+    # A day answer of ~2,800 tokens will not fit in 64 * 1.15 rounded up
+    budget.observe(params["system"][0]["text"], 64)
+    monkeypatch.setattr(generate_content, "output_budget", budget)
+    cache = ResponseCache(str(tmp_path / "cache"))
+
+    request_text(client, RateLimiter(1000, 1000000), params, cache)
+
+    assert budget.truncated == 1
+    assert cache.get(cache_key(params)) is None
+
+
+def test_complete_answer_is_cached(mock_api, client_for, recipe, tmp_path, monkeypatch):
+    client = client_for(mock_api())
+    params = build_params(recipe)
+    monkeypatch.setattr(generate_content, "output_budget", OutputBudget(MAX_TOKENS))
+    cache = ResponseCache(str(tmp_path / "cache"))
+
+    text = request_text(client, RateLimiter(1000, 1000000), params, cache)
+
+    assert cache.get(cache_key(params)) == text
@@ -0,0 +1,49 @@
+import time
+
+from generate_content import build_params, create_message
+from rate_limiter import RateLimiter
+
+
+def test_adopts_limits_from_headers(mock_api, client_for, recipe):
+    server = mock_api(rpm=50, tpm=20000)
+    # Assume far more than the account allows; the headers pull it down
+    limiter = RateLimiter(1000, 1000000)
+
+    create_message(client_for(server), limiter, **build_params(recipe))
+
+    assert limiter.requests.capacity == 50
+    assert limiter.tokens.capacity == 20000
+
+
+def test_paces_to_remaining_requests(mock_api, client_for, recipe):
+    server = mock_api(rpm=120)
+    # Two requests left on the server: after this one, one remains
+    server.bucket = 2.0
+    limiter = RateLimiter(1000, 1000000)
+
+    create_message(client_for(server), limiter, **build_params(recipe))
+    assert limiter.requests.level < 1.1
+
+    # The remaining request goes at once, the next one waits for the
+    # refill (120 RPM = one request every 0.5s)
+    started = time.monotonic()
+    limiter.acquire(0)
+    assert time.monotonic() - started < 0.2
+    limiter.acquire(0)
+    assert time.monotonic() - started >= 0.4
+
+
+def test_waits_for_retry_after(mock_api, client_for, recipe):
+    server = mock_api(rpm=60)
+    # Nothing left: the server answers 429 with retry-after: 1
+    server.bucket = 0.0
+    limiter = RateLimiter(1000, 1000000)
+
+    started = time.monotonic()
+    message = create_message(client_for(server), limiter, **build_params(recipe))
+
+    assert message.stop_reason == "end_turn"
+    assert server.stats["429"] == 1
+    assert server.stats["requests"] == 2
+    # retry-after, not the 60s until the bucket is full again
+    assert 0.9 <= time.monotonic() - started < 5
@@ -0,0 +1,31 @@
+import os
+import signal
+import threading
+import time
+
+import pytest
+
+from generate_content import run_concurrent
+
+
+def test_ctrl_c_cancels_queued_days():
+    started = []
+
+    def task(day):
+        started.append(day)
+        time.sleep(0.1)
+        return day
+
+    timer = threading.Timer(0.25, os.kill, (os.getpid(), signal.SIGINT))
+    timer.start()
+    try:
+        with pytest.raises(KeyboardInterrupt):
+            for _ in run_concurrent(task, range(40), 4):
+                pass
+    finally:
+        timer.cancel()
+
+    # Only the days already in flight ran; the other ~30 were never started
+    time.sleep(0.3)
+    assert len(started) < 40
+    assert len(started) <= 16
@@ -0,0 +1,69 @@
+import os
+
+import pytest
+
+import storage
+from storage import ContentAggregate, remove_stale_temp_files
+
+
+class Killed(Exception):
+    """Stands in for the process dying at that point"""
+
+
+def killed(*args):
+    raise Killed()
+
+
+def aggregate_with_dead_lines(path):
+    aggregate = ContentAggregate(str(path))
+    for day in (1, 2, 3):
+        aggregate.append(day, {"day": day, "version": 1})
+    aggregate.append(2, {"day": 2, "version": 2})
+    return aggregate
+
+
+def test_compact_keeps_every_day(tmp_path):
+    aggregate = aggregate_with_dead_lines(tmp_path / "all.ndjson")
+    aggregate.compact()
+
+    reopened = ContentAggregate(str(tmp_path / "all.ndjson"))
+    assert reopened.dead_bytes() == 0
+    assert [reopened.read(day)["version"] for day in (1, 2, 3)] == [1, 2, 1]
+
+
+def test_compact_killed_before_the_rename(tmp_path, monkeypatch):
+    path = str(tmp_path / "all.ndjson")
+    aggregate = aggregate_with_dead_lines(path)
+    replace = os.replace
+
+    def killed_on_data_rename(src, dst):
+        if dst == path:
+            raise Killed()
+        replace(src, dst)
+
+    with monkeypatch.context() as patch:
+        patch.setattr(storage.os, "replace", killed_on_data_rename)
+        with pytest.raises(Killed):
+            aggregate.compact()
+
+    # The new index is in place, the data file is still the old one
+    reopened = ContentAggregate(path)
+    assert [reopened.read(day)["version"] for day in (1, 2, 3)] == [1, 2, 1]
+    assert reopened.dead_bytes() == 0
+    assert [name for name in os.listdir(tmp_path) if name.endswith(".tmp")] == []
+
+
+def test_compact_killed_before_the_index(tmp_path, monkeypatch):
+    path = str(tmp_path / "all.ndjson")
+    aggregate = aggregate_with_dead_lines(path)
+
+    with monkeypatch.context() as patch:
+        patch.setattr(ContentAggregate, "_write_index", killed)
+        with pytest.raises(Killed):
+            aggregate.compact()
+
+    reopened = ContentAggregate(path)
+    assert [reopened.read(day)["version"] for day in (1, 2, 3)] == [1, 2, 1]
+    # The half-done compacted file is an ordinary stale temp file
+    remove_stale_temp_files(str(tmp_path))
+    assert [name for name in os.listdir(tmp_path) if name.endswith(".tmp")] == []
@@ -0,0 +1,30 @@
+from translation_memory import TranslationMemory, complete_translations
+
+DAY = {
+    "recipe": {"intro": "Let's cook."},
+    "conversation": {"lines": [{"text": "Hello!"}, {"text": "It smells good."}]},
+}
+
+
+def test_fills_missing_lines_from_memory():
+    memory = TranslationMemory(path=None)
+    memory.add("It smells good.", "いいにおい。")
+    trans = {"intro_ja": "料理しよう。", "conv_ja": ["こんにちは！"]}
+
+    merged, filled, returned = complete_translations(DAY, trans, memory)
+
+    assert merged["conv_ja"] == ["こんにちは！", "いいにおい。"]
+    assert filled == {"conv_ja": ["こんにちは！", "いいにおい。"]}
+    assert returned is memory
+    # The saved translations themselves are left alone
+    assert trans["conv_ja"] == ["こんにちは！"]
+
+
+def test_complete_day_does_not_open_the_memory():
+    trans = {"intro_ja": "料理しよう。", "conv_ja": ["こんにちは！", "いいにおい。"]}
+
+    merged, filled, memory = complete_translations(DAY, trans)
+
+    assert merged == trans
+    assert filled == {}
+    assert memory is None
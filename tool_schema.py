@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+30日間クッキング英語 - ツール入力スキーマ（構造化出力）
+
+generate_content.py --tools で使います。1日分の教材を save_day ツールの引数として
+JSON Schema で宣言し、モデルにそのツールを必ず呼ばせます。答えは ```json の囲みや
+前置きのない、パース済みの引数として返ってくるので、文字列の切り出しやJSONの修復が要りません。
+
+各フィールドの description が、通常モードのプロンプトにある「出力形式」ブロックの代わりです。
+"""
+
+TOOL_NAME = "save_day"
+
+
+def _string(description):
+    return {"type": "string", "description": description}
+
+
+def _vocab(text):
+    return {
+        "type": "array",
+        "description": f"{text}で使った重要単語（8-12個程度）",
+        "items": {
+            "type": "object",
+            "properties": {"word": _string("英単語"), "meaning": _string("日本語の意味")},
+            "required": ["word", "meaning"],
+        },
+    }
+
+
+def _quiz(text):
+    return {
+        "type": "object",
+        "properties": {
+            "question": _string(f"{text}の内容に関する日本語の質問"),
+            "options": {"type": "array", "items": {"type": "string"}, "minItems": 3, "maxItems": 3},
+            "correct": {"type": "integer", "enum": [0, 1, 2], "description": "正解の選択肢の番号（0が最初）"},
+        },
+        "required": ["question", "options", "correct"],
+    }
+
+
+# Input schema of each top-level section, in output order (same keys as DAY_SCHEMA)
+SECTION_INPUT_SCHEMAS = {
+    "recipe": {
+        "type": "object",
+        "properties": {
+            "title": _string("How to Make （料理の英語名）"),
+            "intro": _string("料理の1-2文の説明"),
+            "ingredients": _string("英語の材料リスト（カンマ区切り）"),
+            "steps": {
+                "type": "array",
+                "items": {"type": "string"},
+                "minItems": 6,
+                "maxItems": 6,
+                "description": "6つの手順。動詞を **太字** にし、最後は **Enjoy!** で終わる",
+            },
+        },
+        "required": ["title", "intro", "ingredients", "steps"],
+    },
+    "recipe_vocab": _vocab("レシピ"),
+    "quiz1": _quiz("レシピ"),
+    "review": {
+        "type": "object",
+        "properties": {
+            "restaurant": _string("架空のオーストラリアのレストラン名（景色が良く、カジュアルで落ち着いた店）"),
+            "location": _string("ブリスベンまたはシドニーの地名（海沿いや眺めの良い場所）"),
+            "stars": {"type": "integer", "minimum": 1, "maximum": 5},
+            "content": _string("レビュー本文。過去形で5-7文。景色、落ち着いた雰囲気、居心地の良さも描写する"),
+        },
+        "required": ["restaurant", "location", "stars", "content"],
+    },
+    "review_vocab": _vocab("レビュー"),
+    "quiz2": _quiz("レビュー"),
+    "australia_tips": {
+        "type": "object",
+        "properties": {
+            "title": _string("日本語のタイトル（例：オーストラリアで餃子を作るなら）"),
+            "content": _string(
+                "日本語で3-4段落。材料の買い方、現地での楽しみ方、ワーホリ中に役立つ情報など。"
+                "時々、景色、カフェ文化、ジャスミンやミモザの花の情報も織り交ぜる"
+            ),
+        },
+        "required": ["title", "content"],
+    },
+    "conversation": {
+        "type": "object",
+        "properties": {
+            "scene": _string("日本語のシーン説明（例：シェアハウスのキッチンにて）"),
+            "lines": {
+                "type": "array",
+                "description": "料理に関連した自然な会話（10-14行程度）",
+                "items": {
+                    "type": "object",
+                    "properties": {"speaker": {"type": "string", "enum": ["A", "B"]}, "text": _string("英語のセリフ")},
+                    "required": ["speaker", "text"],
+                },
+            },
+        },
+        "required": ["scene", "lines"],
+    },
+    "conversation_vocab": _vocab("会話"),
+    "quiz3": _quiz("会話"),
+    "try_it_hint": _string("日本語で、今日の会話をマネして書ける例文のヒント（例：I'm making ... tonight.）"),
+}
+
+
+def build_tool(sections=None):
+    """save_day tool definition whose input is `sections` (default: the whole day)"""
+    sections = sections or list(SECTION_INPUT_SCHEMAS)
+    return {
+        "name": TOOL_NAME,
+        "description": "1日分の英語教材（またはその一部のセクション）を保存する。すべての英文は英検5級レベルで書く。",
+        "input_schema": {
+            "type": "object",
+            "properties": {key: SECTION_INPUT_SCHEMAS[key] for key in sections},
+            "required": list(sections),
+        },
+    }
@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+30日間クッキング英語 - 日本語訳の自動生成
+
+content/dayN.json のうち、まだ日本語訳がないフィールド（レシピの紹介・手順、レビュー本文、
+会話のセリフ）を集め、複数の日の分をまとめて1回のリクエストで訳します。リクエストは並列に送ります。
+訳は add_translations.py がマージする形で translations/dayN.json に保存されます。
+途中までしか訳がないリスト（セリフの数より conv_ja が短いなど）は、足りない項目だけを訳します。
+
+訳は文ごとに翻訳メモリ（translation_memory.py）を先に引き、メモリにない文だけを、
+同じ文は1回だけ送ります。訳した文はメモリに追加されます。複数の文からなるテキスト（レビュー本文など）の文には、
+元のテキストを文脈として付けて送ります（各文章はリクエストごとに1回だけ）。
+
+使い方:
+  python translate.py                  # 訳のない日をすべて訳す
+  python translate.py --days 31-60 -j 4
+  python add_translations.py           # content/ にマージ
+"""
+
+import anthropic
+import argparse
+import copy
+import json
+import os
+import sys
+
+from generate_content import MODEL, request_text, run_concurrent
+from json_repair import repair_json
+from recipes import parse_days
+from rate_limiter import DEFAULT_RPM, DEFAULT_TPM, RateLimiter
+from response_cache import ResponseCache
+from storage import content_days
+from translation_memory import TranslationMemory, normalize, split_sentences
+from translation_store import apply_translations, load_translation, merged_translations, save_translation, source_texts
+
+MAX_TOKENS = 4096
+
+# English characters per request: enough to cover several days, while the
+# Japanese answer stays well under MAX_TOKENS
+BATCH_CHARS = 3000
+
+# Follow-up requests for items an answer left out
+MISSING_RETRIES = 1
+
+# What each field is, so the translation can use the right style
+KINDS = {
+    "intro_ja": "レシピの紹介",
+    "steps_ja": "レシピの手順",
+    "review_ja": "レストランのレビュー",
+    "conv_ja": "会話のセリフ",
+}
+
+SYSTEM_PROMPT = '''あなたは英語教材の翻訳者です。英検5級レベルの英文を、日本人の学習者が読む自然な日本語に訳してください。
+
+# ルール
+1. 直訳ではなく、やさしく自然な日本語にする
+2. レシピの紹介・手順は「〜です。」「〜します。」の文体。手順の **太字** の記号は訳に含めない。**Enjoy!** は「できあがり！」
+3. レビューは「〜でした。」の文体
+4. 会話は友だち同士のくだけた話し言葉（例：「手伝ってくれる？」「おいしそう！」）
+5. 店名は英語のまま（例：Ocean Breeze Dumpling Cafe）、人名はカタカナ（例：Emma → エマ）
+6. 入力は1文ずつです。passage がある文は「# 文章」のその id の文章の一部なので、前後の文と自然につながるように訳す（訳すのはその1文だけ）
+7. id ごとに訳を1つ付け、{"id": "訳", ...} の形のJSONのみを出力する'''
+
+# Passages that sentences were split from, for context (only when there are any)
+PASSAGES_TEMPLATE = '''# 文章
+```json
+{passages}
+```
+
+'''
+
+USER_PROMPT_TEMPLATE = '''{passages}# 訳す文
+```json
+{items}
+```
+
+JSONのみを出力してください。'''
+
+
+def pending_fields(content, saved):
+    """{field: known} for the translation fields a day still needs
+
+    Looks at what the day has once add_translations.py has merged `saved`
+    in. `known` is None when the whole field is needed; for a list that is
+    only partly translated (e.g. conv_ja shorter than the lines) it holds
+    the translations so far, with None for each one still missing.
+    """
+    merged = merged_translations(apply_translations(copy.deepcopy(content), saved))
+    pending = {}
+    for field, source in source_texts(content).items():
+        have = merged.get(field)
+        if not isinstance(source, list):
+            if not have:
+                pending[field] = None
+        elif not isinstance(have, list) or len(have) > len(source):
+            # Nothing yet, or written for a different version of the text
+            pending[field] = None
+        else:
+            known = [text or None for text in have] + [None] * (len(source) - len(have))
+            if None in known:
+                pending[field] = known if any(known) else None
+    return pending
+
+
+def field_texts(content, fields):
+    """(field, index, English text) still to translate for `fields` ({field: known}) of a day
+
+    index is None for single texts; list items that are already known are left out.
+    """
+    sources = source_texts(content)
+    for field, known in fields.items():
+        if isinstance(sources[field], list):
+            for index, text in enumerate(sources[field]):
+                if known is None or known[index] is None:
+                    yield field, index, text
+        else:
+            yield field, None, sources[field]
+
+
+def collect_items(work, memory=None):
+    """Sentences to send: one item ({"id", "kind", "text"}) per distinct sentence not in memory
+
+    Items are numbered in day order, so a request covers whole days where
+    it can. A sentence split from a longer text also gets that text as
+    "context" (memory keys stay per sentence).
+    """
+    items = {}
+    for day, content, fields in work:
+        for field, _, text in field_texts(content, fields):
+            sentences = split_sentences(text)
+            for sentence in sentences:
+                if memory is not None and memory.get(sentence) is not None:
+                    continue
+                key = normalize(sentence)
+                if key in items:
+                    continue
+                items[key] = {"id": f"s{len(items) + 1}", "kind": KINDS[field], "text": sentence}
+                if len(sentences) > 1:
+                    items[key]["context"] = text.strip()
+    return list(items.values())
+
+
+def make_batches(items, limit=BATCH_CHARS):
+    """Split items into requests of about `limit` English characters"""
+    batches = []
+    batch = []
+    size = 0
+    for item in items:
+        if batch and size + len(item["text"]) > limit:
+            batches.append(batch)
+            batch = []
+            size = 0
+        batch.append(item)
+        size += len(item["text"])
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def build_params(batch):
+    # Each context is sent once, under "# 文章"; its sentences point to it by id
+    passages = {}
+    sent = []
+    for item in batch:
+        item = dict(item)
+        context = item.pop("context", None)
+        if context is not None:
+            item["passage"] = passages.setdefault(context, f"p{len(passages) + 1}")
+        sent.append(item)
+    prompt = USER_PROMPT_TEMPLATE.format(
+        passages=PASSAGES_TEMPLATE.format(passages=json.dumps(
+            {passage: text for text, passage in passages.items()}, ensure_ascii=False, indent=2
+        )) if passages else "",
+        items=json.dumps(sent, ensure_ascii=False, indent=2),
+    )
+    return {
+        "model": MODEL,
+        "max_tokens": MAX_TOKENS,
+        "system": [
+            {"type": "text", "text": SYSTEM_PROMPT, "cache_control": {"type": "ephemeral"}}
+        ],
+        "messages": [
+            {"role": "user", "content": prompt}
+        ],
+    }
+
+
+def translate_batch(client, limiter, batch, cache=None, refresh=False):
+    """{id: translation} for a batch; ids the answer left out are missing"""
+    label = f"{batch[0]['id']} 〜 {batch[-1]['id']}"
+    response_text = request_text(client, limiter, build_params(batch), cache, refresh, label=label)
+    answer, _ = repair_json(response_text)
+    if not isinstance(answer, dict):
+        raise json.JSONDecodeError("訳がJSONオブジェクトではありません", response_text, 0)
+    wanted = {item["id"] for item in batch}
+    return {key: value.strip() for key, value in answer.items()
+            if key in wanted and isinstance(value, str) and value.strip()}
+
+
+def translate_items(client, limiter, items, concurrency, cache=None, refresh=False):
+    """{id: translation} for as many items as could be translated"""
+    translated = {}
+    pending = items
+    for attempt in range(MISSING_RETRIES + 1):
+        if not pending:
+            break
+        if attempt > 0:
+            print(f"🔁 訳が返ってこなかった {len(pending)} 件をもう一度送ります")
+        batches = make_batches(pending)
+
+        def task(batch):
+            return translate_batch(client, limiter, batch, cache, refresh or attempt > 0)
+
+        for finished, (batch, result) in enumerate(run_concurrent(task, batches, concurrency), 1):
+            if isinstance(result, Exception):
+                print(f"❌ [{finished}/{len(batches)}] {batch[0]['id']} 〜 {batch[-1]['id']}: エラー - {result}")
+                continue
+            translated.update(result)
+            print(f"🌐 [{finished}/{len(batches)}] {batch[0]['id']} 〜 {batch[-1]['id']}: "
+                  f"{len(result)}/{len(batch)} 件")
+        pending = [item for item in pending if item["id"] not in translated]
+    return translated
+
+
+def assemble(content, fields, translations):
+    """Translation fields of a day whose every sentence has a translation
+
+    `translations` maps normalized English sentences to Japanese. Lists
+    keep the items that were already known.
+    """
+    sources = source_texts(content)
+    parts = {
+        field: list(known) if known is not None else [None] * len(sources[field])
+        for field, known in fields.items() if isinstance(sources[field], list)
+    }
+    for field, index, text in field_texts(content, fields):
+        sentences = [translations.get(normalize(sentence)) for sentence in split_sentences(text)]
+        translation = "".join(sentences) if sentences and None not in sentences else None
+        if index is None:
+            parts[field] = translation
+        else:
+            parts[field][index] = translation
+    return {
+        field: value for field, value in parts.items()
+        if value is not None and not (isinstance(value, list) and None in value)
+    }
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="30日間クッキング英語 - 日本語訳の自動生成")
+    parser.add_argument("-j", "--concurrency", type=int, default=4, help="同時に送るリクエスト数（デフォルト: 4）")
+    parser.add_argument("--days", type=parse_days, help="対象の日を指定する（例: 5 / 1,3,5 / 31-60）")
+    parser.add_argument(
+        "--force", action="store_true",
+        help="content/ の訳や translations/ の保存済みの訳、翻訳メモリがあっても、すべて訳し直す",
+    )
+    parser.add_argument("--rpm", type=int, default=DEFAULT_RPM, help=f"1分あたりの最大リクエスト数（デフォルト: {DEFAULT_RPM}）")
+    parser.add_argument("--tpm", type=int, default=DEFAULT_TPM, help=f"1分あたりの最大トークン数（デフォルト: {DEFAULT_TPM}）")
+    parser.add_argument("--no-cache", action="store_true", help="レスポンスキャッシュを使わない")
+    parser.add_argument("--refresh", action="store_true", help="キャッシュを無視してAPIを呼び、結果でキャッシュを上書きする")
+    args = parser.parse_args()
+    if args.concurrency < 1:
+        parser.error("--concurrency は1以上を指定してください")
+    return args
+
+
+def main():
+    args = parse_args()
+
+    api_key = os.environ.get("ANTHROPIC_API_KEY")
+    if not api_key:
+        print("❌ エラー: ANTHROPIC_API_KEY が設定されていません")
+        print('  export ANTHROPIC_API_KEY="sk-ant-xxxxx"')
+        sys.exit(1)
+
+    # What each day still needs once add_translations.py has merged
+    # translations/ into content/
+    work = []
+    for day, path in content_days(args.days):
+        with open(path, "r", encoding="utf-8") as f:
+            content = json.load(f)
+        if args.force:
+            fields = dict.fromkeys(source_texts(content))
+        else:
+            fields = pending_fields(content, load_translation(day))
+        if fields:
+            work.append((day, content, fields))
+
+    print("🌐 30日間クッキング英語 - 日本語訳の生成")
+    print("=" * 50)
+    if not work:
+        print("✅ 訳が必要なフィールドはありません")
+        return
+    memory = TranslationMemory()
+    items = collect_items(work, None if args.force else memory)
+    print(f"📋 {len(work)} 日分 / 送る文 {len(items)}（{sum(len(item['text']) for item in items):,} 文字）")
+
+    translated = {}
+    if items:
+        client = anthropic.Anthropic(api_key=api_key, max_retries=0)
+        limiter = RateLimiter(args.rpm, args.tpm)
+        cache = None if args.no_cache else ResponseCache()
+        translated = translate_items(client, limiter, items, args.concurrency, cache, args.refresh)
+        for item in items:
+            if item["id"] in translated:
+                memory.add(item["text"], translated[item["id"]])
+
+    saved_days = 0
+    for day, content, fields in work:
+        result = assemble(content, fields, memory.entries)
+        if result:
+            save_translation(day, {**load_translation(day), **result})
+            saved_days += 1
+        missing = [field for field in fields if field not in result]
+        if missing:
+            print(f"⚠️  Day {day}: {', '.join(missing)} は訳せませんでした（もう一度実行してください）")
+        else:
+            print(f"✅ Day {day}: {', '.join(fields)}")
+
+    print("=" * 50)
+    if not args.force:
+        print(memory.summary())
+    print(f"✅ {len(translated)}/{len(items)} 文を訳しました（{saved_days} 日分を translations/ に保存）")
+    print("")
+    print("次のステップ:")
+    print("  python add_translations.py")
+
+
+if __name__ == "__main__":
+    main()
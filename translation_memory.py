@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+30日間クッキング英語 - 翻訳メモリ
+
+"Enjoy!"、"It was delicious."、"Can I try one?" のように、同じ英文は何日にも出てきます。
+一度訳した文は translations/memory.jsonl に「正規化した英文 → 訳」として保存し、
+translate.py と add_translations.py はまずここを引きます。APIに送るのはメモリにない文だけです。
+
+正規化: **太字** の記号を外し、’ を ' に、空白をまとめて、小文字にします。
+
+memory.jsonl は translations/dayN.json と同じくリポジトリに含めます（APIで訳した文を、
+次に実行する人が訳し直さずに使えるように）。
+"""
+
+import json
+import os
+import re
+import threading
+
+from storage import write_text_atomic
+from translation_store import TRANSLATIONS_DIR, source_texts
+
+MEMORY_FILE = os.path.join(TRANSLATIONS_DIR, "memory.jsonl")
+
+# An English sentence ends at . ! or ? followed by a space (or the end)
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+# A Japanese sentence ends at 。！？ (or ! ?), with any closing bracket after it
+_JA_SENTENCE = re.compile(r"[^。！？!?]+(?:[。！？!?]+[」』）)]*|$)")
+
+
+def split_sentences(text):
+    """English sentences of a text, punctuation kept"""
+    return [sentence for sentence in _SENTENCE_END.split(text.strip()) if sentence]
+
+
+def split_japanese(text):
+    """Japanese sentences of a text, punctuation kept"""
+    return [sentence for sentence in _JA_SENTENCE.findall(text.strip()) if sentence.strip()]
+
+
+def normalize(sentence):
+    """Memory key of an English sentence"""
+    sentence = sentence.replace("**", "").replace("’", "'").replace("‘", "'")
+    return " ".join(sentence.split()).lower()
+
+
+class TranslationMemory:
+    """Sentence translations shared by every day and run
+
+    Entries are appended to `path` as {"en": key, "ja": translation} lines
+    (the last line for a key wins); the file is rewritten without the
+    superseded lines when it is loaded. path=None keeps it in memory only.
+    """
+
+    def __init__(self, path=MEMORY_FILE):
+        self.path = path
+        self.lock = threading.Lock()
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        lines = 0
+        if path is not None and os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    self.entries[entry["en"]] = entry["ja"]
+                    lines += 1
+            if lines > len(self.entries):
+                write_text_atomic(path, "".join(
+                    json.dumps({"en": key, "ja": value}, ensure_ascii=False) + "\n"
+                    for key, value in self.entries.items()
+                ))
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, sentence):
+        """Translation of an English sentence, or None (counted as a hit or miss)"""
+        with self.lock:
+            translation = self.entries.get(normalize(sentence))
+            if translation is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return translation
+
+    def translate(self, text):
+        """Translation of a whole text if every sentence is in memory, else None"""
+        parts = [self.get(sentence) for sentence in split_sentences(text)]
+        if not parts or None in parts:
+            return None
+        return "".join(parts)
+
+    def add(self, sentence, translation, replace=True):
+        """Remember one sentence pair; returns False if nothing changed
+
+        replace=False keeps an existing translation of the sentence.
+        """
+        key = normalize(sentence)
+        translation = translation.strip()
+        with self.lock:
+            if not key or not translation or self.entries.get(key) == translation:
+                return False
+            if not replace and key in self.entries:
+                return False
+            self.entries[key] = translation
+            if self.path is not None:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps({"en": key, "ja": translation}, ensure_ascii=False) + "\n")
+        return True
+
+    def learn(self, text, translation):
+        """Remember the sentences of a translated text when they can be paired up
+
+        A text is only split when it has as many Japanese sentences as
+        English ones; otherwise nothing is learned. Sentences already in
+        memory keep their translation. Returns the number of new entries.
+        """
+        english = split_sentences(text)
+        japanese = split_japanese(translation)
+        if not english or len(english) != len(japanese):
+            return 0
+        return sum(self.add(en, ja, replace=False) for en, ja in zip(english, japanese))
+
+    def hit_rate(self):
+        looked_up = self.hits + self.misses
+        return 100.0 * self.hits / looked_up if looked_up else 0.0
+
+    def summary(self):
+        return (
+            f"🧠 翻訳メモリ: ヒット {self.hits} / {self.hits + self.misses} 文（{self.hit_rate():.0f}%）"
+            f"、登録 {len(self.entries)} 文"
+        )
+
+
+def learn_translations(memory, data, trans):
+    """Add the sentence pairs of a day's translations to the memory"""
+    sources = source_texts(data)
+    for field, translation in trans.items():
+        source = sources.get(field)
+        if isinstance(source, list):
+            if len(translation) > len(source):
+                # Written for a different version of the text
+                continue
+            for text, japanese in zip(source, translation):
+                memory.learn(text, japanese)
+        elif source:
+            memory.learn(source, translation)
+
+
+def missing_fields(data, trans):
+    """Translation fields of a day that `trans` lacks or leaves short"""
+    return [
+        field for field, source in source_texts(data).items()
+        if not trans.get(field) or isinstance(source, list) and len(trans[field]) < len(source)
+    ]
+
+
+def fill_from_memory(memory, data, trans):
+    """Translation fields `trans` lacks (or leaves short) that the memory covers entirely
+
+    Returns only the fields that change; a list keeps the given items and
+    gets the missing ones added up to the first the memory does not know.
+    """
+    filled = {}
+    sources = source_texts(data)
+    for field in missing_fields(data, trans):
+        source = sources[field]
+        given = trans.get(field)
+        if isinstance(source, list):
+            given = list(given or [])
+            rest = []
+            for text in source[len(given):]:
+                translation = memory.translate(text)
+                if translation is None:
+                    break
+                rest.append(translation)
+            if rest:
+                filled[field] = given + rest
+        else:
+            translation = memory.translate(source)
+            if translation is not None:
+                filled[field] = translation
+    return filled
+
+
+def complete_translations(data, trans, memory=None):
+    """A day's saved translations `trans` plus what the memory can fill in
+
+    The merge add_translations.py writes to content/ and build_html.py
+    --overlay renders. The memory is only needed when `trans` leaves a
+    field missing or short: pass None and a TranslationMemory is opened
+    then (and returned for the next day). The day's own sentence pairs are
+    learned before filling.
+
+    Returns (translations, filled fields, memory).
+    """
+    if not missing_fields(data, trans):
+        return trans, {}, memory
+    if memory is None:
+        memory = TranslationMemory()
+    learn_translations(memory, data, trans)
+    filled = fill_from_memory(memory, data, trans)
+    return {**trans, **filled}, filled, memory
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+30日間クッキング英語 - 日本語訳データ
+
+各日の訳は translations/dayN.json に、add_translations.py が content/ にマージする形で保存します:
+
+  {"intro_ja": "...", "steps_ja": ["...", ...], "review_ja": "...", "conv_ja": ["...", ...]}
+
+translate.py が書き、add_translations.py（content/ に書き戻す）と
+build_html.py --overlay（HTML生成時にメモリ上でマージする）が読みます。
+"""
+
+import json
+import os
+import re
+
+from storage import write_json_atomic
+
+TRANSLATIONS_DIR = "translations"
+
+# Translation field -> where add_translations.py puts it in the day JSON
+FIELDS = {
+    "intro_ja": "recipe.intro_ja",
+    "steps_ja": "recipe.steps_ja",
+    "review_ja": "review.content_ja",
+    "conv_ja": "conversation.lines[].translation",
+}
+
+
+def translation_path(day, directory=TRANSLATIONS_DIR):
+    return os.path.join(directory, f"day{day}.json")
+
+
+def load_translation(day, directory=TRANSLATIONS_DIR):
+    """Translation fields saved for a day ({} if there are none)"""
+    path = translation_path(day, directory)
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_translation(day, translation, directory=TRANSLATIONS_DIR):
+    """Write a day's translation fields atomically (in FIELDS order)"""
+    os.makedirs(directory, exist_ok=True)
+    ordered = {field: translation[field] for field in FIELDS if field in translation}
+    write_json_atomic(translation_path(day, directory), ordered)
+
+
+def translation_days(directory=TRANSLATIONS_DIR):
+    """Days that have a translations/dayN.json, in order"""
+    if not os.path.isdir(directory):
+        return []
+    days = []
+    for name in os.listdir(directory):
+        match = re.fullmatch(r"day(\d+)\.json", name)
+        if match:
+            days.append(int(match.group(1)))
+    return sorted(days)
+
+
+def apply_translations(data, trans):
+    """Put a day's translation fields where FIELDS says (in place); returns `data`"""
+    if "intro_ja" in trans:
+        data["recipe"]["intro_ja"] = trans["intro_ja"]
+    if "steps_ja" in trans:
+        data["recipe"]["steps_ja"] = trans["steps_ja"]
+
+    if "review_ja" in trans:
+        data["review"]["content_ja"] = trans["review_ja"]
+
+    # Conversation lines beyond the translated ones keep what they have
+    if "conv_ja" in trans:
+        lines = data.get("conversation", {}).get("lines", [])
+        for line, translation in zip(lines, trans["conv_ja"]):
+            line["translation"] = translation
+    return data
+
+
+def source_texts(content):
+    """English text behind each translation field of a day JSON
+
+    Fields the day has no text for are left out.
+    """
+    recipe = content.get("recipe") or {}
+    review = content.get("review") or {}
+    lines = (content.get("conversation") or {}).get("lines") or []
+    sources = {
+        "intro_ja": recipe.get("intro"),
+        "steps_ja": recipe.get("steps"),
+        "review_ja": review.get("content"),
+        "conv_ja": [line.get("text", "") for line in lines] or None,
+    }
+    return {field: text for field, text in sources.items() if text}
+
+
+def merged_translations(content):
+    """Translation fields a day JSON has (conversation lines without one give "")"""
+    recipe = content.get("recipe") or {}
+    review = content.get("review") or {}
+    lines = (content.get("conversation") or {}).get("lines") or []
+    merged = {
+        "intro_ja": recipe.get("intro_ja"),
+        "steps_ja": recipe.get("steps_ja"),
+        "review_ja": review.get("content_ja"),
+        "conv_ja": [line.get("translation", "") for line in lines],
+    }
+    if not any(merged["conv_ja"]):
+        merged["conv_ja"] = None
+    return {field: value for field, value in merged.items() if value is not None}
+
+
+# Section of a day JSON -> translation fields made from its English text
+SECTION_FIELDS = {
+    "recipe": ("intro_ja", "steps_ja"),
+    "review": ("review_ja",),
+    "conversation": ("conv_ja",),
+}
+
+
+def drop_translations(day, sections, directory=TRANSLATIONS_DIR):
+    """Remove the saved translations of regenerated `sections`
+
+    They describe the old English text; leaving them would put them back
+    on the next add_translations.py run. Returns the removed fields.
+    """
+    translation = load_translation(day, directory)
+    removed = [
+        field for section in sections for field in SECTION_FIELDS.get(section, ())
+        if translation.pop(field, None) is not None
+    ]
+    if removed:
+        save_translation(day, translation, directory)
+    return removed
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+30日間クッキング英語 - 日本語訳のチェック（オフライン）
+
+各日の訳（translations/dayN.json と、content/dayN.json にマージ済みの訳）を英文と突き合わせ、
+次の問題を一覧にします。ビルドの前に実行し、問題があれば終了コード1で止められます:
+
+- 件数のずれ: steps_ja と recipe.steps、conv_ja と conversation.lines の数が違う
+  （足りないと訳のないセリフが残り、多い分は add_translations.py が黙って捨てます）
+- 空の訳
+- 訳されていないように見える訳: 日本語（かな・漢字）を含まない、または英文と同じ
+
+フィールドごと訳がない日は ⚠️ で表示しますが、失敗には数えません（ページに訳の欄が出ないだけです）。
+JSONを読むだけなので、全日分でも一瞬で終わります。
+
+使い方:
+  python validate_translations.py
+  python validate_translations.py --days 1-10
+"""
+
+import argparse
+import json
+import re
+import sys
+
+from recipes import parse_days
+from storage import content_days
+from translation_memory import normalize
+from translation_store import apply_translations, load_translation, merged_translations, source_texts, translation_path
+
+# Hiragana, katakana (full and half width) and kanji
+_JAPANESE = re.compile(r"[぀-ヿ㐀-鿿ｦ-ﾟ]")
+
+# Translation field -> the English list it must line up with
+LIST_SOURCES = {
+    "steps_ja": "steps",
+    "conv_ja": "lines",
+}
+
+
+def check_text(label, english, japanese):
+    """Problems of one translated text"""
+    if not isinstance(japanese, str) or not japanese.strip():
+        return [f"{label}: 訳が空です"]
+    if not _JAPANESE.search(japanese) or normalize(japanese) == normalize(english):
+        return [f"{label}: 訳されていないようです（{japanese[:30]}）"]
+    return []
+
+
+def check_day(day, content, trans):
+    """(problems, missing fields) of a day's content and its saved translations"""
+    sources = source_texts(content)
+    problems = []
+
+    # Lengths in translations/ itself: add_translations.py hides both kinds of mismatch
+    for field, name in LIST_SOURCES.items():
+        if field in trans and field in sources and len(trans[field]) != len(sources[field]):
+            problems.append(
+                f"{translation_path(day)} の {field} が {len(trans[field])} 件"
+                f"（{name} は {len(sources[field])} 件）"
+            )
+
+    translations = merged_translations(apply_translations(content, trans))
+    missing = [field for field in sources if field not in translations]
+    for field, english in sources.items():
+        if field not in translations:
+            continue
+        japanese = translations[field]
+        if isinstance(english, list):
+            if not isinstance(japanese, list):
+                problems.append(f"{field}: リストではありません")
+                continue
+            if len(japanese) != len(english) and field not in trans:
+                problems.append(f"{field} が {len(japanese)} 件（{LIST_SOURCES[field]} は {len(english)} 件）")
+            for i, (text, translation) in enumerate(zip(english, japanese), 1):
+                problems.extend(check_text(f"{field}[{i}]", text, translation))
+        else:
+            problems.extend(check_text(field, english, japanese))
+    return problems, missing
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="30日間クッキング英語 - 日本語訳のチェック")
+    parser.add_argument("--days", type=parse_days, help="対象の日を指定する（例: 5 / 1,3,5 / 1-10）")
+    return parser.parse_args()
+
+
+def main():
+    """Check every content/dayN.json and list the days with translation problems"""
+    args = parse_args()
+    days = content_days(args.days)
+    if not days:
+        print("❌ content/ に dayN.json がありません")
+        sys.exit(1)
+
+    failed = 0
+    for day, path in days:
+        with open(path, "r", encoding="utf-8") as f:
+            content = json.load(f)
+        problems, missing = check_day(day, content, load_translation(day))
+        if problems:
+            failed += 1
+            print(f"❌ Day {day}:")
+            for problem in problems:
+                print(f"    {problem}")
+        if missing:
+            print(f"⚠️  Day {day}: 訳がありません（{', '.join(missing)}）")
+
+    print("=" * 50)
+    print(f"🔎 {len(days)} 日分をチェック: 問題あり {failed} 日")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
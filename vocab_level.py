@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+30日間クッキング英語 - 語彙レベルチェック（オフライン）
+
+レシピの手順・レビュー本文・会話文の英単語を、同梱の単語リスト（eiken5_words.txt）と
+照らし合わせ、英検5級レベルを超える単語とカバー率（%）を返します。
+APIは使わず、1日分のチェックは1ミリ秒もかかりません。
+
+次の語はレベル外として数えません:
+- その日の語彙リスト（recipe_vocab など）で教えている語
+- 材料（recipe.ingredients）、料理名、レビューの店名・場所
+- 文の途中で大文字から始まる語（人名・地名などの固有名詞）と、会話の場面（scene）に出てくる名前
+
+generate_content.py は1日生成するたびにチェックし、カバー率が足りないセクションだけを書き直させます。
+既存の content/ をまとめて調べる場合:
+  python vocab_level.py
+"""
+
+import glob
+import json
+import os
+import re
+import sys
+
+WORDLIST_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "eiken5_words.txt")
+
+# Field ("section.key") -> share of its words that must be in the list (%)
+MIN_COVERAGE = {
+    "recipe.steps": 95.0,
+    "review.content": 95.0,
+    "conversation.lines": 95.0,
+}
+
+IRREGULAR = {
+    "am": "be", "is": "be", "are": "be", "was": "be", "were": "be", "been": "be", "being": "be",
+    "did": "do", "does": "do", "done": "do", "has": "have", "had": "have",
+    "went": "go", "gone": "go", "ate": "eat", "eaten": "eat", "saw": "see", "seen": "see",
+    "made": "make", "came": "come", "took": "take", "taken": "take", "got": "get",
+    "gave": "give", "given": "give", "sat": "sit", "ran": "run", "bought": "buy",
+    "brought": "bring", "thought": "think", "told": "tell", "said": "say", "felt": "feel",
+    "left": "leave", "wrote": "write", "written": "write", "drank": "drink", "swam": "swim",
+    "sang": "sing", "met": "meet", "knew": "know", "known": "know", "began": "begin",
+    "slept": "sleep", "sold": "sell", "sent": "send", "stood": "stand", "taught": "teach",
+    "understood": "understand", "won": "win", "wore": "wear", "held": "hold", "kept": "keep",
+    "children": "child", "men": "man", "women": "woman", "teeth": "tooth", "feet": "foot",
+    "better": "good", "best": "good", "leaves": "leaf",
+}
+
+# Contractions: "can't" -> can, "won't" -> will, otherwise the suffix is dropped
+CONTRACTIONS = {"can't": "can", "won't": "will"}
+CONTRACTION_SUFFIXES = ("n't", "'s", "'m", "'re", "'ll", "'ve", "'d")
+
+_WORD = re.compile(r"[A-Za-z]+(?:'[A-Za-z]+)?")
+
+_lexicon = None
+
+
+def load_lexicon(path=WORDLIST_FILE):
+    """The bundled word list as a frozenset (loaded once per process)"""
+    global _lexicon
+    if _lexicon is None or path != WORDLIST_FILE:
+        with open(path, "r", encoding="utf-8") as f:
+            words = frozenset(
+                line.strip().lower() for line in f if line.strip() and not line.startswith("#")
+            )
+        if path != WORDLIST_FILE:
+            return words
+        _lexicon = words
+    return _lexicon
+
+
+def base_forms(word):
+    """Candidate dictionary forms of a lower-case word (plural, past, -ing, ...)"""
+    yield word
+    if word in IRREGULAR:
+        yield IRREGULAR[word]
+    for suffix, replacements in (
+        ("ies", ("y",)), ("ied", ("y",)), ("ier", ("y",)), ("iest", ("y",)), ("ily", ("y",)),
+        ("es", ("", "e")), ("s", ("",)),
+        ("ing", ("", "e")), ("ed", ("", "e")), ("er", ("", "e")), ("est", ("", "e")), ("ly", ("",)),
+    ):
+        if word.endswith(suffix) and len(word) > len(suffix) + 1:
+            stem = word[:-len(suffix)]
+            for replacement in replacements:
+                yield stem + replacement
+            if len(stem) > 2 and stem[-1] == stem[-2]:
+                # stopping -> stop, bigger -> big
+                yield stem[:-1]
+
+
+def tokens(text):
+    """(word, is_proper_noun) pairs of an English text, markdown ** removed"""
+    text = text.replace("**", "").replace("’", "'")
+    sentence_start = True
+    end = 0
+    for match in _WORD.finditer(text):
+        word = match.group()
+        if any(ch in ".!?:" for ch in text[end:match.start()]):
+            sentence_start = True
+        yield word, word[0].isupper() and not sentence_start and word != "I"
+        sentence_start = False
+        end = match.end()
+
+
+def field_texts(content, field):
+    """English strings of a checked field"""
+    section, key = field.split(".")
+    value = (content.get(section) or {}).get(key)
+    if key == "lines":
+        return [line.get("text", "") for line in value or []]
+    if isinstance(value, list):
+        return [item for item in value if isinstance(item, str)]
+    return [value] if isinstance(value, str) else []
+
+
+def allowed_words(content):
+    """Lower-case words a day may use beyond the list: its taught vocabulary,
+    ingredients, dish name, review names and the people in the scene"""
+    texts = []
+    for key in ("recipe_vocab", "review_vocab", "conversation_vocab"):
+        texts += [item.get("word", "") for item in content.get(key) or [] if isinstance(item, dict)]
+    recipe = content.get("recipe") or {}
+    review = content.get("review") or {}
+    texts += [recipe.get("ingredients", ""), recipe.get("title", ""), (content.get("meta") or {}).get("en", "")]
+    texts += [review.get("restaurant", ""), review.get("location", "")]
+    # Names in the (Japanese) scene description, e.g. "ハウスメイトのEmmaと"
+    texts.append((content.get("conversation") or {}).get("scene", ""))
+    return {word.lower() for text in texts if isinstance(text, str) for word in _WORD.findall(text)}
+
+
+class LevelChecker:
+    """Scores a day's English against the word list
+
+    Lookups are memoized, so after the first few days almost every word is
+    a single dict hit.
+    """
+
+    def __init__(self, lexicon=None):
+        self.lexicon = lexicon if lexicon is not None else load_lexicon()
+        self.memo = {}
+
+    def in_level(self, word):
+        known = self.memo.get(word)
+        if known is None:
+            stem = CONTRACTIONS.get(word)
+            if stem is None:
+                stem = word
+                for suffix in CONTRACTION_SUFFIXES:
+                    if word.endswith(suffix):
+                        stem = word[:-len(suffix)]
+                        break
+            known = len(stem) < 2 or any(form in self.lexicon for form in base_forms(stem))
+            self.memo[word] = known
+        return known
+
+    def check(self, content):
+        """{field: {"coverage": %, "words": n, "off_level": [...]}} for a day"""
+        words = {
+            field: [pair for text in field_texts(content, field) for pair in tokens(text)]
+            for field in MIN_COVERAGE
+        }
+        allowed = allowed_words(content)
+        # A name seen mid-sentence anywhere in the day is also a name at the
+        # start of a sentence ("Liam, can you help me?")
+        allowed.update(word.lower() for pairs in words.values() for word, proper in pairs if proper)
+        result = {}
+        for field, pairs in words.items():
+            missed = 0
+            off_level = []
+            for word, _ in pairs:
+                word = word.lower()
+                if word in allowed or self.in_level(word):
+                    continue
+                missed += 1
+                if word not in off_level:
+                    off_level.append(word)
+            coverage = 100.0 * (len(pairs) - missed) / len(pairs) if pairs else 100.0
+            result[field] = {"coverage": round(coverage, 1), "words": len(pairs), "off_level": off_level}
+        return result
+
+    def failing(self, result):
+        """Fields of a check() result below their minimum coverage"""
+        return [field for field, score in result.items() if score["coverage"] < MIN_COVERAGE[field]]
+
+
+def describe_off_level(result, fields):
+    return ", ".join(
+        f"{field} {result[field]['coverage']:.0f}%（{', '.join(result[field]['off_level'][:8])}）" for field in fields
+    )
+
+
+def main():
+    """Score every content/dayN.json and list the days below the minimum"""
+    days = []
+    for path in glob.glob(os.path.join("content", "day*.json")):
+        match = re.fullmatch(r"day(\d+)\.json", os.path.basename(path))
+        if match:
+            days.append((int(match.group(1)), path))
+    if not days:
+        print("❌ content/ に dayN.json がありません")
+        sys.exit(1)
+
+    checker = LevelChecker()
+    failed = 0
+    for day, path in sorted(days):
+        with open(path, "r", encoding="utf-8") as f:
+            result = checker.check(json.load(f))
+        fields = checker.failing(result)
+        if fields:
+            failed += 1
+            print(f"⚠️  Day {day}: {describe_off_level(result, fields)}")
+        else:
+            coverage = min(score["coverage"] for score in result.values())
+            print(f"✅ Day {day}: {coverage:.0f}%")
+
+    print("=" * 50)
+    print(f"📖 {len(days)} 日分をチェック: レベル外 {failed} 日")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()